@@ -0,0 +1,74 @@
+"""
+Compare the awaitable path members with the blocking ones called from a coroutine.
+
+Both variants read the same files on the running event loop, next to a heartbeat task that measures
+how long the loop is blocked. The optional latency (in milliseconds) is added to every read
+to emulate a network-backed volume.
+
+Usage: python benchmarks/bench_aio.py [number of files] [workers] [latency]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, aio
+
+
+async def _heartbeat(lags: list, interval: float = 0.001):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def _measure(name: str, count: int, read):
+    lags = []
+    heartbeat = asyncio.create_task(_heartbeat(lags))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await read()
+    elapsed = time.perf_counter() - start
+    heartbeat.cancel()
+    print(
+        f"{name:>6}: {count / elapsed:10,.0f} files/s, "
+        f"maximum loop lag {max(lags, default=elapsed) * 1000:8.2f} ms"
+    )
+
+
+def main(count: int = 2_000, workers: int = 32, latency: int = 0):
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(tmp) / f"file_{i}.bin" for i in range(count)]
+        for file in files:
+            file.write_bytes(b"x" * 4096)
+
+        def read(file: Path) -> bytes:
+            time.sleep(latency / 1000)
+            return file.read_bytes()
+
+        async def read_sync():
+            for file in files:
+                read(file)
+
+        async def read_async():
+            if latency:
+                await asyncio.gather(*(aio.run(read, file) for file in files))
+            else:
+                await asyncio.gather(*(file.aread_bytes() for file in files))
+
+        async def run():
+            await _measure("sync", count, read_sync)
+            await _measure("async", count, read_async)
+
+        with ThreadPoolExecutor(workers) as executor:
+            aio.set_executor(executor)
+            asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,56 @@
+"""
+Compare moving many files with one Path.renaming context per file against mutapath.batch_move.
+
+The files are spread over several directories, and each file is moved into a sibling directory of its own,
+so that the moves of different directories can be executed concurrently.
+
+Usage: python benchmarks/bench_batch.py [number of files] [number of directories] [number of workers] [directory]
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, batch_move
+
+
+def _create(root: Path, count: int, directories: int):
+    mapping = dict()
+    for d in range(directories):
+        (root / f"dir_{d}").mkdir()
+        (root / f"dir_{d}_moved").mkdir()
+    for i in range(count):
+        source = root / f"dir_{i % directories}" / f"file_{i}"
+        source.touch()
+        mapping[str(source)] = str(root / f"dir_{i % directories}_moved" / f"file_{i}")
+    return mapping
+
+
+def _renaming(mapping):
+    for source, target in mapping.items():
+        with Path(source).renaming() as mut:
+            mut._contained = target
+
+
+def main(
+    count: int = 20_000, directories: int = 16, workers: int = 8, directory: str = None
+):
+    cases = {
+        "renaming contexts": _renaming,
+        "batch_move (1 worker)": lambda m: batch_move(m, workers=1),
+        f"batch_move ({workers} workers)": lambda m: batch_move(m, workers=workers),
+    }
+    for name, case in cases.items():
+        with tempfile.TemporaryDirectory(dir=directory) as tmp:
+            mapping = _create(Path(tmp), count, directories)
+            start = time.perf_counter()
+            case(mapping)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>24}: {elapsed:8.3f} s, {count / elapsed:10,.0f} moves/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:4]), *sys.argv[4:5])
@@ -0,0 +1,41 @@
+"""
+Benchmark the construction throughput of mutapath.Path with and without the normalization cache.
+
+Usage: python benchmarks/bench_construction.py [number of distinct prefixes]
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, normalization
+
+
+def main(distinct: int = 2000, rounds: int = 5):
+    inputs = [
+        f"/srv/data/tenant_{i % 97}/../tenant_{i}/shard/" for i in range(distinct)
+    ]
+
+    def construct():
+        for raw in inputs:
+            Path(raw)
+
+    normalization.disable_cache()
+    uncached = min(timeit.repeat(construct, number=10, repeat=rounds))
+
+    normalization.enable_cache(maxsize=distinct)
+    construct()
+    cached = min(timeit.repeat(construct, number=10, repeat=rounds))
+    info = normalization.cache_info()
+    normalization.disable_cache()
+
+    total = distinct * 10
+    print(f"uncached: {total / uncached:12,.0f} paths/s")
+    print(f"cached:   {total / cached:12,.0f} paths/s ({uncached / cached:.2f}x)")
+    print(f"cache:    {info}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
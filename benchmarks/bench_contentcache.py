@@ -0,0 +1,47 @@
+"""
+Compare reading the contents of a set of files through many path objects
+by reading each file per path object, as the former cached properties did, against the shared content cache.
+
+The memory column is the peak of the traced allocations while all path objects and their contents are alive.
+
+Usage: python benchmarks/bench_contentcache.py [number of files] [file size in KiB] [path objects per file]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, contentcache
+
+
+def main(count: int = 100, size: int = 64, copies: int = 20):
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [Path(tmp) / f"file_{i}.bin" for i in range(count)]
+        past = time.time() - 10
+        for file in files:
+            file.write_bytes(os.urandom(size * 1024))
+            os.utime(file, (past, past))
+
+        cases = {
+            "per path object": lambda p: p.read_bytes(),
+            "content cache": lambda p: p.bytes,
+        }
+        for name, read in cases.items():
+            contentcache.clear_cache()
+            tracemalloc.start()
+            start = time.perf_counter()
+            contents = [read(file.clone(file)) for file in files for _ in range(copies)]
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del contents
+            print(f"{name:>16}: {elapsed:8.3f} s, {peak / 1024 ** 2:10.1f} MiB peak")
+        print(f"{'hit ratio':>16}: {contentcache.cache_info().hit_ratio:8.3f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
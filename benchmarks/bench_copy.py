@@ -0,0 +1,46 @@
+"""
+Compare copying a large file with mutapath.fileops.copy against shutil.copy and shutil.copy2.
+
+The file is created in the temporary directory, so the results depend on its file system:
+copy-on-write file systems (e.g., btrfs or XFS with reflinks) let copy_file_range finish without copying any data.
+
+Usage: python benchmarks/bench_copy.py [file size in MiB] [repetitions]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import fileops
+
+
+def main(size: int = 1024, repetitions: int = 3):
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.bin")
+        chunk = os.urandom(1024 * 1024)
+        with open(source, "wb") as stream:
+            for _ in range(size):
+                stream.write(chunk)
+
+        cases = {
+            "shutil.copy": shutil.copy,
+            "shutil.copy2": shutil.copy2,
+            "fileops.copy": fileops.copy,
+        }
+        for name, copy in cases.items():
+            best = float("inf")
+            for i in range(repetitions):
+                target = os.path.join(tmp, f"target_{i}.bin")
+                start = time.perf_counter()
+                copy(source, target)
+                best = min(best, time.perf_counter() - start)
+                os.remove(target)
+            print(f"{name:>14}: {best:8.3f} s, {size / best:10,.0f} MiB/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
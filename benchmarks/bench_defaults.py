@@ -0,0 +1,82 @@
+"""
+Compare the lookup of the path defaults before and after they were moved into a context variable.
+
+Before, Path.__init__ called the thread singleton PathDefaults() once per flag.
+As the singletons package is no longer a dependency, its thread-local lookup is recreated here.
+After, Path.__init__ reads both flags from a single ContextVar.get().
+The cases are measured alternately in the same run, and the minimum of all rounds is reported.
+
+Usage: python benchmarks/bench_defaults.py [number of lookups] [number of rounds]
+"""
+import os
+import sys
+import threading
+import timeit
+from dataclasses import dataclass
+
+import path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path
+from mutapath.defaults import current_defaults
+
+
+class _ThreadSingleton(type):
+    """The thread-local singleton metaclass of the singletons package that PathDefaults used before."""
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._local = threading.local()
+
+    def __call__(cls, *args, **kwargs):
+        try:
+            return cls._local.instance
+        except AttributeError:
+            cls._local.instance = super().__call__(*args, **kwargs)
+            return cls._local.instance
+
+
+@dataclass
+class _SingletonDefaults(metaclass=_ThreadSingleton):
+    posix: bool = False
+    string_repr: bool = False
+
+
+def _singleton_lookup():
+    return _SingletonDefaults().posix, _SingletonDefaults().string_repr
+
+
+def _context_lookup():
+    defaults = current_defaults()
+    return defaults.posix, defaults.string_repr
+
+
+def main(number: int = 500_000, rounds: int = 7):
+    raw = path.Path("/srv/data/shard/file.bin")
+
+    def singleton_construction():
+        posix, string_repr = _singleton_lookup()
+        return Path(raw, posix=posix, string_repr=string_repr)
+
+    cases = {
+        "singleton lookup": _singleton_lookup,
+        "contextvar lookup": _context_lookup,
+        "singleton construction": singleton_construction,
+        "contextvar construction": lambda: Path(raw),
+    }
+    best = dict.fromkeys(cases, float("inf"))
+    for _ in range(rounds):
+        for name, case in cases.items():
+            best[name] = min(best[name], timeit.timeit(case, number=number))
+
+    for name, elapsed in best.items():
+        print(f"{name:>24}: {elapsed / number * 1e9:8.1f} ns")
+    for kind in "lookup", "construction":
+        before, after = best[f"singleton {kind}"], best[f"contextvar {kind}"]
+        print(f"{kind:>12} speedup: {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
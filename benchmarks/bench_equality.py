@@ -0,0 +1,46 @@
+"""
+Measure the equality of mutapath.Path against operands of different types.
+
+Usage: python benchmarks/bench_equality.py [number of comparisons]
+"""
+import os
+import pathlib
+import sys
+import timeit
+
+import path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path
+
+
+def main(number: int = 500_000):
+    some = Path("/srv/data/tenant/shard/file.bin")
+    raw = "/srv/data/tenant/./shard/file.bin"
+    operands = {
+        "Path": Path(raw),
+        "str (equal)": "/srv/data/tenant/shard/file.bin",
+        "str (unnormalized)": raw,
+        "str (different)": "/srv/data/tenant/shard/other.bin",
+        "pathlib.PurePath": pathlib.PurePosixPath(raw),
+        "path.Path": path.Path(raw),
+    }
+    for name, other in operands.items():
+        duration = min(timeit.repeat(lambda: some == other, number=number, repeat=5))
+        print(f"{name:>18}: {duration / number * 1e9:7.0f} ns")
+
+    paths = [Path(f"/srv/data/{i % 1000}") for i in range(10_000)]
+    duration = min(
+        timeit.repeat(lambda: list(dict.fromkeys(map(str, paths))), number=10, repeat=3)
+    )
+    print(f"{'dedup 10k by str':>18}: {duration / 10 * 1e3:7.2f} ms")
+    duration = min(
+        timeit.repeat(lambda: "/srv/data/999/" in paths, number=10, repeat=3)
+    )
+    print(f"{'in 10k list':>18}: {duration / 10 * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
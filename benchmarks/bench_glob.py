@@ -0,0 +1,50 @@
+"""
+Compare the compiled glob engine of mutapath.Path against pathlib's glob with cloned results.
+
+The benchmark creates a temporary tree of empty files, 100 files per directory, half of them matching.
+
+Usage: python benchmarks/bench_glob.py [number of files]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path
+
+
+def main(count: int = 100_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(count):
+            directory = path.Path(tmp) / f"dir_{i // 1000}" / f"sub_{i // 100 % 10}"
+            if i % 100 == 0:
+                directory.makedirs_p()
+            (directory / f"file_{i}.{'py' if i % 2 else 'txt'}").touch()
+
+        cases = {
+            "pathlib **/*.py": lambda: [
+                root.clone(p) for p in root.to_pathlib.glob("**/*.py")
+            ],
+            "mutapath **/*.py": lambda: list(root.glob("**/*.py")),
+            "pathlib 2 patterns": lambda: [
+                root.clone(p)
+                for pattern in ("**/*.py", "dir_1/*/*.txt")
+                for p in root.to_pathlib.glob(pattern)
+            ],
+            "mutapath 2 patterns": lambda: list(root.glob("**/*.py", "dir_1/*/*.txt")),
+        }
+        for name, case in cases.items():
+            start = time.perf_counter()
+            found = len(case())
+            elapsed = time.perf_counter() - start
+            print(f"{name:>20}: {elapsed:8.3f} s for {found} paths")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,37 @@
+"""
+Compare hashing a FrozenPath against hash(str(path)) and hashing a regular mutapath.Path.
+
+Usage: python benchmarks/bench_hash.py [number of hashes]
+"""
+import os
+import sys
+import timeit
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import FrozenPath, Path
+
+
+def main(number: int = 1_000_000):
+    regular = Path("/srv/data/tenant/shard/file.bin")
+    frozen = FrozenPath(regular)
+    warnings.simplefilter("ignore", SyntaxWarning)
+    cases = {
+        "hash(str(path))": lambda: hash(str(regular)),
+        "hash(path)": lambda: hash(regular),
+        "hash(frozen)": lambda: hash(frozen),
+    }
+    for name, case in cases.items():
+        duration = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:>16}: {duration / number * 1e9:7.0f} ns")
+
+    members = {FrozenPath(f"/srv/data/{i}") for i in range(10_000)}
+    probe = FrozenPath("/srv/data/5000")
+    duration = min(timeit.repeat(lambda: probe in members, number=number, repeat=5))
+    print(f"{'set membership':>16}: {duration / number * 1e9:7.0f} ns")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
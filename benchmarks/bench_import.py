@@ -0,0 +1,53 @@
+"""
+Measure the import time of mutapath with ``python -X importtime``.
+
+Usage: python benchmarks/bench_import.py [rounds] [maximum cumulative milliseconds]
+
+If a maximum is given, the script exits with a non-zero status once the median import time exceeds it,
+so that it can be used as regression check.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PYTHONPATH = os.pathsep.join(filter(None, (ROOT, os.environ.get("PYTHONPATH"))))
+
+
+def measure() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mutapath"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": PYTHONPATH},
+    )
+    cumulative = dict()
+    for line in result.stderr.splitlines():
+        _, micros, package = line.split("|")
+        if micros.strip().isdigit():
+            cumulative[package.strip()] = int(micros)
+    return cumulative
+
+
+def main(rounds: int = 20, maximum_ms: float = 0):
+    samples = [measure() for _ in range(rounds)]
+    total = statistics.median(s["mutapath"] for s in samples) / 1000
+    print(f"import mutapath: {total:.1f} ms (median of {rounds})")
+    for heavy in (
+        "filelock",
+        "subprocess",
+        "shutil",
+        "asyncio",
+        "concurrent.futures",
+        "mashumaro",
+    ):
+        loaded = sum(heavy in s for s in samples) == rounds
+        print(f"  {heavy:>10}: {'imported' if loaded else 'deferred'}")
+    if maximum_ms and total > maximum_ms:
+        sys.exit(f"import time regression: {total:.1f} ms > {maximum_ms} ms")
+
+
+if __name__ == "__main__":
+    main(*(float(a) if i else int(a) for i, a in enumerate(sys.argv[1:])))
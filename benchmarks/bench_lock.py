@@ -0,0 +1,77 @@
+"""
+Compare the soft and the kernel backend of Path.lock.
+
+First, the latency of an uncontended acquisition and release is measured.
+Then several processes compete for the lock, each incrementing a counter file under it,
+which shows the throughput under contention and checks that no increment is lost.
+
+Usage: python benchmarks/bench_lock.py [number of iterations] [number of processes] [directory]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, locking
+
+
+def _increment(backend: str, counter: str, iterations: int):
+    locking.set_backend(backend)
+    path = Path(counter)
+    lock = path.lock
+    for _ in range(iterations):
+        with lock:
+            path.write_text(str(int(path.read_text()) + 1))
+
+
+def _latency(backend: str, root: Path, iterations: int) -> float:
+    locking.set_backend(backend)
+    path = root / f"latency_{backend}"
+    path.touch()
+    lock = path.lock
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with lock:
+            pass
+    return time.perf_counter() - start
+
+
+def _contention(backend: str, root: Path, iterations: int, processes: int):
+    counter = root / f"counter_{backend}"
+    counter.write_text("0")
+    workers = [
+        multiprocessing.Process(
+            target=_increment, args=(backend, str(counter), iterations)
+        )
+        for _ in range(processes)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, int(counter.read_text())
+
+
+def main(iterations: int = 2_000, processes: int = 4, directory: str = None):
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        root = Path(tmp)
+        for backend in locking.BACKENDS:
+            elapsed = _latency(backend, root, iterations)
+            print(
+                f"{backend:>6} latency:    {elapsed / iterations * 1e6:10.1f} µs per acquire/release"
+            )
+        for backend in locking.BACKENDS:
+            elapsed, count = _contention(backend, root, iterations, processes)
+            print(
+                f"{backend:>6} contention: {elapsed:8.3f} s, {count / elapsed:10,.0f} increments/s, "
+                f"{processes * iterations - count} lost"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]), *sys.argv[3:4])
@@ -0,0 +1,79 @@
+"""
+Measure the memory footprint per mutapath.Path and mutapath.MutaPath instance with tracemalloc.
+
+Each class is measured fresh, after hashing all instances and after sorting them,
+as hashing and comparing cache a value on the instance.
+For comparison, the contained path.Path values alone and a reference class with the dict-based layout
+of the previous, unslotted paths are measured as well.
+
+Usage: python benchmarks/bench_memory.py [number of instances]
+"""
+import os
+import sys
+import tracemalloc
+import warnings
+
+import path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, MutaPath, FrozenPath
+
+
+class DictPath:
+    """Reference of the unslotted layout, keeping the same attributes in an instance dict."""
+
+    def __init__(self, contained: path.Path):
+        self._contained = path.Path(contained)
+        self._Path__always_posix_format = False
+        self._Path__string_repr = False
+
+    def __hash__(self):
+        try:
+            return self.__dict__["_hash_cache"]
+        except KeyError:
+            value = self.__dict__["_hash_cache"] = hash(self._contained)
+            return value
+
+    def __lt__(self, other):
+        return self._contained < other._contained
+
+
+def populate(instances: list, state: str):
+    if state == "hashed":
+        for instance in instances:
+            hash(instance)
+    elif state == "sorted":
+        instances.sort()
+
+
+def measure(cls, count: int, state: str) -> float:
+    raw = [path.Path(f"/srv/data/shard_{i}/file.bin") for i in range(count)]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [cls(p) for p in raw]
+    populate(instances, state)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def main(count: int = 100_000):
+    warnings.simplefilter("ignore", SyntaxWarning)
+    states = "fresh", "hashed", "sorted"
+    print(f"{'bytes per instance':>20}" + "".join(f"{state:>10}" for state in states))
+    for name, cls in (
+        ("path.Path", path.Path),
+        ("DictPath", DictPath),
+        ("Path", Path),
+        ("MutaPath", MutaPath),
+        ("FrozenPath", FrozenPath),
+    ):
+        sizes = "".join(f"{measure(cls, count, state):10.1f}" for state in states)
+        print(f"{name:>20}{sizes}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
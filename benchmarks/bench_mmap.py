@@ -0,0 +1,62 @@
+"""
+Compare the peak resident memory and the time to the first byte of reading a large file via Path.bytes
+against mapping it via Path.mmap.
+
+Each case runs in a fresh interpreter, so that the peak memory of one case does not hide the other.
+The file is created in the temporary directory and read once before, so both cases start from the page cache.
+
+Usage: python benchmarks/bench_mmap.py [file size in MiB]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+CASES = {
+    "Path.bytes": "content = file.bytes\nfirst = content[0]",
+    "Path.mmap": "with file.mmap() as content:\n    first = content[0]",
+}
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PYTHONPATH = os.pathsep.join(filter(None, (ROOT, os.environ.get("PYTHONPATH"))))
+
+TEMPLATE = """
+import resource, time
+from mutapath import Path
+file = Path({file!r})
+start = time.perf_counter()
+{case}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def main(size: int = 1024):
+    with tempfile.TemporaryDirectory() as tmp:
+        file = os.path.join(tmp, "data.bin")
+        chunk = os.urandom(1024 * 1024)
+        with open(file, "wb") as stream:
+            for _ in range(size):
+                stream.write(chunk)
+        with open(file, "rb") as stream:
+            while stream.read(1024 * 1024):
+                pass
+
+        for name, case in CASES.items():
+            code = TEMPLATE.format(file=file, case=case)
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONPATH": PYTHONPATH},
+            ).stdout
+            elapsed, peak = output.split()
+            peak = int(peak) / (1024**2 if sys.platform == "darwin" else 1024)
+            print(
+                f"{name:>10}: {float(elapsed) * 1000:10.3f} ms to first byte, {peak:10.1f} MiB peak RSS"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,50 @@
+"""
+Compare batch transformations of PathArray against transforming single mutapath.Path objects.
+
+Usage: python benchmarks/bench_patharray.py [number of paths]
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, PathArray
+
+
+def main(count: int = 100_000):
+    raw = [f"/srv/data/tenant_{i % 100}/shard_{i}/file_{i}.bin" for i in range(count)]
+    paths = [Path(p) for p in raw]
+    array = PathArray(raw)
+
+    cases = {
+        "with_suffix": (
+            lambda: [p.with_suffix(".csv") for p in paths],
+            lambda: array.with_suffix(".csv"),
+        ),
+        "with_base": (
+            lambda: [p.with_base("/mnt/backup", strip_length=2) for p in paths],
+            lambda: array.with_base("/mnt/backup", strip_length=2),
+        ),
+        "with_parent": (
+            lambda: [p.with_parent("/mnt/flat") for p in paths],
+            lambda: array.with_parent("/mnt/flat"),
+        ),
+        "relpath": (
+            lambda: [p.relpath("/srv/data") for p in paths],
+            lambda: array.relpath("/srv/data"),
+        ),
+        "stem": (lambda: [p.stem for p in paths], lambda: array.stem),
+    }
+    for name, (single, batch) in cases.items():
+        single_time = min(timeit.repeat(single, number=1, repeat=3))
+        batch_time = min(timeit.repeat(batch, number=1, repeat=3))
+        print(
+            f"{name:>12}: Path {count / single_time:12,.0f}/s, "
+            f"PathArray {count / batch_time:12,.0f}/s ({single_time / batch_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Compare subtree and prefix queries of PathTrie against a linear scan over mutapath.Path objects.
+
+Usage: python benchmarks/bench_pathtrie.py [number of paths]
+"""
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, PathTrie
+
+
+def main(count: int = 100_000):
+    raw = [f"/srv/data/tenant_{i % 100}/shard_{i}/file_{i}.bin" for i in range(count)]
+    paths = [Path(p) for p in raw]
+    index = PathTrie(raw)
+    prefix = Path("/srv/data/tenant_42")
+    query = Path("/srv/data/tenant_42/shard_42/file_42.bin/extra")
+
+    cases = {
+        "subtree": (
+            lambda: [p for p in paths if p.startswith(prefix + "/")],
+            lambda: list(index.subtree(prefix)),
+        ),
+        "longest_prefix": (
+            lambda: max(
+                (p for p in paths if query.startswith(p + "/")),
+                key=lambda p: len(str(p)),
+                default=None,
+            ),
+            lambda: index.longest_prefix(query),
+        ),
+    }
+    for name, (scan, trie) in cases.items():
+        scan_time = min(timeit.repeat(scan, number=1, repeat=3))
+        trie_time = min(timeit.repeat(trie, number=1, repeat=3))
+        print(
+            f"{name:>15}: scan {scan_time * 1000:10.3f} ms, "
+            f"PathTrie {trie_time * 1000:10.3f} ms ({scan_time / trie_time:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
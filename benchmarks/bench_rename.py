@@ -0,0 +1,65 @@
+"""
+Compare renames per second of Path.renaming with the atomic no-clobber rename
+against the checked rename, which checks the existence of the target first
+(as for any method other than os.rename), and against the bare system calls.
+Both lock the source and the target.
+
+Run it on a tmpfs (e.g., /dev/shm) to measure the system call overhead rather than the disk.
+
+Usage: python benchmarks/bench_rename.py [number of renames] [directory]
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, fileops
+
+
+def _plain_rename(source, target):
+    os.rename(source, target)
+
+
+def _renaming(method):
+    def rename(file: Path, target: str):
+        with file.renaming(method=method) as mut:
+            mut.name = target
+        return file
+
+    return rename
+
+
+def _bare(method):
+    def rename(file: Path, target: str):
+        method(file, file.with_name(target))
+        return file.with_name(target)
+
+    return rename
+
+
+def main(count: int = 10_000, directory: str = "/dev/shm"):
+    if not os.path.isdir(directory):
+        directory = None
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        cases = {
+            "renaming (checked)": _renaming(_plain_rename),
+            "renaming (noreplace)": _renaming(os.rename),
+            "os.rename": _bare(os.rename),
+            "rename_noreplace": _bare(fileops.rename_noreplace),
+        }
+        for name, rename in cases.items():
+            file = Path(tmp) / "file_0"
+            file.touch()
+            start = time.perf_counter()
+            for i in range(1, count + 1):
+                file = rename(file, f"file_{i}")
+            elapsed = time.perf_counter() - start
+            file.remove()
+            print(f"{name:>20}: {elapsed:8.3f} s, {count / elapsed:10,.0f} renames/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]), *sys.argv[2:3])
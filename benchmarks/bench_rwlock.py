@@ -0,0 +1,60 @@
+"""
+Compare concurrent readers of one file that hold its exclusive Path.lock against readers holding its shared Path.read_lock.
+
+Each process checksums the file repeatedly under the lock, using the kernel lock backend.
+Exclusive readers serialize behind one another, while shared readers only exclude writers and scale with the cores.
+
+Usage: python benchmarks/bench_rwlock.py [number of iterations] [number of processes] [size in MiB] [directory]
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, locking
+
+
+def _read(file: str, shared: bool, iterations: int):
+    locking.set_backend(locking.KERNEL)
+    path = Path(file)
+    lock = path.read_lock if shared else path.write_lock
+    for _ in range(iterations):
+        with lock:
+            path.checksum()
+
+
+def main(
+    iterations: int = 20, processes: int = 4, size: int = 16, directory: str = None
+):
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        file = Path(tmp) / "data.bin"
+        with file.open("wb") as stream:
+            for _ in range(size):
+                stream.write(bytes(range(256)) * 4096)
+
+        for name, shared in ("write_lock", False), ("read_lock", True):
+            readers = [
+                multiprocessing.Process(
+                    target=_read, args=(str(file), shared, iterations)
+                )
+                for _ in range(processes)
+            ]
+            start = time.perf_counter()
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join()
+            elapsed = time.perf_counter() - start
+            reads = processes * iterations
+            print(
+                f"{name:>10}: {elapsed:8.3f} s, {reads / elapsed:8,.1f} reads/s, "
+                f"{reads * size / elapsed:10,.1f} MiB/s"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:4]), *sys.argv[4:5])
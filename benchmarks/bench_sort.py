@@ -0,0 +1,38 @@
+"""
+Compare sorting mutapath.Path objects by their comparison operators against sorted_paths.
+
+Usage: python benchmarks/bench_sort.py [number of paths]
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, sorted_paths
+
+
+def main(count: int = 200_000):
+    raw = [
+        f"/srv/data/tenant_{i % 100}/shard_{i % 977}/file_{i}.bin" for i in range(count)
+    ]
+    random.Random(42).shuffle(raw)
+
+    paths = [Path(p) for p in raw]
+    start = time.perf_counter()
+    sorted(paths)
+    compared = time.perf_counter() - start
+
+    paths = [Path(p) for p in raw]
+    start = time.perf_counter()
+    sorted_paths(paths)
+    keyed = time.perf_counter() - start
+
+    print(f"sorted():       {compared:8.3f} s")
+    print(f"sorted_paths(): {keyed:8.3f} s ({compared / keyed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
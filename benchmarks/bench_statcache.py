@@ -0,0 +1,50 @@
+"""
+Compare repeated type checks and size lookups of the same paths with and without the stat cache.
+
+The benchmark creates a temporary directory of files and checks each of them several times,
+as build tools and watchers do when they revisit the same tree.
+
+Usage: python benchmarks/bench_statcache.py [number of files] [number of rounds]
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, statcache
+
+
+def _check(paths):
+    total = 0
+    for p in paths:
+        if p.exists() and p.isfile():
+            total += p.size
+    return total
+
+
+def main(count: int = 10_000, rounds: int = 10):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f"file_{i}.bin" for i in range(count)]
+        for p in paths[::2]:
+            p.touch()
+
+        for name, enabled in ("uncached", False), ("cached", True):
+            if enabled:
+                statcache.enable_cache(maxsize=count, ttl=60)
+            else:
+                statcache.disable_cache()
+            start = time.perf_counter()
+            for _ in range(rounds):
+                _check(paths)
+            elapsed = time.perf_counter() - start
+            checked = count * rounds
+            print(f"{name:>10}: {elapsed:8.3f} s, {checked / elapsed:12,.0f} paths/s")
+        print(f"{'hit ratio':>10}: {statcache.cache_info().hit_ratio:8.3f}")
+        statcache.disable_cache()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
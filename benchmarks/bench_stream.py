@@ -0,0 +1,59 @@
+"""
+Compare the throughput and the peak traced memory of streaming a large file through mutapath.Path
+against materializing it, for hashing, chunked reading and line counting.
+
+The file consists of text lines of 100 characters and is created in the temporary directory.
+
+Usage: python benchmarks/bench_stream.py [file size in MiB]
+
+The default size of 256 MiB keeps the materializing cases affordable.
+Pass 10240 explicitly to stream 10 GiB, as read_bytes and lines then need several times that in free memory.
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path
+
+
+def _chunks_via_read(file: Path):
+    return sum(len(chunk) for chunk in file.chunks(1024 * 1024, mode="rb"))
+
+
+def main(size: int = 256):
+    with tempfile.TemporaryDirectory() as tmp:
+        file = Path(tmp) / "data.txt"
+        line = os.urandom(50).hex()[:99] + "\n"
+        block = (line * (1024 * 1024 // len(line) + 1))[: 1024 * 1024].encode()
+        with file.open("wb") as stream:
+            for _ in range(size):
+                stream.write(block)
+
+        cases = {
+            "sha256 read_bytes": lambda: hashlib.sha256(file.read_bytes()).hexdigest(),
+            "sha256 checksum": lambda: file.checksum(),
+            "chunks f.read": lambda: _chunks_via_read(file),
+            "iter_chunks": lambda: sum(len(chunk) for chunk in file.iter_chunks()),
+            "lines": lambda: len(file.lines()),
+            "iter_lines": lambda: sum(1 for _ in file.iter_lines()),
+        }
+        for name, case in cases.items():
+            tracemalloc.start()
+            start = time.perf_counter()
+            case()
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{name:>18}: {size / elapsed:10,.0f} MiB/s, {peak / 1024 ** 2:10.1f} MiB peak"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Compare the scandir-based walk of mutapath.Path against wrapping the walk of path.Path,
+including a size lookup of every yielded file.
+
+The benchmark creates a temporary tree of empty files, 1000 files per directory.
+
+Usage: python benchmarks/bench_walk.py [number of files]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path
+
+
+def _wrapped_walkfiles(root: Path):
+    return (root.clone(p) for p in root._contained.walkfiles())
+
+
+def main(count: int = 1_000_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(count):
+            directory = path.Path(tmp) / f"dir_{i // 1000}"
+            if i % 1000 == 0:
+                directory.mkdir()
+            (directory / f"file_{i}.bin").touch()
+
+        cases = {
+            "wrapped path.Path": lambda: sum(p.size for p in _wrapped_walkfiles(root)),
+            "scandir": lambda: sum(p.size for p in root.walkfiles()),
+        }
+        for name, case in cases.items():
+            start = time.perf_counter()
+            case()
+            elapsed = time.perf_counter() - start
+            print(f"{name:>18}: {elapsed:8.3f} s, {count / elapsed:12,.0f} files/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,65 @@
+"""
+Measure the scaling of Path.walk_parallel with the number of worker threads against the sequential walk.
+
+The benchmark creates a synthetic tree in tmpfs (i.e., /dev/shm) if available:
+every directory has the given fan-out of subdirectories down to the given depth and 20 files each.
+On tmpfs, the walk is bound by the interpreter rather than by the file system, so threads do not pay off.
+The optional latency (in milliseconds) is added to every directory read to emulate a network-backed volume.
+
+Usage: python benchmarks/bench_walk_parallel.py [depth] [fan-out] [latency]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path
+
+
+def _build(directory: path.Path, depth: int, fan_out: int):
+    directory.mkdir()
+    for i in range(20):
+        (directory / f"file_{i}.bin").touch()
+    if depth:
+        for i in range(fan_out):
+            _build(directory / f"dir_{i}", depth - 1, fan_out)
+
+
+def _measure(name: str, walk):
+    start = time.perf_counter()
+    count = sum(1 for _ in walk())
+    elapsed = time.perf_counter() - start
+    print(f"{name:>22}: {elapsed:8.3f} s, {count / elapsed:12,.0f} paths/s")
+
+
+def main(depth: int = 5, fan_out: int = 6, latency: int = 0):
+    if latency:
+        scandir = os.scandir
+
+        def slow_scandir(*args):
+            time.sleep(latency / 1000)
+            return scandir(*args)
+
+        os.scandir = slow_scandir
+
+    shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(dir=shm) as tmp:
+        _build(path.Path(tmp) / "root", depth, fan_out)
+        root = Path(tmp) / "root"
+
+        _measure("walk", root.walk)
+        for workers in 1, 2, 4, 8, 16:
+            for ordered in False, True:
+                _measure(
+                    f"{workers} workers{', ordered' if ordered else ''}",
+                    lambda: root.walk_parallel(workers, ordered=ordered),
+                )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,40 @@
+"""
+Compare the call overhead of wrapped members of mutapath.Path against the raw path.Path members.
+
+Usage: python benchmarks/bench_wrappers.py [number of calls]
+"""
+import os
+import sys
+import timeit
+
+import path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path
+
+
+def main(number: int = 200_000):
+    raw = path.Path(__file__).abspath()
+    wrapped = Path(raw)
+    calls = {
+        "exists": lambda p: p.exists(),
+        "isfile": lambda p: p.isfile(),
+        "splitall": lambda p: p.splitall(),
+        "relpath": lambda p: p.relpath("/"),
+    }
+    for name, call in calls.items():
+        raw_time = min(timeit.repeat(lambda: call(raw), number=number, repeat=3))
+        wrapped_time = min(
+            timeit.repeat(lambda: call(wrapped), number=number, repeat=3)
+        )
+        print(
+            f"{name:>9}: raw {raw_time / number * 1e9:8.0f} ns, "
+            f"wrapped {wrapped_time / number * 1e9:8.0f} ns "
+            f"({wrapped_time / raw_time:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
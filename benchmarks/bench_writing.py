@@ -0,0 +1,59 @@
+"""
+Compare atomic writes of small files with Path.writing, fsyncing each file, fsyncing them in one batch,
+and not fsyncing at all, against a hand-rolled temporary file write.
+
+Unlike the hand-rolled write, Path.writing also acquires the lock file and fsyncs the directory.
+Run it on the disk of interest, as the results are dominated by its fsync latency.
+
+Usage: python benchmarks/bench_writing.py [number of files] [directory]
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mutapath import Path, fileops
+
+
+def _hand_rolled(files, content):
+    for file in files:
+        with tempfile.NamedTemporaryFile(dir=file.parent, delete=False) as stream:
+            stream.write(content)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(stream.name, file)
+
+
+def _writing(files, content, fsync=True):
+    for file in files:
+        with file.writing(fsync=fsync) as stream:
+            stream.write(content)
+
+
+def _batched(files, content):
+    with fileops.FsyncBatch() as batch:
+        _writing(files, content, fsync=batch)
+
+
+def main(count: int = 1000, directory: str = None):
+    content = os.urandom(4096)
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        files = [Path(tmp) / f"file_{i}.bin" for i in range(count)]
+        cases = {
+            "hand-rolled": _hand_rolled,
+            "writing": _writing,
+            "writing batched": _batched,
+            "writing no fsync": lambda f, c: _writing(f, c, fsync=False),
+        }
+        for name, case in cases.items():
+            start = time.perf_counter()
+            case(files, content)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>18}: {elapsed:8.3f} s, {count / elapsed:10,.0f} files/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]), *sys.argv[2:3])
@@ -1,4 +1,8 @@
 from mutapath.defaults import PathDefaults
 from mutapath.exceptions import PathException
-from mutapath.immutapath import Path
+from mutapath.immutapath import Path, sorted_paths
 from mutapath.mutapath import MutaPath
+from mutapath.frozenpath import FrozenPath
+from mutapath.patharray import PathArray
+from mutapath.pathtrie import PathTrie
+from mutapath.batch import batch_move
@@ -0,0 +1,131 @@
+"""
+Support of the awaitable members of :class:`~mutapath.Path` (e.g., :meth:`~mutapath.Path.aread_text`).
+
+The blocking calls are executed on an executor, so that they do not block the event loop.
+By default, this is the default executor of the running loop; use :func:`set_executor` to configure another one.
+The path defaults of the awaiting context are carried into the executor (see :meth:`~mutapath.PathDefaults.bind`).
+
+:Example:
+>>> from concurrent.futures import ThreadPoolExecutor
+>>> from mutapath import aio
+>>> aio.set_executor(ThreadPoolExecutor(32))
+>>> text = await Path("/home/doe/a.txt").aread_text()
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, ContextManager, Iterator, Optional, TypeVar
+
+from mutapath.defaults import PathDefaults
+
+T = TypeVar("T")
+
+_executor: Optional[Executor] = None
+
+
+def set_executor(executor: Optional[Executor]):
+    """
+    Set the executor of all awaitable path operations.
+
+    :param executor: the executor to use, or None for the default executor of the running loop
+    """
+    global _executor
+    _executor = executor
+
+
+def get_executor() -> Optional[Executor]:
+    """Get the configured executor, or None if the default executor of the running loop is used."""
+    return _executor
+
+
+async def run(func: Callable[..., T], *args, **kwargs) -> T:
+    """Execute the given blocking call on the configured executor and await its result."""
+    loop = asyncio.get_running_loop()
+    call = PathDefaults.bind(functools.partial(func, *args, **kwargs))
+    return await loop.run_in_executor(_executor, call)
+
+
+class OperationContext:
+    """
+    Asynchronous counterpart of the file operation contexts (e.g., :meth:`~mutapath.Path.renaming`).
+
+    Entering the context acquires the lock of the file and exiting it performs the operation.
+    File locks are bound to the thread that acquires them,
+    so both are executed on a dedicated worker thread of this context instead of the configured executor.
+    """
+
+    __slots__ = ("_context", "_thread")
+
+    def __init__(self, context: ContextManager[T]):
+        self._context = context
+        self._thread: Optional[ThreadPoolExecutor] = None
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._thread, PathDefaults.bind(functools.partial(func, *args))
+        )
+
+    async def __aenter__(self):
+        thread = self._thread = ThreadPoolExecutor(
+            1, thread_name_prefix="mutapath-operation"
+        )
+        entering = thread.submit(PathDefaults.bind(self._context.__enter__))
+        try:
+            return await asyncio.wrap_future(entering)
+        except asyncio.CancelledError:
+            # the worker might still enter the context, so it has to exit it afterwards
+            exiting = thread.submit(self._abandon, entering)
+            with contextlib.suppress(Exception, asyncio.CancelledError):
+                await asyncio.shield(asyncio.wrap_future(exiting))
+            thread.shutdown(wait=False)
+            raise
+        except BaseException:
+            thread.shutdown(wait=False)
+            raise
+
+    def _abandon(self, entering: Future):
+        """Exit the context on the worker thread if it was entered although the entry was cancelled."""
+        if entering.cancelled() or entering.exception() is not None:
+            return
+        cancelled = asyncio.CancelledError()
+        self._context.__exit__(type(cancelled), cancelled, None)
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        try:
+            return await self._run(
+                self._context.__exit__, exc_type, exc_value, traceback
+            )
+        finally:
+            self._thread.shutdown(wait=False)
+
+
+def _next_batch(iterator: Iterator[T], size: int):
+    batch = []
+    for item in iterator:
+        batch.append(item)
+        if len(batch) == size:
+            break
+    return batch
+
+
+async def iterate(iterator: Iterator[T], batch_size: int = 256) -> AsyncIterator[T]:
+    """
+    Iterate the given blocking iterator on the configured executor, fetching the given number of items at once.
+    The iterator is closed once the iteration ends, unless a batch is still being fetched when it is cancelled.
+    """
+    try:
+        while True:
+            batch = await run(_next_batch, iterator, batch_size)
+            for item in batch:
+                yield item
+            if len(batch) < batch_size:
+                return
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            with contextlib.suppress(ValueError):
+                close()
@@ -0,0 +1,233 @@
+"""
+Transactional moving of many paths at once.
+
+All sources and targets are validated up front, listing each involved directory only once.
+The moves are then executed with atomic no-clobber renames (see :func:`~mutapath.fileops.rename_noreplace`)
+and without lock files, but paths whose lock files are held are rejected (see :func:`~mutapath.locking.is_held`).
+Moves that share a directory are executed in order by the same worker, others concurrently.
+If any move fails, a partially copied target is removed and the completed moves are moved back.
+Errors of the rollback are chained onto the raised exception, after the error that failed the move.
+
+:Example:
+>>> batch_move({"/home/doe/a.txt": "/home/doe/archive/a.txt", "/home/doe/b.txt": "/home/doe/archive/b.txt"})
+[Path('/home/doe/archive/a.txt'), Path('/home/doe/archive/b.txt')]
+"""
+from __future__ import annotations
+
+import contextlib
+import errno
+import os
+import shutil
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+import mutapath
+from mutapath import fileops, locking, statcache
+from mutapath.exceptions import PathException
+
+PathLike = Union[str, os.PathLike]
+_Move = Tuple[str, str]
+
+_MAX_REPORTED = 10
+
+
+def _absolute(moves: List[Tuple[PathLike, PathLike]]) -> List[_Move]:
+    return [
+        (os.path.abspath(os.fspath(source)), os.path.abspath(os.fspath(target)))
+        for source, target in moves
+    ]
+
+
+def _listings(moves: List[_Move]) -> Dict[str, Optional[Set[str]]]:
+    listings: Dict[str, Optional[Set[str]]] = dict()
+    for move in moves:
+        for directory in map(os.path.dirname, move):
+            if directory not in listings:
+                try:
+                    listings[directory] = set(os.listdir(directory))
+                except OSError:
+                    listings[directory] = None
+    return listings
+
+
+def _validate(moves: List[_Move]):
+    listings = _listings(moves)
+    sources = {source for source, _ in moves}
+    targets: Set[str] = set()
+    problems = []
+
+    def nested(location: str) -> bool:
+        parent = os.path.dirname(location)
+        while parent != location:
+            if parent in sources:
+                return True
+            location, parent = parent, os.path.dirname(parent)
+        return False
+
+    for source, target in moves:
+        source_directory, source_name = os.path.split(source)
+        target_directory, target_name = os.path.split(target)
+        source_listing = listings[source_directory]
+        target_listing = listings[target_directory]
+        if source_listing is None or source_name not in source_listing:
+            problems.append(f"{source} does not exist")
+        elif source_name + ".lock" in source_listing and locking.is_held(
+            source + ".lock"
+        ):
+            problems.append(f"{source} is locked")
+        if target_listing is None:
+            problems.append(f"the directory of {target} does not exist")
+        elif target_name in target_listing:
+            problems.append(f"{target} already exists")
+        elif target_name + ".lock" in target_listing and locking.is_held(
+            target + ".lock"
+        ):
+            problems.append(f"{target} is locked")
+        if target in targets:
+            problems.append(f"{target} is the target of several moves")
+        if target in sources:
+            problems.append(f"{target} is the source of another move")
+        if nested(source) or nested(target):
+            problems.append(f"{source} or {target} is inside a moved directory")
+        targets.add(target)
+
+    if problems:
+        shown = "; ".join(problems[:_MAX_REPORTED])
+        more = len(problems) - _MAX_REPORTED
+        raise PathException(
+            f"Moving failed because {shown}" + (f" and {more} more" if more > 0 else "")
+        )
+
+
+def _groups(moves: List[_Move]) -> List[List[_Move]]:
+    """Partition the moves so that all moves that share a directory are in the same group, keeping their order."""
+    parents: Dict[str, str] = dict()
+
+    def find(directory: str) -> str:
+        root = parents.setdefault(directory, directory)
+        while root != parents[root]:
+            parents[root] = parents[parents[root]]
+            root = parents[root]
+        return root
+
+    for source, target in moves:
+        parents[find(os.path.dirname(source))] = find(os.path.dirname(target))
+
+    groups: Dict[str, List[_Move]] = dict()
+    for move in moves:
+        groups.setdefault(find(os.path.dirname(move[0])), []).append(move)
+    return list(groups.values())
+
+
+def _remove(location: str):
+    if os.path.isdir(location) and not os.path.islink(location):
+        shutil.rmtree(location)
+    else:
+        os.remove(location)
+
+
+def _move_across_devices(source: str, target: str):
+    """Copy the source to the target and remove the source afterwards, removing a partial target on failure."""
+    try:
+        try:
+            if os.path.isdir(source) and not os.path.islink(source):
+                shutil.copytree(
+                    source, target, symlinks=True, copy_function=fileops.copy
+                )
+            else:
+                fileops.copy(source, target, follow_symlinks=False)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                _remove(target)
+            raise
+        _remove(source)
+    finally:
+        statcache.invalidate(source, target, subtree=True)
+
+
+def _move(source: str, target: str):
+    try:
+        fileops.rename_noreplace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _move_across_devices(source, target)
+
+
+def _chain(error: BaseException, previous: BaseException):
+    """Append the previous error to the end of the context chain of the given error."""
+    seen = {id(previous)}
+    while id(error) not in seen and error.__context__ is not None:
+        seen.add(id(error))
+        error = error.__context__
+    if id(error) not in seen:
+        error.__context__ = previous
+
+
+def _run(group: List[_Move], done: List[_Move], stopped) -> Optional[BaseException]:
+    for source, target in group:
+        if stopped.is_set():
+            return None
+        try:
+            _move(source, target)
+        except BaseException as e:
+            stopped.set()
+            return e
+        done.append((source, target))
+    return None
+
+
+def batch_move(
+    mapping: Union[Mapping[PathLike, PathLike], Iterable[Tuple[PathLike, PathLike]]],
+    workers: int = 4,
+) -> List[mutapath.Path]:
+    """
+    Move all given sources to their targets, or none of them.
+    No target may exist, and no moved path may be inside a moved directory.
+
+    :param mapping: the sources and their targets, as mapping or as pairs
+    :param workers: the number of worker threads, or 1 to move on the calling thread
+    :return: the targets in the given order
+    :raises PathException: if the validation fails, or if a move fails, after the completed moves have been rolled back
+    """
+    import threading
+
+    given = list(mapping.items() if isinstance(mapping, Mapping) else mapping)
+    moves = _absolute(given)
+    _validate(moves)
+
+    groups = _groups(moves)
+    completed: List[List[_Move]] = [[] for _ in groups]
+    stopped = threading.Event()
+    if workers <= 1 or len(groups) <= 1:
+        errors = [_run(group, done, stopped) for group, done in zip(groups, completed)]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(
+            min(workers, len(groups)), thread_name_prefix="mutapath-move"
+        ) as executor:
+            errors = list(
+                executor.map(_run, groups, completed, [stopped] * len(groups))
+            )
+
+    error = next((e for e in errors if e is not None), None)
+    if error is not None:
+        failed = []
+        last = error
+        for done in completed:
+            for source, target in reversed(done):
+                try:
+                    _move(target, source)
+                except Exception as e:
+                    _chain(e, last)
+                    last = e
+                    failed.append(f"{target} ({e!r})")
+        message = f"Moving failed because of {error!r}"
+        if failed:
+            shown = "; ".join(failed[:_MAX_REPORTED])
+            message += f"; {len(failed)} completed moves could not be rolled back: {shown}"
+        else:
+            message += "; all completed moves have been rolled back"
+        raise PathException(message) from last
+
+    return [mutapath.Path(target) for _, target in given]
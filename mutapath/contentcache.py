@@ -0,0 +1,188 @@
+"""
+Process-wide cache of file contents behind :attr:`~mutapath.Path.text` and :attr:`~mutapath.Path.bytes`.
+
+Each cached content is validated against the inode, size and modification time of its file on every access,
+so that changed files are read again.
+Files that have been modified within the last :data:`RACY_WINDOW` seconds are not cached,
+as a change within the same timestamp granularity could not be detected.
+All cached contents share one byte budget, and the least recently used ones are evicted once it is exceeded.
+
+:Example:
+>>> from mutapath import contentcache
+>>> contentcache.set_budget(256 * 1024 * 1024)
+>>> Path("/home/doe/a.txt").text
+'content'
+"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import AnyStr, NamedTuple, Optional, Tuple, Union
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+RACY_WINDOW = 2.0
+
+PathLike = Union[str, os.PathLike]
+_Signature = Tuple[int, int, int, int]
+_Key = Tuple[str, Optional[Tuple[Optional[str], Optional[str]]]]
+
+
+class CacheInfo(NamedTuple):
+    """The counters and bounds of the content cache."""
+
+    hits: int
+    misses: int
+    budget: int
+    currsize: int
+    entries: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Get the share of reads that have been answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _signature(result: os.stat_result) -> _Signature:
+    return result.st_ino, result.st_dev, result.st_size, result.st_mtime_ns
+
+
+class _ContentCache:
+    __slots__ = ("budget", "currsize", "hits", "misses", "_entries", "_lock")
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.currsize = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[_Key, Tuple[_Signature, int, AnyStr]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: _Key, signature: _Signature):
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[2]
+            self.misses += 1
+            return None
+
+    def put(self, key: _Key, signature: _Signature, content: AnyStr):
+        cost = sys.getsizeof(content)
+        with self._lock:
+            self._drop(key)
+            if cost > self.budget:
+                return
+            self._entries[key] = (signature, cost, content)
+            self.currsize += cost
+            while self.currsize > self.budget:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self.currsize -= evicted
+
+    def _drop(self, key: _Key):
+        cached = self._entries.pop(key, None)
+        if cached is not None:
+            self.currsize -= cached[1]
+
+    def invalidate(self, name: str):
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == name]:
+                self._drop(key)
+
+    def resize(self, budget: int):
+        with self._lock:
+            self.budget = budget
+            while self.currsize > self.budget:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self.currsize -= evicted
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.budget, self.currsize, len(self._entries)
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.currsize = 0
+            self.hits = 0
+            self.misses = 0
+
+
+_cache = _ContentCache(DEFAULT_BUDGET)
+
+
+def _name(input_path: PathLike) -> str:
+    return os.path.abspath(os.fspath(input_path))
+
+
+def set_budget(budget: int = DEFAULT_BUDGET):
+    """
+    Set the number of bytes that all cached contents may occupy together.
+    Exceeding contents are evicted immediately; a budget of 0 disables the cache.
+
+    :param budget: the maximum size of all cached contents in bytes
+    """
+    _cache.resize(budget)
+
+
+def cache_info() -> CacheInfo:
+    """Get the hit and miss counters and the occupied bytes of the content cache."""
+    return _cache.info()
+
+
+def clear_cache():
+    """Clear all contents and counters of the content cache."""
+    _cache.clear()
+
+
+def invalidate(*paths: PathLike):
+    """Drop the cached contents of the given paths."""
+    for input_path in paths:
+        _cache.invalidate(_name(input_path))
+
+
+def _read(input_path: PathLike, key: _Key, mode: str, **kwargs) -> AnyStr:
+    if _cache.budget > 0:
+        content = _cache.get(key, _signature(os.stat(input_path)))
+        if content is not None:
+            return content
+
+    with open(input_path, mode, **kwargs) as file:
+        before = os.fstat(file.fileno())
+        content = file.read()
+        after = os.fstat(file.fileno())
+
+    signature = _signature(after)
+    if (
+        _signature(before) == signature
+        and time.time_ns() - after.st_mtime_ns > RACY_WINDOW * 1e9
+    ):
+        _cache.put(key, signature, content)
+    return content
+
+
+def read_bytes(input_path: PathLike) -> bytes:
+    """
+    Read the content of the given file as bytes, from the cache if the file has not been changed.
+
+    .. seealso:: :meth:`pathlib.Path.read_bytes`
+    """
+    return _read(input_path, (_name(input_path), None), "rb")
+
+
+def read_text(
+    input_path: PathLike, encoding: Optional[str] = None, errors: Optional[str] = None
+) -> str:
+    """
+    Read the content of the given file as text, from the cache if the file has not been changed.
+
+    .. seealso:: :meth:`pathlib.Path.read_text`
+    """
+    key = (_name(input_path), (encoding, errors))
+    return _read(input_path, key, "r", encoding=encoding, errors=errors)
@@ -8,11 +8,12 @@ The following types are covered:
 import functools
 import inspect
 import pathlib
-from typing import List, Iterable, Callable, Optional
+from typing import List, Iterable, Callable, Optional, Set
 
 import path
 
 import mutapath
+from mutapath import statcache
 
 __EXCLUDE_FROM_WRAPPING = [
     "__dir__",
@@ -28,6 +29,7 @@ __EXCLUDE_FROM_WRAPPING = [
     "__getattr__",
     "joinpath",
     "clone",
+    "_clone_normalized",
     "__exit__",
     "__fspath__",
     "'_Path__wrap_attribute'",
@@ -38,6 +40,9 @@ __EXCLUDE_FROM_WRAPPING = [
     "_norm",
     "open",
     "lock",
+    "read_lock",
+    "write_lock",
+    "_reading",
     "getcwd",
     "dirname",
     "owner",
@@ -49,12 +54,51 @@ __EXCLUDE_FROM_WRAPPING = [
     "_set_contained",
     "with_poxis_enabled",
     "_hash_cache",
+    "_components",
     "_serialize",
+    "sort_key",
+    "__getstate__",
+    "__setstate__",
     "_deserialize",
     "string_repr_enabled",
     "_shorten_duplicates",
     "text",
     "bytes",
+    "scan",
+    "aread_text",
+    "aread_bytes",
+    "awrite_text",
+    "awrite_bytes",
+    "aexists",
+    "astat",
+    "acopy",
+    "aiterdir",
+    "arenaming",
+    "amoving",
+    "acopying",
+    "glob",
+    "rglob",
+    "listdir",
+    "dirs",
+    "files",
+    "walk",
+    "walk_parallel",
+    "walkdirs",
+    "walkfiles",
+    "isfile",
+    "isdir",
+    "islink",
+    "is_file",
+    "is_dir",
+    "is_symlink",
+    "stat",
+    "lstat",
+    "exists",
+    "iter_chunks",
+    "iter_lines",
+    "checksum",
+    "getsize",
+    "getmtime",
     "__init_subclass__",
     "splitunc",
 ]
@@ -80,6 +124,60 @@ __MUTABLE_FUNCTIONS = {
 }
 
 
+__CHANGING_SELF = {
+    "chmod",
+    "chown",
+    "lchmod",
+    "mkdir",
+    "mkdir_p",
+    "makedirs",
+    "makedirs_p",
+    "remove",
+    "remove_p",
+    "rmdir",
+    "rmdir_p",
+    "touch",
+    "unlink",
+    "unlink_p",
+    "utime",
+    "write_bytes",
+    "write_lines",
+    "write_text",
+}
+
+__CHANGING_TREE = {
+    "removedirs",
+    "removedirs_p",
+    "rmtree",
+    "rmtree_p",
+}
+
+__CHANGING_TARGETS = {
+    "copy",
+    "copy2",
+    "copyfile",
+    "copymode",
+    "copystat",
+    "copytree",
+    "hardlink_to",
+    "link",
+    "merge_tree",
+    "move",
+    "rename",
+    "renames",
+    "replace",
+    "symlink",
+    "symlink_to",
+}
+
+
+__NORMALIZED_RESULTS = {
+    "splitall",
+    "splitpath",
+    "stripext",
+}
+
+
 def __is_mbm(member):
     if isinstance(member, property):
         return True
@@ -94,79 +192,340 @@ def __is_def(member):
     return inspect.isroutine(member)
 
 
-def __path_converter(const: Callable):
-    def convert_path(result):
-        if isinstance(result, (path.Path, pathlib.PurePath)):
-            return const(result)
-        return result
+__PATH_TYPES = (path.Path, pathlib.PurePath)
+__SEQUENCE_EXCLUSIONS = (str, bytes, bytearray)
+
+SCALAR = "scalar"
+PATH = "path"
+LIST = "list"
+ITERATOR = "iterator"
+DYNAMIC = "dynamic"
+
+__RETURN_KINDS = {
+    **dict.fromkeys(
+        [
+            "access",
+            "atime",
+            "ctime",
+            "fnmatch",
+            "get_owner",
+            "getatime",
+            "getctime",
+            "is_absolute",
+            "is_block_device",
+            "is_char_device",
+            "is_fifo",
+            "is_mount",
+            "is_reserved",
+            "is_socket",
+            "isabs",
+            "ismount",
+            "lines",
+            "match",
+            "read_bytes",
+            "read_hash",
+            "read_hexhash",
+            "read_md5",
+            "read_text",
+            "samefile",
+            "statvfs",
+            "write_bytes",
+            "write_lines",
+            "write_text",
+        ],
+        SCALAR,
+    ),
+    **dict.fromkeys(
+        [
+            "abspath",
+            "absolute",
+            "chmod",
+            "expand",
+            "expanduser",
+            "expandvars",
+            "makedirs",
+            "makedirs_p",
+            "mkdir",
+            "mkdir_p",
+            "normcase",
+            "normpath",
+            "readlink",
+            "readlinkabs",
+            "realpath",
+            "relative_to",
+            "relpath",
+            "relpathto",
+            "remove",
+            "remove_p",
+            "removedirs",
+            "removedirs_p",
+            "resolve",
+            "rmdir",
+            "rmdir_p",
+            "rmtree",
+            "rmtree_p",
+            "stripext",
+            "touch",
+            "unlink",
+            "unlink_p",
+            "with_suffix",
+        ],
+        PATH,
+    ),
+    **dict.fromkeys(["splitall"], LIST),
+    **dict.fromkeys(["iglob", "parents"], ITERATOR),
+}
+
+
+def classify(name: str) -> str:
+    """
+    Classify the kind of value that the wrapped member with the given name returns.
+    Members that are not known are classified as dynamic and inspected on every call.
+    """
+    return __RETURN_KINDS.get(name, DYNAMIC)
+
+
+def classified_names() -> Set[str]:
+    """Get the names of all wrapped members with a known kind of returned values."""
+    return set(__RETURN_KINDS)
+
+
+def __convert(self, result, normalized: bool):
+    if isinstance(result, __PATH_TYPES):
+        if normalized:
+            return self._clone_normalized(result)
+        return self.clone(result)
+    return result
+
+
+def __convert_iterator(self, result, normalized: bool):
+    for element in result:
+        yield __convert(self, element, normalized)
+
+
+def __invalidate(self, source, changed, subtree: bool):
+    statcache.invalidate(source, *changed, subtree=subtree)
+
+
+def __invalidating(orig_func, name: str):
+    """Drop the cached stat results of the paths that the given member changes on the file system."""
+    if name in __CHANGING_TARGETS:
+
+        @functools.wraps(orig_func)
+        def invalidation_decorator(self, *args, **kwargs):
+            source = getattr(self, "_contained", self)
+            result = None
+            try:
+                result = orig_func(self, *args, **kwargs)
+                return result
+            finally:
+                changed = [
+                    arg
+                    for arg in (*args, *kwargs.values(), result)
+                    if isinstance(arg, (str, __PATH_TYPES, mutapath.Path))
+                ]
+                __invalidate(self, source, changed, subtree=True)
 
-    return convert_path
+    elif name in __CHANGING_SELF or name in __CHANGING_TREE:
+        subtree = name in __CHANGING_TREE
+
+        @functools.wraps(orig_func)
+        def invalidation_decorator(self, *args, **kwargs):
+            source = getattr(self, "_contained", self)
+            try:
+                return orig_func(self, *args, **kwargs)
+            finally:
+                __invalidate(self, source, (), subtree=subtree)
+
+    else:
+        return orig_func
+    return invalidation_decorator
 
 
 def __path_func(orig_func):
     @functools.wraps(orig_func)
     def wrap_decorator(cls, *args, **kwargs):
         result = orig_func(cls, *args, **kwargs)
-        return __path_converter(cls.clone)(result)
+        if isinstance(result, __PATH_TYPES):
+            return cls.clone(result)
+        return result
 
     return wrap_decorator
 
 
-def wrap_attribute(orig_attr, fetcher: Optional[Callable] = None):
-    @functools.wraps(orig_attr)
-    def __wrap_decorator(self, *args, **kwargs):
-        fetched = self._contained
-        if fetcher is not None:
-            fetched = fetcher(fetched)
+def wrap_attribute(
+    orig_attr,
+    fetcher: Optional[Callable] = None,
+    normalized: bool = False,
+    kind: str = DYNAMIC,
+):
+    """
+    Wrap the given member of path.Path or pathlib.Path so that it is called on the contained path
+    and returns mutapath.Path instances instead.
+
+    :param orig_attr: the member to wrap
+    :param fetcher: an optional converter of the contained path before the member is called on it
+    :param normalized: if the returned paths are already normalized and can be cloned without renormalization
+    :param kind: the kind of the returned values (see :func:`classify`)
+    """
+    is_property = isinstance(orig_attr, property)
+    if is_property:
+        orig_attr = orig_attr.fget
+
+    if kind == SCALAR:
+
+        def __wrap_decorator(self, *args, **kwargs):
+            fetched = self._contained
+            if fetcher is not None:
+                fetched = fetcher(fetched)
+            return orig_attr(fetched, *args, **kwargs)
+
+    elif kind == PATH:
+
+        def __wrap_decorator(self, *args, **kwargs):
+            fetched = self._contained
+            if fetcher is not None:
+                fetched = fetcher(fetched)
+            result = orig_attr(fetched, *args, **kwargs)
+            if isinstance(result, __PATH_TYPES):
+                if normalized:
+                    return self._clone_normalized(result)
+                return self.clone(result)
+            return result
+
+    elif kind == LIST:
 
-        if isinstance(orig_attr, property):
-            result = orig_attr.__get__(fetched)
-        else:
+        def __wrap_decorator(self, *args, **kwargs):
+            fetched = self._contained
+            if fetcher is not None:
+                fetched = fetcher(fetched)
             result = orig_attr(fetched, *args, **kwargs)
+            if result is None:
+                return None
+            return [__convert(self, element, normalized) for element in result]
 
-        if result is None:
-            return None
+    elif kind == ITERATOR:
 
-        converter = __path_converter(self.clone)
-        if isinstance(result, List) and not isinstance(result, (str, bytes, bytearray)):
-            return list(map(converter, result))
-        if isinstance(result, Iterable) and not isinstance(
-            result, (str, bytes, bytearray)
-        ):
-            return (converter(g) for g in result)
-        return __path_converter(self.clone)(result)
+        def __wrap_decorator(self, *args, **kwargs):
+            fetched = self._contained
+            if fetcher is not None:
+                fetched = fetcher(fetched)
+            result = orig_attr(fetched, *args, **kwargs)
+            if result is None:
+                return None
+            return __convert_iterator(self, result, normalized)
 
-    if isinstance(orig_attr, property):
+    else:
+
+        def __wrap_decorator(self, *args, **kwargs):
+            fetched = self._contained
+            if fetcher is not None:
+                fetched = fetcher(fetched)
+            result = orig_attr(fetched, *args, **kwargs)
+
+            if result is None:
+                return None
+            if isinstance(result, List) and not isinstance(
+                result, __SEQUENCE_EXCLUSIONS
+            ):
+                return [__convert(self, element, normalized) for element in result]
+            if isinstance(result, Iterable) and not isinstance(
+                result, __SEQUENCE_EXCLUSIONS
+            ):
+                return __convert_iterator(self, result, normalized)
+            return __convert(self, result, normalized)
+
+    functools.update_wrapper(__wrap_decorator, orig_attr)
+    if is_property:
         return property(fget=__wrap_decorator, doc=orig_attr.__doc__)
 
     return __wrap_decorator
 
 
+def __wrappable(source, name: str) -> bool:
+    if name.startswith("_") or name in __EXCLUDE_FROM_WRAPPING:
+        return False
+    return __is_mbm(getattr(source, name, None))
+
+
+def _wrapped_member(name: str):
+    """Wrap the member of path.Path, or alternatively of pathlib.Path, with the given name, or return None."""
+    if __wrappable(path.Path, name):
+        wrapped = wrap_attribute(
+            getattr(path.Path, name),
+            normalized=name in __NORMALIZED_RESULTS,
+            kind=classify(name),
+        )
+    elif __wrappable(pathlib.Path, name):
+        wrapped = wrap_attribute(
+            getattr(pathlib.Path, name), pathlib.Path, kind=classify(name)
+        )
+    else:
+        return None
+    return __invalidating(wrapped, name)
+
+
+class _LazyMember:
+    """
+    Placeholder of a member of path.Path or pathlib.Path on a path class,
+    which replaces itself with the wrapped member on first access.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        holder = next(
+            klass for klass in owner.__mro__ if klass.__dict__.get(self.name) is self
+        )
+        setattr(holder, self.name, _wrapped_member(self.name))
+        return getattr(owner if instance is None else instance, self.name)
+
+
+def _defines(cls, name: str) -> bool:
+    for klass in cls.__mro__:
+        member = klass.__dict__.get(name)
+        if member is not None:
+            return not isinstance(member, _LazyMember)
+    return False
+
+
+def wrap_member(cls, name: str) -> bool:
+    """
+    Wrap the member of path.Path, or alternatively of pathlib.Path, with the given name and install it on the class.
+    This is done lazily on the first access of a member that the class does not define itself.
+
+    :param cls: the path class to install the wrapped member on
+    :param name: the name of the member
+    :return: True if a member has been wrapped and installed
+    """
+    if _defines(cls, name):
+        return False
+    wrapped = _wrapped_member(name)
+    if wrapped is None:
+        return False
+    setattr(cls, name, wrapped)
+    return True
+
+
+def wrappable_names() -> Set[str]:
+    """Get the names of all members of path.Path and pathlib.Path that can be wrapped."""
+    names = set()
+    for source in path.Path, pathlib.Path:
+        names.update(name for name in dir(source) if __wrappable(source, name))
+    return names
+
+
 def path_wrapper(cls):
-    member_names = list()
-    for name, method in inspect.getmembers(cls, __is_def):
-        if name not in __EXCLUDE_FROM_WRAPPING:
+    for name in type.__dir__(cls):
+        method = getattr(cls, name)
+        if name not in __EXCLUDE_FROM_WRAPPING and __is_def(method):
             setattr(cls, name, __path_func(method))
-            member_names.append(name)
-    for name, _ in inspect.getmembers(path.Path, __is_mbm):
-        if (
-            not name.startswith("_")
-            and name not in __EXCLUDE_FROM_WRAPPING
-            and name not in member_names
-        ):
-            method = getattr(path.Path, name)
-            if not hasattr(cls, name):
-                setattr(cls, name, wrap_attribute(method))
-                member_names.append(name)
-    for name, _ in inspect.getmembers(pathlib.Path, __is_mbm):
-        if (
-            not name.startswith("_")
-            and name not in __EXCLUDE_FROM_WRAPPING
-            and name not in member_names
-        ):
-            method = getattr(pathlib.Path, name)
-            if not hasattr(cls, name):
-                setattr(cls, name, wrap_attribute(method, pathlib.Path))
+    for name in wrappable_names():
+        if not _defines(cls, name):
+            setattr(cls, name, _LazyMember(name))
     return cls
 
 
@@ -192,8 +551,8 @@ def __mutate_func(cls, method_name):
 
 
 def mutable_path_wrapper(cls):
-    names, _ = zip(*inspect.getmembers(path.Path, __is_def))
-    names = __MUTABLE_FUNCTIONS.intersection(names)
-    for method_name in names:
-        setattr(cls, method_name, __mutate_func(cls, method_name))
+    for method_name in __MUTABLE_FUNCTIONS:
+        if __is_def(getattr(path.Path, method_name, None)):
+            mutator = __mutate_func(cls, method_name)
+            setattr(cls, method_name, __invalidating(mutator, method_name))
     return cls
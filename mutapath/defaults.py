@@ -1,17 +1,146 @@
-from dataclasses import dataclass
+import contextvars
+import functools
+from contextlib import contextmanager
+from typing import Callable, NamedTuple, TypeVar
 
-import singletons
+T = TypeVar("T")
 
 
-@dataclass
-class PathDefaults(metaclass=singletons.ThreadSingleton):
+class _Defaults(NamedTuple):
+    posix: bool = False
+    string_repr: bool = False
+    read_timeout: float = 1
+
+
+_DEFAULTS: "contextvars.ContextVar[_Defaults]" = contextvars.ContextVar(
+    "mutapath_defaults", default=_Defaults()
+)
+
+
+def current_defaults() -> _Defaults:
+    """Get the defaults of the current context as immutable tuple."""
+    return _DEFAULTS.get()
+
+
+class PathDefaults:
     """
-    This dataclass contains all defaults that are used for paths if no arguments are given.
+    This class contains all defaults that are used for paths if no arguments are given.
+
+    The defaults are stored in a context variable.
+    Changes apply to the current thread or asyncio task and are inherited by tasks created from it.
+    Use :meth:`scope` to change them temporarily and :meth:`bind` to carry them into executor workers.
+    Only :attr:`lock_backend` applies to the whole process instead.
     """
 
-    posix: bool = False
-    string_repr: bool = False
+    __slots__ = ()
+
+    @property
+    def posix(self) -> bool:
+        return _DEFAULTS.get().posix
+
+    @posix.setter
+    def posix(self, value: bool):
+        _DEFAULTS.set(_DEFAULTS.get()._replace(posix=value))
+
+    @property
+    def string_repr(self) -> bool:
+        return _DEFAULTS.get().string_repr
+
+    @string_repr.setter
+    def string_repr(self, value: bool):
+        _DEFAULTS.set(_DEFAULTS.get()._replace(string_repr=value))
+
+    @property
+    def read_timeout(self) -> float:
+        """
+        The timeout in seconds how long :attr:`~mutapath.Path.text` and :attr:`~mutapath.Path.bytes`
+        wait for the :attr:`~mutapath.Path.read_lock` of a file (default: 1), or a negative value to wait forever.
+        """
+        return _DEFAULTS.get().read_timeout
+
+    @read_timeout.setter
+    def read_timeout(self, value: float):
+        _DEFAULTS.set(_DEFAULTS.get()._replace(read_timeout=value))
+
+    @property
+    def lock_backend(self) -> str:
+        """
+        The backend of new file locks, either 'soft' or 'kernel' (see :mod:`mutapath.locking`).
+        It is shared by all threads of this process and can therefore not be changed with :meth:`scope`.
+        """
+        from mutapath import locking
+
+        return locking.get_backend()
+
+    @lock_backend.setter
+    def lock_backend(self, value: str):
+        from mutapath import locking
+
+        locking.set_backend(value)
 
     def reset(self):
-        self.posix = False
-        self.string_repr = False
+        """
+        Reset the defaults of the current context.
+        The process-wide :attr:`lock_backend` is kept, use :meth:`reset_lock_backend` to reset it.
+        """
+        _DEFAULTS.set(_Defaults())
+
+    @staticmethod
+    def reset_lock_backend():
+        """Reset the :attr:`lock_backend` of all threads of this process to 'soft'."""
+        from mutapath import locking
+
+        locking.set_backend(locking.SOFT)
+
+    def __repr__(self):
+        return (
+            f"PathDefaults(posix={self.posix}, string_repr={self.string_repr}, "
+            f"read_timeout={self.read_timeout}, lock_backend={self.lock_backend!r})"
+        )
+
+    @staticmethod
+    @contextmanager
+    def scope(**defaults):
+        """
+        Change the given defaults as long as this context is open.
+
+        :raises ValueError: if a given default is unknown or can not be scoped (i.e., :attr:`lock_backend`)
+
+        :Example:
+        >>> with PathDefaults.scope(posix=True):
+        ...     Path("/home/doe").posix_enabled
+        True
+        """
+        for name in defaults:
+            if name == "lock_backend":
+                raise ValueError(
+                    "The lock backend is shared by the whole process and can not be scoped, "
+                    "set PathDefaults().lock_backend instead."
+                )
+            if name not in _Defaults._fields:
+                raise ValueError(
+                    f"Unknown path default {name!r}, expected one of {_Defaults._fields}"
+                )
+        token = _DEFAULTS.set(_DEFAULTS.get()._replace(**defaults))
+        try:
+            yield
+        finally:
+            _DEFAULTS.reset(token)
+
+    @staticmethod
+    def bind(func: Callable[..., T]) -> Callable[..., T]:
+        """
+        Bind the given callable to the defaults of the current context,
+        e.g., to submit it to a thread pool whose workers do not inherit the context.
+
+        :Example:
+        >>> with PathDefaults.scope(posix=True):
+        ...     future = executor.submit(PathDefaults.bind(Path), "/home/doe")
+        """
+        context = contextvars.copy_context()
+
+        @functools.wraps(func)
+        def bound(*args, **kwargs):
+            return context.copy().run(func, *args, **kwargs)
+
+        return bound
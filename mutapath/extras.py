@@ -0,0 +1,74 @@
+import functools
+
+
+class extra_property:
+    """
+    A cached property for slotted path classes.
+
+    The computed value is stored in the extras side-table of the instance (i.e., its ``_extras`` slot),
+    which is only allocated once the first extra value is cached.
+    """
+
+    def __init__(self, func):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = func.__name__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        extras = obj._extras
+        if extras is None:
+            extras = {}
+            object.__setattr__(obj, "_extras", extras)
+        try:
+            return extras[self.name]
+        except KeyError:
+            value = extras[self.name] = self.func(obj)
+            return value
+
+
+class slot_property:
+    """
+    A cached property for slotted path classes whose small values are used often (e.g., the hash).
+
+    The computed value is stored in the given dedicated slot of the instance,
+    which needs no initialization, as an unset slot means that the value has not been computed yet.
+    """
+
+    def __init__(self, slot: str):
+        self.slot = slot
+        self.member = None
+
+    def __call__(self, func):
+        functools.update_wrapper(self, func)
+        self.func = func
+        return self
+
+    def __set_name__(self, owner, name):
+        self.member = owner.__dict__[self.slot]
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        member = self.member
+        try:
+            return member.__get__(obj, cls)
+        except AttributeError:
+            value = self.func(obj)
+            member.__set__(obj, value)
+            return value
+
+    def compute(self, obj):
+        """Get the value of the given instance without caching it, reusing the cached value if there is one."""
+        try:
+            return self.member.__get__(obj, type(obj))
+        except AttributeError:
+            return self.func(obj)
+
+    def reset(self, obj):
+        """Drop the cached value of the given instance, if any."""
+        try:
+            self.member.__delete__(obj)
+        except AttributeError:
+            pass
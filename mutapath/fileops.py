@@ -0,0 +1,423 @@
+"""
+Copy engine that lets the kernel copy the file contents where the platform supports it.
+
+The contents are copied with :func:`os.copy_file_range`, which allows copy-on-write file systems
+and network file systems to copy without transferring the data at all.
+If the file systems do not support it, :func:`os.sendfile` and finally a read loop into a preallocated buffer
+are used instead, continuing at the position where the previous strategy gave up.
+The functions can be passed as the ``method`` of :meth:`~mutapath.Path.copying` and :meth:`~mutapath.Path.moving`,
+binding a progress callback with :func:`functools.partial` if needed.
+:func:`rename_noreplace` renames atomically without replacing an existing target.
+:class:`FsyncBatch` groups the fsync calls of several atomic writes (see :meth:`~mutapath.Path.writing`).
+
+:Example:
+>>> from functools import partial
+>>> from mutapath import fileops
+>>> report = lambda copied, total, rate: print(f"{copied}/{total} bytes at {rate / 2**20:.0f} MiB/s")
+>>> with Path('/home/doe/data.bin').copying(method=partial(fileops.copy, progress=report)) as mut:
+...     mut.stem = "backup"
+"""
+import contextlib
+import errno
+import functools
+import os
+import shutil
+import stat
+import sys
+import threading
+import time
+from typing import Callable, List, Optional, Set, Tuple, Union
+
+from mutapath import statcache
+
+CHUNK_SIZE = 8 * 1024 * 1024
+"""The number of bytes that is copied between two progress reports."""
+
+PathLike = Union[str, os.PathLike]
+Progress = Callable[[int, int, float], None]
+"""A callback that is given the copied bytes, the total bytes and the bytes per second so far."""
+
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+_UNSUPPORTED = {
+    errno.EBADF,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSOCK,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+    errno.ETXTBSY,
+    errno.EXDEV,
+}
+
+
+class _Transfer:
+    __slots__ = ("source", "target", "total", "copied", "progress", "_start")
+
+    def __init__(self, source, target, progress: Optional[Progress]):
+        self.source = source
+        self.target = target
+        self.total = os.fstat(source.fileno()).st_size
+        self.copied = 0
+        self.progress = progress
+        self._start = time.perf_counter()
+
+    def advance(self, copied: int):
+        self.copied += copied
+        if self.progress is not None:
+            elapsed = time.perf_counter() - self._start
+            rate = self.copied / elapsed if elapsed > 0 else 0.0
+            self.progress(self.copied, max(self.total, self.copied), rate)
+
+
+def _copy_file_range(transfer: _Transfer) -> bool:
+    source, target = transfer.source.fileno(), transfer.target.fileno()
+    while True:
+        offset = transfer.copied
+        copied = os.copy_file_range(source, target, CHUNK_SIZE, offset, offset)
+        if not copied:
+            return offset > 0
+        transfer.advance(copied)
+
+
+def _sendfile(transfer: _Transfer) -> bool:
+    source, target = transfer.source.fileno(), transfer.target.fileno()
+    os.lseek(target, transfer.copied, os.SEEK_SET)
+    while True:
+        offset = transfer.copied
+        copied = os.sendfile(target, source, offset, CHUNK_SIZE)
+        if not copied:
+            return offset > 0
+        transfer.advance(copied)
+
+
+def _read_loop(transfer: _Transfer) -> bool:
+    view = memoryview(bytearray(min(CHUNK_SIZE, max(transfer.total, 1))))
+    transfer.source.seek(transfer.copied)
+    transfer.target.seek(transfer.copied)
+    while True:
+        read = transfer.source.readinto(view)
+        if not read:
+            return True
+        written = 0
+        while written < read:
+            written += transfer.target.write(view[written:read])
+        transfer.advance(read)
+
+
+def _strategies():
+    if hasattr(os, "copy_file_range"):
+        yield _copy_file_range
+    if hasattr(os, "sendfile"):
+        yield _sendfile
+    yield _read_loop
+
+
+def copyfile(
+    source: PathLike, target: PathLike, progress: Optional[Progress] = None
+) -> PathLike:
+    """
+    Copy the contents of the source file to the target file.
+
+    :param source: the file to copy
+    :param target: the file to create or overwrite
+    :param progress: an optional callback that is given the copied bytes, the total bytes and the bytes per second
+    :return: the target file
+    :raises shutil.SameFileError: if the source and the target are the same file
+
+    .. seealso:: :func:`shutil.copyfile`
+    """
+    if os.path.exists(target) and os.path.samefile(source, target):
+        raise shutil.SameFileError(f"{source!r} and {target!r} are the same file")
+
+    try:
+        with open(source, "rb", buffering=0) as src, open(
+            target, "wb", buffering=0
+        ) as dst:
+            transfer = _Transfer(src, dst, progress)
+            for strategy in _strategies():
+                try:
+                    if strategy(transfer):
+                        break
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED or strategy is _read_loop:
+                        raise
+    finally:
+        statcache.invalidate(target)
+    return target
+
+
+def copy(
+    source: PathLike,
+    target: PathLike,
+    progress: Optional[Progress] = None,
+    follow_symlinks: bool = True,
+) -> PathLike:
+    """
+    Copy the source file to the target file or into the target directory, preserving its metadata.
+
+    :param source: the file to copy
+    :param target: the file or the existing directory to copy to
+    :param progress: an optional callback that is given the copied bytes, the total bytes and the bytes per second
+    :param follow_symlinks: if symbolic links are copied as links instead of their contents if False
+    :return: the copied file
+
+    .. seealso:: :func:`shutil.copy2`
+    """
+    if os.path.isdir(target):
+        target = os.path.join(target, os.path.basename(source))
+    if not follow_symlinks and os.path.islink(source):
+        os.symlink(os.readlink(source), target)
+        statcache.invalidate(target)
+    else:
+        copyfile(source, target, progress)
+    shutil.copystat(source, target, follow_symlinks=follow_symlinks)
+    return target
+
+
+def move(
+    source: PathLike, target: PathLike, progress: Optional[Progress] = None
+) -> PathLike:
+    """
+    Move the source file or directory, renaming it if possible and copying it with :func:`copy` otherwise.
+
+    :param source: the file or directory to move
+    :param target: the path or the existing directory to move to
+    :param progress: an optional callback that is given the copied bytes, the total bytes and the bytes per second
+        of each copied file
+    :return: the moved path
+
+    .. seealso:: :func:`shutil.move`
+    """
+
+    def copy_function(src: PathLike, dst: PathLike) -> PathLike:
+        return copy(src, dst, progress)
+
+    try:
+        return shutil.move(source, target, copy_function=copy_function)
+    finally:
+        statcache.invalidate(source, target, subtree=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _renameat2():
+    if not sys.platform.startswith("linux"):
+        return None
+    import ctypes
+
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (AttributeError, OSError):
+        return None
+    renameat2.argtypes = (
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_uint,
+    )
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+
+def _rename_exclusive(source: PathLike, target: PathLike) -> bool:
+    renameat2 = _renameat2()
+    if renameat2 is None:
+        return False
+
+    import ctypes
+
+    result = renameat2(
+        _AT_FDCWD,
+        os.fsencode(source),
+        _AT_FDCWD,
+        os.fsencode(target),
+        _RENAME_NOREPLACE,
+    )
+    if result == 0:
+        return True
+    code = ctypes.get_errno()
+    if code in (errno.EINVAL, errno.ENOSYS):
+        return False
+    raise OSError(code, os.strerror(code), os.fspath(source), None, os.fspath(target))
+
+
+def _link_exclusive(source: PathLike, target: PathLike):
+    try:
+        os.link(source, target, follow_symlinks=False)
+    except FileExistsError:
+        raise
+    except OSError:
+        if os.path.lexists(target):
+            raise FileExistsError(
+                errno.EEXIST, os.strerror(errno.EEXIST), os.fspath(target)
+            )
+        os.rename(source, target)
+    else:
+        os.unlink(source)
+
+
+def rename_noreplace(source: PathLike, target: PathLike) -> PathLike:
+    """
+    Rename the source path to the target path, failing if the target already exists.
+
+    On Linux, this is a single atomic ``renameat2`` call with ``RENAME_NOREPLACE``.
+    Otherwise, or if the file system does not support it, files are hard linked to the target and then unlinked,
+    which fails atomically as well if the target exists.
+    Paths that can not be hard linked (e.g., directories) are renamed after checking that the target does not exist.
+    On Windows, :func:`os.rename` never replaces the target and is used directly.
+
+    :param source: the path to rename
+    :param target: the new path
+    :return: the target path
+    :raises FileExistsError: if the target already exists
+
+    .. seealso:: :func:`os.rename`
+    """
+    try:
+        if os.name == "nt":
+            os.rename(source, target)
+        elif not _rename_exclusive(source, target):
+            _link_exclusive(source, target)
+        return target
+    finally:
+        statcache.invalidate(source, target, subtree=True)
+
+
+def temporary_sibling(target: PathLike) -> Tuple[int, str]:
+    """
+    Create a new hidden temporary file in the directory of the given target, for writing it atomically.
+    The temporary file gets the permissions of the target if it exists, or the default permissions otherwise.
+
+    :param target: the file that is going to be replaced by the temporary file
+    :return: the open file descriptor and the path of the temporary file
+    """
+    directory, name = os.path.split(os.fspath(target))
+    while True:
+        temporary = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        os.chmod(temporary, stat.S_IMODE(os.stat(target).st_mode))
+    except FileNotFoundError:
+        pass
+    except BaseException:
+        os.close(fd)
+        os.unlink(temporary)
+        raise
+    return fd, temporary
+
+
+def fsync_file(file: PathLike):
+    """Flush the contents of the given closed file to the disk."""
+    fd = os.open(file, os.O_RDWR if os.name == "nt" else os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(directory: PathLike):
+    """Flush the entries of the given directory to the disk, which makes renames within it durable."""
+    if os.name == "nt":
+        return
+    fd = os.open(directory or os.curdir, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class FsyncBatch:
+    """
+    A group of atomic writes that are made durable together.
+
+    The files written with ``fsync=batch`` (see :meth:`~mutapath.Path.writing`) are only closed at first.
+    Once the batch is committed, all of them are flushed to the disk, they replace their targets,
+    and each of their directories is flushed only once.
+    Their file locks are held until then, and the batch has to be committed on the thread that acquired them.
+    Used as context manager, the batch is committed on exit, or discarded if an exception occurred.
+
+    :Example:
+    >>> with FsyncBatch() as batch:
+    ...     for file in files:
+    ...         with file.writing(fsync=batch) as stream:
+    ...             stream.write(b"content")
+    """
+
+    __slots__ = ("_pending", "_lock")
+
+    def __init__(self):
+        self._pending: List[Tuple[str, PathLike, Optional[Callable[[], None]]]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(
+        self,
+        temporary: str,
+        target: PathLike,
+        release: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Add a closed temporary file that replaces the given target once the batch is committed.
+
+        :param temporary: the written temporary file
+        :param target: the file to replace
+        :param release: an optional callable that releases the lock of the target after its replacement
+        """
+        with self._lock:
+            self._pending.append((temporary, target, release))
+
+    def _take(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def commit(self):
+        """Flush all written files to the disk and replace their targets."""
+        pending = self._take()
+        replaced = 0
+        try:
+            for temporary, _, _ in pending:
+                fsync_file(temporary)
+            directories: Set[str] = set()
+            for temporary, target, _ in pending:
+                os.replace(temporary, target)
+                replaced += 1
+                directories.add(os.path.dirname(os.path.abspath(target)))
+            for directory in directories:
+                fsync_directory(directory)
+        finally:
+            _finish(pending, replaced)
+
+    def discard(self):
+        """Delete all written files without replacing their targets."""
+        _finish(self._take(), 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+
+def _finish(pending, replaced: int):
+    for index, (temporary, target, release) in enumerate(pending):
+        try:
+            if index >= replaced:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(temporary)
+            statcache.invalidate(target)
+        finally:
+            if release is not None:
+                release()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pathlib
+from typing import Union, Optional
+
+import path
+from path.classes import multimethod
+
+import mutapath
+from mutapath import normalization
+
+
+class FrozenPath(mutapath.Path):
+    """
+    Frozen Path
+
+    In contrast to :class:`~mutapath.Path`, a frozen path can not be changed by any context (e.g., mutate or renaming).
+    Its hash is computed once during construction, so it is meant to be used in sets and as key of dicts.
+    It is equal to any other frozen path with the same normalized value, regardless of the posix flag of either side,
+    as both equality and hash use the posix-like canonical form (i.e., backslashes and slashes are equivalent).
+    Other paths are hashed by their contained value instead, so they are only equal to a frozen path
+    if their contained value is the canonical form already (i.e., it has no backslashes).
+    Paths derived from it (e.g., with ``/``, :meth:`joinpath`, :meth:`with_name` or :attr:`parent`) are frozen as well.
+    """
+
+    __slots__ = ("_canonical",)
+
+    def __init__(
+        self,
+        contained: Union[mutapath.Path, path.Path, pathlib.PurePath, str] = "",
+        *,
+        posix: Optional[bool] = None,
+        string_repr: Optional[bool] = None,
+    ):
+        super(FrozenPath, self).__init__(
+            contained, posix=posix, string_repr=string_repr
+        )
+        self._freeze()
+
+    def _freeze(self):
+        canonical = normalization.render(self._contained, True)
+        object.__setattr__(self, "_canonical", canonical)
+        object.__setattr__(self, "_cached_hash", hash(canonical))
+
+    def __setattr__(self, key, value):
+        if key == "_contained":
+            raise AttributeError(
+                f"attribute {key} can not be set because mutapath.FrozenPath is a frozen class."
+            )
+        super(FrozenPath, self).__setattr__(key, value)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenPath):
+            return self._canonical == other._canonical
+        if isinstance(other, mutapath.Path):
+            return self._canonical == other._contained
+        if isinstance(other, pathlib.PurePath):
+            other = str(other)
+        elif not isinstance(other, str):
+            return NotImplemented
+        return self._canonical == normalization.canonical(str(other), True)
+
+    def __hash__(self):
+        return self._cached_hash
+
+    def __setstate__(self, state):
+        super(FrozenPath, self).__setstate__(state)
+        self._freeze()
+
+    def clone(self, contained) -> FrozenPath:
+        """
+        Clone this path with a new given wrapped path representation, having the same remaining attributes.
+        :param contained: the new contained path element
+        :return: the cloned frozen path
+        """
+        return FrozenPath(
+            contained, posix=self.posix_enabled, string_repr=self.string_repr_enabled
+        )
+
+    def _clone_normalized(self, contained: path.Path) -> FrozenPath:
+        cloned = object.__new__(FrozenPath)
+        cloned.__setstate__(
+            (contained or path.Path(""), self.posix_enabled, self.string_repr_enabled)
+        )
+        return cloned
+
+    @multimethod
+    def joinpath(cls, first, *others) -> FrozenPath:
+        """.. seealso:: :meth:`mutapath.Path.joinpath`"""
+        joined = mutapath.Path.joinpath(first, *others)
+        string_repr = (
+            first.string_repr_enabled if isinstance(first, mutapath.Path) else None
+        )
+        return FrozenPath(joined, posix=joined.posix_enabled, string_repr=string_repr)
+
+    def with_parent(self, new_parent) -> FrozenPath:
+        """.. seealso:: :meth:`mutapath.Path.with_parent`"""
+        return self.clone(super(FrozenPath, self).with_parent(new_parent))
+
+    def with_base(self, base, strip_length: int = 0) -> FrozenPath:
+        """.. seealso:: :meth:`mutapath.Path.with_base`"""
+        return self.clone(super(FrozenPath, self).with_base(base, strip_length))
+
+    @property
+    def posix_enabled(self) -> bool:
+        """.. seealso:: :attr:`mutapath.Path.posix_enabled`"""
+        return self._Path__always_posix_format
+
+    def mutate(self):
+        """Frozen paths can not be mutated, use :meth:`~mutapath.Path.mutate` on a cloned Path instead."""
+        raise AttributeError(
+            "mutapath.FrozenPath is a frozen class and can not be mutated."
+        )
+
+    def _op_context(self, name: str, *args, **kwargs):
+        raise AttributeError(
+            f"{name.capitalize()} is not possible because mutapath.FrozenPath is a frozen class."
+        )
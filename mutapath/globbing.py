@@ -0,0 +1,303 @@
+"""
+Glob engine that matches the string components of paths during a single :func:`os.scandir` traversal.
+
+Patterns follow the semantics of :meth:`pathlib.Path.glob`:
+``*``, ``?`` and ``[...]`` match within one component, ``**`` matches this directory and all subdirectories,
+and a trailing separator only matches directories.
+Each pattern is compiled once and the compiled patterns are cached.
+Any number of include and exclude patterns is matched in the same traversal,
+and directories that match an exclude pattern are skipped together with their contents.
+
+:Example:
+>>> list(Path("/home/doe/project").glob("**/*.py", "*.toml", exclude=["**/.venv"]))
+"""
+from __future__ import annotations
+
+import fnmatch
+import functools
+import os
+import re
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import path
+
+import mutapath
+from mutapath import normalization, scanning
+
+RECURSIVE = "**"
+"""The pattern component that matches this directory and all its subdirectories."""
+
+_MAGIC = re.compile("[*?[]")
+_SEPARATORS = re.compile(r"[\\/]" if os.name == "nt" else "/")
+_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+Segment = Union[str, Callable[[str], object]]
+_State = Tuple[int, int]
+
+
+class CompiledPattern(NamedTuple):
+    """
+    A glob pattern split into its components.
+    Each component is either :data:`RECURSIVE`, a literal name, or the match function of a regular expression.
+    """
+
+    segments: Tuple[Segment, ...]
+    dirs_only: bool
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> CompiledPattern:
+    """
+    Compile the given relative glob pattern.
+
+    :raises ValueError: if the pattern is empty or absolute
+    """
+    if not pattern:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    if path.Path.module.isabs(pattern) or path.Path.module.splitdrive(pattern)[0]:
+        raise ValueError("Non-relative patterns are unsupported")
+
+    parts = [part for part in _SEPARATORS.split(pattern) if part and part != os.curdir]
+    if not parts:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+
+    segments = []
+    for part in parts:
+        if part == RECURSIVE:
+            if not segments or segments[-1] is not RECURSIVE:
+                segments.append(RECURSIVE)
+        elif _MAGIC.search(part) is None:
+            segments.append(part)
+        else:
+            segments.append(re.compile(fnmatch.translate(part), _FLAGS).match)
+    dirs_only = _SEPARATORS.match(pattern[-1]) is not None or segments[-1] is RECURSIVE
+    return CompiledPattern(tuple(segments), dirs_only)
+
+
+def _child(parent: mutapath.Path, name: str) -> mutapath.Path:
+    contained = parent._contained
+    if contained in ("", os.curdir):
+        joined = name
+    else:
+        joined = path.Path.module.join(contained, name)
+    if name == os.pardir:
+        return parent.clone(joined)
+    return parent._clone_normalized(
+        path.Path(normalization.render(joined, parent.posix_enabled))
+    )
+
+
+class _Step(NamedTuple):
+    literals: Dict[str, Tuple[_State, ...]]
+    wildcards: Tuple[Tuple[Callable[[str], object], _State], ...]
+    recursive: FrozenSet[_State]
+
+
+class _Final(NamedTuple):
+    following: FrozenSet[_State]
+    include: bool
+    include_dirs: bool
+    exclude: bool
+    exclude_dirs: bool
+
+
+class _Matcher:
+    """
+    The state machine of a set of compiled patterns whose states are pairs of pattern and component index.
+    The transitions of each set of states are computed once per traversal.
+    """
+
+    __slots__ = ("patterns", "includes", "_steps", "_closures", "_finals")
+
+    def __init__(self, include: Iterable[str], exclude: Iterable[str]):
+        include = [compile_pattern(p) for p in include]
+        self.includes = len(include)
+        self.patterns = include + [compile_pattern(p) for p in exclude]
+        self._steps: Dict[FrozenSet[_State], _Step] = dict()
+        self._closures: Dict[Tuple[_State, ...], FrozenSet[_State]] = dict()
+        self._finals: Dict[FrozenSet[_State], _Final] = dict()
+
+    def closure(self, states: Iterable[_State]) -> FrozenSet[_State]:
+        """Add the states that skip over recursive components, as they also match no directory at all."""
+        closed = set()
+        for p, i in states:
+            segments = self.patterns[p].segments
+            closed.add((p, i))
+            while i < len(segments) and segments[i] is RECURSIVE:
+                i += 1
+                closed.add((p, i))
+        return frozenset(closed)
+
+    def start(self) -> FrozenSet[_State]:
+        return self.closure((p, 0) for p in range(len(self.patterns)))
+
+    def literals(self, states: FrozenSet[_State]) -> List[str]:
+        """Get the literal names that all given states expect next, or an empty list if any of them is a wildcard."""
+        step = self._step(states)
+        if step.wildcards or step.recursive:
+            return []
+        return [
+            self.patterns[p].segments[i - 1]
+            for targets in step.literals.values()
+            for p, i in targets[:1]
+        ]
+
+    def _step(self, states: FrozenSet[_State]) -> _Step:
+        step = self._steps.get(states)
+        if step is not None:
+            return step
+
+        literals: Dict[str, Tuple[_State, ...]] = dict()
+        wildcards = []
+        recursive = []
+        for p, i in sorted(states):
+            segments = self.patterns[p].segments
+            if i == len(segments):
+                continue
+            segment = segments[i]
+            if segment is RECURSIVE:
+                recursive.append((p, i))
+            elif isinstance(segment, str):
+                key = segment.lower() if _FLAGS else segment
+                literals[key] = literals.get(key, ()) + ((p, i + 1),)
+            else:
+                wildcards.append((segment, (p, i + 1)))
+        step = self._steps[states] = _Step(
+            literals, tuple(wildcards), self.closure(recursive)
+        )
+        return step
+
+    def advance(
+        self, states: FrozenSet[_State], name: str
+    ) -> Tuple[FrozenSet[_State], FrozenSet[_State]]:
+        """
+        Consume the given name in all states.
+
+        :return: the states if the name is a regular component, and those that only continue if it is a real directory
+        """
+        step = self._step(states)
+        targets = step.literals.get(name.lower() if _FLAGS else name, ())
+        for match, target in step.wildcards:
+            if match(name):
+                targets += (target,)
+        advanced = self._closures.get(targets)
+        if advanced is None:
+            advanced = self._closures[targets] = self.closure(targets)
+        return advanced, step.recursive
+
+    def following(self, states: FrozenSet[_State]) -> FrozenSet[_State]:
+        """Get the states that still expect further components."""
+        return self._final(states).following
+
+    def accepts(
+        self, states: FrozenSet[_State], is_dir: Callable[[], bool]
+    ) -> Tuple[bool, bool]:
+        """
+        Decide if a child is included or excluded by the final states.
+
+        :param is_dir: a callable that checks if the child is a directory, called only if necessary
+        :return: if the child is included, and if it is excluded
+        """
+        final = self._final(states)
+        included = final.include or (final.include_dirs and is_dir())
+        excluded = final.exclude or (final.exclude_dirs and is_dir())
+        return included, excluded
+
+    def _final(self, states: FrozenSet[_State]) -> _Final:
+        final = self._finals.get(states)
+        if final is not None:
+            return final
+
+        flags = dict(
+            include=False, include_dirs=False, exclude=False, exclude_dirs=False
+        )
+        following = []
+        for p, i in states:
+            pattern = self.patterns[p]
+            if i < len(pattern.segments):
+                following.append((p, i))
+                continue
+            key = "include" if p < self.includes else "exclude"
+            if pattern.dirs_only:
+                key += "_dirs"
+            flags[key] = True
+        final = self._finals[states] = _Final(frozenset(following), **flags)
+        return final
+
+
+def _candidates(
+    matcher: _Matcher, parent: mutapath.Path, states: FrozenSet[_State]
+) -> Iterator[Tuple[mutapath.Path, FrozenSet[_State], Optional[os.DirEntry]]]:
+    literals = matcher.literals(states)
+    if literals:
+        for name in literals:
+            child = _child(parent, name)
+            if os.path.lexists(child):
+                advanced, recursive = matcher.advance(states, name)
+                yield child, advanced, None
+        return
+
+    for entry in scanning.entries(parent, "ignore"):
+        advanced, recursive = matcher.advance(states, entry.name)
+        if recursive and (entry.is_symlink() or not entry.is_dir()):
+            recursive = None
+        if recursive:
+            yield scanning.from_entry(parent, entry), advanced | recursive, entry
+        elif advanced:
+            yield scanning.from_entry(parent, entry), advanced, entry
+
+
+def glob(
+    root: mutapath.Path, patterns: Iterable[str], exclude: Iterable[str] = ()
+) -> Iterator[mutapath.Path]:
+    """
+    Iterate all paths below the given root that match any of the patterns but none of the excluded patterns.
+    The matched paths are yielded depth-first and each path only once.
+
+    :param root: the directory to search in
+    :param patterns: the relative glob patterns to include
+    :param exclude: the relative glob patterns to exclude
+    """
+    matcher = _Matcher(patterns, exclude)
+    if not root._contained:
+        root = root.clone(os.curdir)
+    if not root.isdir():
+        return
+
+    states = matcher.start()
+    included, excluded = matcher.accepts(states, lambda: True)
+    if excluded:
+        return
+    if included:
+        yield root
+
+    following = matcher.following(states)
+    stack = [_candidates(matcher, root, following)] if following else []
+    while stack:
+        candidate = next(stack[-1], None)
+        if candidate is None:
+            stack.pop()
+            continue
+
+        child, states, entry = candidate
+        is_dir = functools.partial(scanning.is_dir, child, entry)
+        included, excluded = matcher.accepts(states, is_dir)
+        if excluded:
+            continue
+        if included:
+            yield child
+
+        following = matcher.following(states)
+        if following and is_dir():
+            stack.append(_candidates(matcher, child, following))
@@ -1,27 +1,48 @@
 from __future__ import annotations
 
 import contextlib
+import errno
 import io
 import os
 import pathlib
-import shutil
-import subprocess
 import sys
 import warnings
 from contextlib import contextmanager
-from typing import Union, Iterable, Callable, Optional
+from typing import (
+    AsyncIterator,
+    Union,
+    Iterable,
+    Callable,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    List,
+    Iterator,
+)
 
-import filelock
 import path
+from path import matchers
 from path.classes import multimethod
-from cached_property import cached_property
-from filelock import SoftFileLock
 
 import mutapath
-from mutapath.decorator import path_wrapper
-from mutapath.defaults import PathDefaults
+from mutapath import (
+    contentcache,
+    fileops,
+    globbing,
+    locking,
+    normalization,
+    scanning,
+    statcache,
+)
+from mutapath.decorator import path_wrapper, wrap_member
+from mutapath.defaults import current_defaults
 from mutapath.exceptions import PathException
-from mutapath.lock_dummy import DummyFileLock
+from mutapath.extras import extra_property, slot_property
+
+if TYPE_CHECKING:
+    import filelock
+
+    from mutapath import aio
 
 try:
     from mashumaro.types import SerializableType
@@ -30,15 +51,37 @@ except ImportError:
 except NotImplementedError:
     SerializableType = object
 
+_EMPTY = path.Path("")
+_CHUNK_SIZE = 1024 * 1024
+_UNWRITABLE = (errno.EACCES, errno.EPERM, errno.EROFS)
+
 
 @path_wrapper
 class Path(SerializableType):
-    """Immutable Path"""
-
-    _contained: Union[path.Path, pathlib.PurePath, str] = path.Path("")
+    """
+    Immutable Path
+
+    Instances are slotted, with dedicated slots for the hash and the components once they are computed,
+    and keep rarely used values (e.g., locks) in a side table.
+    With the mashumaro extra, they still get an instance dict,
+    as :class:`mashumaro.types.SerializableType` declares no slots.
+    """
+
+    __slots__ = (
+        "_contained",
+        "_extras",
+        "_cached_hash",
+        "_cached_components",
+        "__always_posix_format",
+        "__string_repr",
+    ) + (() if hasattr(SerializableType, "__weakref__") else ("__weakref__",))
+
+    _contained: Union[path.Path, pathlib.PurePath, str]
+    _extras: Optional[dict]
+    _cached_hash: int
+    _cached_components: Tuple[str, ...]
     __always_posix_format: bool
     __string_repr: bool
-    __mutable: object
 
     def __init__(
         self,
@@ -47,14 +90,17 @@ class Path(SerializableType):
         posix: Optional[bool] = None,
         string_repr: Optional[bool] = None,
     ):
-        if posix is None:
-            posix = PathDefaults().posix
+        if posix is None or string_repr is None:
+            defaults = current_defaults()
+            if posix is None:
+                posix = defaults.posix
+            if string_repr is None:
+                string_repr = defaults.string_repr
         self.__always_posix_format = posix
-
-        if string_repr is None:
-            string_repr = PathDefaults().string_repr
         self.__string_repr = string_repr
 
+        super(Path, self).__setattr__("_contained", _EMPTY)
+        super(Path, self).__setattr__("_extras", None)
         self._set_contained(contained, posix)
         super().__init__()
 
@@ -69,15 +115,12 @@ class Path(SerializableType):
             elif isinstance(contained, pathlib.PurePath):
                 contained = str(contained)
 
-            normalized = path.Path.module.normpath(contained)
-            if (posix is None and self.__always_posix_format) or posix:
-                normalized = Path.posix_string(normalized)
-            else:
-                normalized = Path._shorten_duplicates(normalized)
-
-            contained = path.Path(normalized)
+            if posix is None:
+                posix = self.__always_posix_format
+            contained = normalization.normalize(contained, posix)
 
             super(Path, self).__setattr__("_contained", contained)
+            Path._components.reset(self)
 
     def __dir__(self) -> Iterable[str]:
         return sorted(super(Path, self).__dir__()) + dir(path.Path)
@@ -86,22 +129,26 @@ class Path(SerializableType):
         return self._contained.__getitem__(item)
 
     def __getattr__(self, item):
+        if item == "_contained":
+            raise AttributeError(item)
+        if wrap_member(Path, item):
+            return getattr(self, item)
         return getattr(self._contained, item)
 
     def __setattr__(self, key, value):
         if key == "_contained":
-            lock = self.__dict__.get("lock", None)
-            if lock is not None:
-                if self.lock.is_locked:
-                    self.lock.release()
-                    Path(self.lock.lock_file).remove_p()
-                del self.__dict__["lock"]
+            extras = self._extras
+            for name in "read_lock", "lock":
+                lock = None if extras is None else extras.pop(name, None)
+                if lock is not None and lock.is_locked:
+                    lock.release()
+                    if not isinstance(lock, locking.FlockFileLock):
+                        Path(lock.lock_file).remove_p()
 
             if isinstance(value, Path):
                 value = value._contained
             self._set_contained(value)
         elif key in [
-            "_Path__mutable",
             "_Path__always_posix_format",
             "_Path__string_repr",
         ]:
@@ -122,24 +169,22 @@ class Path(SerializableType):
         return self._shorten_duplicates()
 
     def __eq__(self, other):
-        if isinstance(other, pathlib.PurePath):
-            other = str(other)
-        elif isinstance(other, Path):
+        if isinstance(other, Path):
+            if isinstance(other, mutapath.FrozenPath):
+                return other == self
             other = other._contained
-
-        if isinstance(other, str):
-            if self._contained == other:
-                return True
-            other = path.Path(other)
-        if isinstance(other, path.Path):
-            if self._contained == other:
-                return True
-            other = Path(other, posix=self.__always_posix_format)
-
-        if not isinstance(other, Path):
+        elif isinstance(other, pathlib.PurePath):
+            other = str(other)
+        elif not isinstance(other, str):
             return NotImplemented
 
-        return str(self) == str(other)
+        contained = self._contained
+        if contained == other:
+            return True
+        posix = self.posix_enabled
+        return normalization.render(contained, posix) == normalization.canonical(
+            other, posix
+        )
 
     def __hash__(self):
         warnings.warn(
@@ -149,34 +194,48 @@ class Path(SerializableType):
         )
         return self._hash_cache
 
-    @cached_property
+    @slot_property("_cached_hash")
     def _hash_cache(self) -> int:
         return hash(self._contained)
 
+    @slot_property("_cached_components")
+    def _components(self) -> Tuple[str, ...]:
+        return tuple(str(part) for part in self._contained.splitall())
+
+    def sort_key(self) -> Tuple[str, ...]:
+        """
+        Get the key that orders this path among other paths, i.e., the tuple of its components.
+        The key is computed only once per path.
+
+        :Example:
+        >>> sorted(paths, key=Path.sort_key)
+        """
+        return self._components
+
     def __lt__(self, other):
         if isinstance(other, Path):
-            return self.splitall() < other.splitall()
+            return self._components < other._components
         left = self.posix_string()
         right = Path.posix_string(str(other))
         return left < right
 
     def __le__(self, other):
         if isinstance(other, Path):
-            return self.splitall() <= other.splitall()
+            return self._components <= other._components
         left = self.posix_string()
         right = Path.posix_string(str(other))
         return left <= right
 
     def __gt__(self, other):
         if isinstance(other, Path):
-            return self.splitall() > other.splitall()
+            return self._components > other._components
         left = self.posix_string()
         right = Path.posix_string(str(other))
         return left > right
 
     def __ge__(self, other):
         if isinstance(other, Path):
-            return self.splitall() >= other.splitall()
+            return self._components >= other._components
         left = self.posix_string()
         right = Path.posix_string(str(other))
         return left >= right
@@ -212,6 +271,16 @@ class Path(SerializableType):
 
         return MutaPath(self._contained, posix=self.posix_enabled)
 
+    def __getstate__(self):
+        return self._contained, self.__always_posix_format, self.__string_repr
+
+    def __setstate__(self, state):
+        contained, posix, string_repr = state
+        super(Path, self).__setattr__("_contained", contained)
+        super(Path, self).__setattr__("_extras", None)
+        super(Path, self).__setattr__("_Path__always_posix_format", posix)
+        super(Path, self).__setattr__("_Path__string_repr", string_repr)
+
     def _serialize(self) -> str:
         return str(self._contained)
 
@@ -237,6 +306,20 @@ class Path(SerializableType):
             contained, posix=self.__always_posix_format, string_repr=self.__string_repr
         )
 
+    def _clone_normalized(self, contained: path.Path) -> Path:
+        """
+        Clone this path like :meth:`clone`, but trust the given contained path to be normalized already.
+        This is only valid for values derived from a normalized path with the same flags (e.g., its parent).
+        :param contained: the new, already normalized, contained path element
+        :return: the cloned path
+        """
+        cloned = object.__new__(Path)
+        cloned.__always_posix_format = self.__always_posix_format
+        cloned.__string_repr = self.__string_repr
+        super(Path, cloned).__setattr__("_contained", contained or _EMPTY)
+        super(Path, cloned).__setattr__("_extras", None)
+        return cloned
+
     @multimethod
     def _shorten_duplicates(self, input_path: str = "") -> str:
         if isinstance(input_path, Path):
@@ -385,7 +468,7 @@ class Path(SerializableType):
     @property
     def name(self) -> Path:
         """.. seealso:: :attr:`pathlib.PurePath.name`"""
-        return self.clone(self._contained.name)
+        return self._clone_normalized(self._contained.name)
 
     @name.setter
     def name(self, value):
@@ -398,7 +481,7 @@ class Path(SerializableType):
 
         .. seealso:: :attr:`parent`
         """
-        return self.clone(self._contained.parent)
+        return self._clone_normalized(self._contained.parent)
 
     @base.setter
     def base(self, value):
@@ -416,7 +499,7 @@ class Path(SerializableType):
     @property
     def parent(self) -> Path:
         """.. seealso:: :attr:`pathlib.PurePath.parent`"""
-        return self.clone(self._contained.parent)
+        return self._clone_normalized(self._contained.parent)
 
     @parent.setter
     def parent(self, value):
@@ -425,16 +508,169 @@ class Path(SerializableType):
     @property
     def dirname(self) -> Path:
         """.. seealso:: :func:`os.path.dirname`"""
-        return self.clone(self._contained.dirname())
+        return self._clone_normalized(self._contained.dirname())
 
     def open(self, *args, **kwargs):
         """.. seealso:: :func:`io.open`"""
         return io.open(str(self), *args, **kwargs)
 
-    def glob(self, pattern) -> Iterable[Path]:
-        """.. seealso:: :meth:`pathlib.Path.glob`"""
-        paths = self.to_pathlib.glob(pattern)
-        return (self.clone(g) for g in paths)
+    def glob(
+        self, pattern: str, *patterns: str, exclude: Iterable[str] = ()
+    ) -> Iterable[Path]:
+        """
+        Iterate all paths in this directory that match any of the given patterns, like :meth:`pathlib.Path.glob`.
+        All patterns are matched in a single traversal.
+
+        :param pattern: the relative pattern to match
+        :param patterns: further patterns to match
+        :param exclude: the patterns of paths, including directories with all their contents, that are skipped
+
+        .. seealso:: :mod:`mutapath.globbing`
+        """
+        return globbing.glob(self, (pattern,) + patterns, exclude)
+
+    def rglob(
+        self, pattern: str, *patterns: str, exclude: Iterable[str] = ()
+    ) -> Iterable[Path]:
+        """
+        Like :meth:`glob`, but with the patterns matched in this directory and all subdirectories.
+
+        .. seealso:: :meth:`pathlib.Path.rglob`
+        """
+        patterns = (pattern,) + patterns
+        return globbing.glob(
+            self, [f"{globbing.RECURSIVE}/{p}" for p in patterns], exclude
+        )
+
+    def scan(
+        self,
+        recursive: bool = False,
+        prune: Optional[Callable[[Path], bool]] = None,
+        errors="strict",
+    ) -> Iterable[Path]:
+        """
+        Iterate the children of this directory, or all its descendants if recursive, using :func:`os.scandir`.
+        The directory entries decide about the recursion, but the yielded paths do not keep them.
+
+        :param recursive: if the subdirectories are scanned, too
+        :param prune: a callable that returns True for directories whose contents are skipped
+        :param errors: the handling of errors, see :meth:`path.Path.walk`
+
+        .. seealso:: :mod:`mutapath.scanning`
+        """
+        if recursive:
+            return scanning.walk(self, errors=errors, prune=prune)
+        return scanning.scandir(self, errors)
+
+    def listdir(self, match=None) -> List[Path]:
+        """.. seealso:: :meth:`path.Path.listdir`"""
+        return self._listing(match)
+
+    def dirs(self, match=None) -> List[Path]:
+        """.. seealso:: :meth:`path.Path.dirs`"""
+        return self._listing(match, scanning.DIRS)
+
+    def files(self, match=None) -> List[Path]:
+        """.. seealso:: :meth:`path.Path.files`"""
+        return self._listing(match, scanning.FILES)
+
+    def _listing(self, match, kind: Optional[str] = None) -> List[Path]:
+        match = matchers.load(match)
+        return [child for child in scanning.scandir(self, kind=kind) if match(child)]
+
+    def walk(
+        self,
+        match=None,
+        errors="strict",
+        prune: Optional[Callable[[Path], bool]] = None,
+    ) -> Iterable[Path]:
+        """
+        Iterate all files and directories below this directory, just like :meth:`path.Path.walk`,
+        but on top of :func:`os.scandir` and with the optional pruning of directories.
+
+        :param prune: a callable that returns True for directories whose contents are skipped
+        """
+        return scanning.walk(self, match, errors, prune)
+
+    def walk_parallel(
+        self,
+        workers: int = 4,
+        ordered: bool = False,
+        max_queue: int = 64,
+        match=None,
+        errors="strict",
+        prune: Optional[Callable[[Path], bool]] = None,
+    ) -> Iterable[Path]:
+        """
+        Iterate all files and directories below this directory like :meth:`walk`,
+        but read the directories on a bounded pool of worker threads.
+
+        :param workers: the number of worker threads
+        :param ordered: if the paths are yielded in the same order as :meth:`walk`
+        :param max_queue: the maximum number of directory listings that are read ahead of the consumer
+
+        .. seealso:: :func:`mutapath.scanning.walk_parallel`
+        """
+        return scanning.walk_parallel(
+            self, workers, ordered, max_queue, match, errors, prune
+        )
+
+    def walkdirs(
+        self,
+        match=None,
+        errors="strict",
+        prune: Optional[Callable[[Path], bool]] = None,
+    ) -> Iterable[Path]:
+        """.. seealso:: :meth:`walk`, :meth:`path.Path.walkdirs`"""
+        return scanning.walk(self, match, errors, prune, scanning.DIRS)
+
+    def walkfiles(
+        self,
+        match=None,
+        errors="strict",
+        prune: Optional[Callable[[Path], bool]] = None,
+    ) -> Iterable[Path]:
+        """.. seealso:: :meth:`walk`, :meth:`path.Path.walkfiles`"""
+        return scanning.walk(self, match, errors, prune, scanning.FILES)
+
+    def isfile(self) -> bool:
+        """.. seealso:: :func:`os.path.isfile`"""
+        return statcache.isfile(self._contained)
+
+    def isdir(self) -> bool:
+        """.. seealso:: :func:`os.path.isdir`"""
+        return statcache.isdir(self._contained)
+
+    def islink(self) -> bool:
+        """.. seealso:: :func:`os.path.islink`"""
+        return statcache.islink(self._contained)
+
+    is_file = isfile
+    is_dir = isdir
+    is_symlink = islink
+
+    def stat(self) -> os.stat_result:
+        """.. seealso:: :func:`os.stat`"""
+        return statcache.stat(self._contained)
+
+    def lstat(self) -> os.stat_result:
+        """.. seealso:: :func:`os.lstat`"""
+        return statcache.stat(self._contained, follow_symlinks=False)
+
+    def exists(self) -> bool:
+        """.. seealso:: :func:`os.path.exists`"""
+        return statcache.exists(self._contained)
+
+    def getsize(self) -> int:
+        """.. seealso:: :func:`os.path.getsize`"""
+        return self.stat().st_size
+
+    def getmtime(self) -> float:
+        """.. seealso:: :func:`os.path.getmtime`"""
+        return self.stat().st_mtime
+
+    size = property(getsize)
+    mtime = property(getmtime)
 
     def startfile(self):
         """
@@ -455,36 +691,150 @@ class Path(SerializableType):
                     args = ["open", secure_path]
                 else:
                     args = ["xdg-open", secure_path]
+                import subprocess
+
                 subprocess.call(args, shell=False)
 
-    @cached_property
-    def text(self):
+    @property
+    def text(self) -> str:
         """
         Read the file as text stream and return its content.
-        This property caches the returned value.
-        Clone this object to have a new path with a cleared cache or simply use :meth:`~pathlib.Path.read_text`.
+        The content is shared by all paths of this file in a bounded cache and read again once the file changes,
+        see :mod:`mutapath.contentcache`.
+        With the kernel lock backend, the file is read under its :attr:`read_lock` if its lock file exists,
+        waiting for writers at most :attr:`~mutapath.PathDefaults.read_timeout` (one second by default).
+
+        :raises PathException: if a writer holds the lock for longer than the read timeout
 
         .. seealso:: :meth:`pathlib.Path.read_text`
         """
-        return self.read_text()
+        with self._reading():
+            return contentcache.read_text(self._contained)
 
-    @cached_property
-    def bytes(self):
+    @property
+    def bytes(self) -> bytes:
         """
         Read the file as bytes stream and return its content.
-        This property caches the returned value.
-        Clone this object to have a new path with a cleared cache or simply use :meth:`~pathlib.Path.read_bytes`.
+        The content is shared by all paths of this file in a bounded cache and read again once the file changes,
+        see :mod:`mutapath.contentcache`.
+        With the kernel lock backend, the file is read under its :attr:`read_lock` if its lock file exists,
+        waiting for writers at most :attr:`~mutapath.PathDefaults.read_timeout` (one second by default).
+
+        :raises PathException: if a writer holds the lock for longer than the read timeout
 
         .. seealso:: :meth:`pathlib.Path.read_bytes`
         """
-        return self.read_bytes()
+        with self._reading():
+            return contentcache.read_bytes(self._contained)
 
-    @cached_property
+    @contextmanager
+    def _reading(self):
+        """
+        Hold the shared lock of this file while reading it, if shared locks are supported.
+        The lock file is not created by reading, so files without a lock file (i.e., that were never locked
+        by a writer) or with an unreadable one are read without a lock.
+        """
+        read_lock = self.read_lock
+        if not getattr(read_lock, "shared", False):
+            yield
+            return
+
+        import filelock
+
+        try:
+            read_lock.acquire(current_defaults().read_timeout, create=False)
+        except filelock.Timeout as t:
+            raise PathException(
+                f"Reading {self._contained} failed because the file could not be locked."
+            ) from t
+        except FileNotFoundError:
+            yield
+            return
+        except OSError as e:
+            if e.errno not in _UNWRITABLE:
+                raise
+            yield
+            return
+        try:
+            yield
+        finally:
+            read_lock.release()
+
+    def iter_chunks(
+        self, size: int = _CHUNK_SIZE, offset: int = 0
+    ) -> Iterator[memoryview]:
+        """
+        Stream the file in chunks of the given size, starting at the given offset.
+        The chunks are read into one preallocated buffer without intermediate copies.
+        Each chunk is a read-only view of that buffer and is only valid until the next chunk is read;
+        use ``bytes(chunk)`` to keep it.
+
+        :param size: the maximum size of each chunk in bytes
+        :param offset: the position in bytes to start reading at
+
+        :Example:
+        >>> with Path('/home/doe/copy.bin').open("wb") as target:
+        ...     for chunk in Path('/home/doe/data.bin').iter_chunks():
+        ...         target.write(chunk)
+        """
+        if size <= 0:
+            raise ValueError(f"Invalid chunk size: {size}")
+        view = memoryview(bytearray(size))
+        with open(self._contained, "rb", buffering=0) as file:
+            if offset:
+                file.seek(offset)
+            while True:
+                read = file.readinto(view)
+                if not read:
+                    return
+                yield view[:read].toreadonly()
+
+    def iter_lines(
+        self,
+        buffer_size: int = _CHUNK_SIZE,
+        encoding: Optional[str] = None,
+        errors: Optional[str] = None,
+        retain: bool = True,
+    ) -> Iterator[str]:
+        """
+        Stream the lines of the text file, reading it through a buffer of the given size.
+
+        :param buffer_size: the size of the read buffer in bytes
+        :param encoding: the encoding of the file, see :func:`open`
+        :param errors: the handling of decoding errors, see :func:`open`
+        :param retain: if the line endings are kept
+
+        .. seealso:: :meth:`path.Path.lines`
+        """
+        with open(
+            self._contained, encoding=encoding, errors=errors, buffering=buffer_size
+        ) as file:
+            for line in file:
+                yield line if retain else line.rstrip("\n")
+
+    def checksum(self, algorithm: str = "sha256", size: int = _CHUNK_SIZE) -> str:
+        """
+        Compute the hexadecimal digest of the file, holding no more than one chunk of it in memory.
+
+        :param algorithm: the name of the hash algorithm, see :func:`hashlib.new`
+        :param size: the size of the chunks in bytes
+
+        .. seealso:: :meth:`path.Path.read_hexhash`
+        """
+        import hashlib
+
+        digest = hashlib.new(algorithm)
+        for chunk in self.iter_chunks(size):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    @extra_property
     def lock(self) -> filelock.BaseFileLock:
         """
         Generate a cached file locker for this file with the additional suffix '.lock'.
         If this path refers not to an existing file or to an existing folder,
         a dummy lock is returned that does not do anything.
+        The lock uses the backend of this process (see :attr:`~mutapath.PathDefaults.lock_backend`).
 
         Once this path is modified (cloning != modifying), the lock is released and regenerated for the new path.
 
@@ -493,12 +843,49 @@ class Path(SerializableType):
         >>> with my_path.lock:
         ...     my_path.write_text("I can write")
 
-        .. seealso:: :class:`~filelock.SoftFileLock`, :class:`~mutapath.lock_dummy.DummyFileLock`
+        .. seealso:: :mod:`mutapath.locking`, :class:`~mutapath.lock_dummy.DummyFileLock`, :attr:`read_lock`
         """
+        from mutapath.lock_dummy import DummyFileLock
+
         lock_file = self.with_suffix(self.suffix + ".lock")
         if not self.isfile():
             return DummyFileLock(lock_file)
-        return SoftFileLock(lock_file)
+        return locking.create(lock_file)
+
+    @extra_property
+    def read_lock(self) -> filelock.BaseFileLock:
+        """
+        Generate a cached shared file locker for this file, which uses the same lock file as :attr:`lock`.
+        Readers holding it only exclude writers holding :attr:`write_lock` but not each other,
+        across threads and processes.
+        Shared locks require the kernel lock backend (see :attr:`~mutapath.PathDefaults.lock_backend`)
+        on a POSIX system, otherwise this lock is as exclusive as :attr:`lock`.
+
+        A thread that already holds a lock of this file gets the shared lock immediately,
+        but an exclusive lock can not be acquired while holding the shared lock.
+
+        :Example:
+        >>> my_path = Path('/home/doe/folder/data.bin')
+        >>> with my_path.read_lock:
+        ...     my_path.checksum()
+
+        .. seealso:: :class:`mutapath.locking.FlockFileLock`
+        """
+        from mutapath.lock_dummy import DummyFileLock
+
+        lock_file = self.with_suffix(self.suffix + ".lock")
+        if not self.isfile():
+            return DummyFileLock(lock_file)
+        return locking.create(lock_file, shared=True)
+
+    @property
+    def write_lock(self) -> filelock.BaseFileLock:
+        """
+        Get the exclusive file locker for this file, which is the same as :attr:`lock`.
+
+        .. seealso:: :attr:`read_lock`
+        """
+        return self.lock
 
     @contextmanager
     def mutate(self):
@@ -510,9 +897,129 @@ class Path(SerializableType):
         ...     mut.name = "top"
         Path('/home/doe/folder/top')
         """
-        self.__mutable = mutapath.MutaPath(self)
-        yield self.__mutable
-        self._contained = self.__mutable._contained
+        mutable = mutapath.MutaPath(self)
+        yield mutable
+        self._contained = mutable._contained
+
+    @contextmanager
+    def mmap(self, mode: str = "r", lock: bool = False, timeout: float = 1):
+        """
+        Map the file into memory instead of reading it into the heap.
+        Pages are only loaded once they are accessed, so that large files can be sliced without copying them.
+        Empty files are mapped to an empty memoryview.
+        All memoryviews of the mapping have to be released before the context is closed.
+
+        :param mode: 'r' for a read-only mapping, 'r+' for a mapping that writes through to the file,
+            or 'c' for a copy-on-write mapping whose changes are not written to the file
+        :param lock: if the file should be locked (see :attr:`lock`) as long as this context is open
+        :param timeout: the timeout in seconds how long the lock file should be acquired
+        :raises PathException: if the file could not be locked
+
+        :Example:
+        >>> with Path('/home/doe/data.bin').mmap(lock=True) as data:
+        ...     header = data[:16]
+
+        .. seealso:: :class:`mmap.mmap`
+        """
+        import mmap
+
+        access = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+        if mode not in access:
+            raise ValueError(f"Invalid mapping mode: {mode!r}")
+
+        if lock:
+            import filelock
+
+            try:
+                self.lock.acquire(timeout)
+            except filelock.Timeout as t:
+                raise PathException(
+                    f"Mapping {self._contained} failed because the file could not be locked."
+                ) from t
+        try:
+            with open(self._contained, "r+b" if mode == "r+" else "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    yield memoryview(b"")
+                    return
+                with mmap.mmap(file.fileno(), 0, access=access[mode]) as mapped:
+                    yield mapped
+        finally:
+            if mode == "r+":
+                statcache.invalidate(self._contained)
+                contentcache.invalidate(self._contained)
+            if lock:
+                self.lock.release()
+
+    @contextmanager
+    def writing(
+        self,
+        mode: str = "wb",
+        fsync: Union[bool, fileops.FsyncBatch] = True,
+        lock: bool = True,
+        timeout: float = 1,
+        **kwargs,
+    ):
+        """
+        Create an atomic writing context for this file.
+        The content is written to a temporary file in the same directory, which replaces this file on exit.
+        Thus, readers see either the old or the new content, and the file remains unchanged if writing fails.
+
+        :param mode: 'wb' to write bytes, or 'w' to write text
+        :param fsync: if the temporary file and the directory are flushed to the disk before and after the replacement,
+            respectively, or a :class:`~mutapath.fileops.FsyncBatch` that flushes and replaces its files together
+        :param lock: if the file should be locked (see :attr:`lock`) as long as this context is open,
+            or until the batch is committed
+        :param timeout: the timeout in seconds how long the lock file should be acquired
+        :param kwargs: the arguments of :func:`open` (e.g., encoding)
+        :raises PathException: if the file could not be locked
+
+        :Example:
+        >>> with Path('/home/doe/config.json').writing("w", encoding="utf-8") as stream:
+        ...     json.dump(config, stream)
+        """
+        import filelock
+        from mutapath.lock_dummy import DummyFileLock
+
+        if mode not in ("w", "wb"):
+            raise ValueError(f"Invalid writing mode: {mode!r}")
+
+        release = None
+        if lock:
+            file_lock = self.lock
+            if isinstance(file_lock, DummyFileLock):
+                file_lock = locking.create(file_lock.lock_file)
+            try:
+                file_lock.acquire(timeout)
+            except filelock.Timeout as t:
+                raise PathException(
+                    f"Writing {self._contained} failed because the file could not be locked."
+                ) from t
+            release = file_lock.release
+
+        try:
+            fd, temporary = fileops.temporary_sibling(self._contained)
+            try:
+                with open(fd, mode, **kwargs) as stream:
+                    yield stream
+                    stream.flush()
+                    if fsync is True:
+                        os.fsync(stream.fileno())
+                if isinstance(fsync, fileops.FsyncBatch):
+                    fsync.add(temporary, self._contained, release)
+                    release = None
+                    return
+                os.replace(temporary, self._contained)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(temporary)
+                raise
+            finally:
+                statcache.invalidate(self._contained)
+            if fsync:
+                fileops.fsync_directory(self._contained.parent)
+        finally:
+            if release is not None:
+                release()
 
     @contextmanager
     def _op_context(
@@ -524,6 +1031,7 @@ class Path(SerializableType):
             [Union[os.PathLike, path.Path], Union[os.PathLike, path.Path]],
             Union[str, path.Path],
         ],
+        shared: bool = False,
     ):
         """
         Acquire a file mutation context that is bound to a file.
@@ -532,27 +1040,33 @@ class Path(SerializableType):
         :param timeout: the timeout in seconds how long the lock file should be acquired
         :param lock: if the source file should be locked as long as this context is open
         :param operation: the callable operation that gets the source and target file passed as argument
+        :param shared: if the source file is only read, so that its :attr:`read_lock` suffices if it is really shared
 
         """
-        if not self._contained.exists():
+        import filelock
+
+        if not statcache.exists(self._contained):
             raise PathException(
                 f"{name.capitalize()} {self._contained} failed because the file does not exist."
             )
 
+        source_lock = self.lock
+        if shared and getattr(self.read_lock, "shared", False):
+            source_lock = self.read_lock
         try:
             if lock:
                 try:
-                    self.lock.acquire(timeout)
+                    source_lock.acquire(timeout)
                 except filelock.Timeout as t:
                     raise PathException(
                         f"{name.capitalize()} {self._contained} failed because the file could not be locked."
                     ) from t
 
-            self.__mutable = mutapath.MutaPath(self)
-            yield self.__mutable
+            mutable = mutapath.MutaPath(self)
+            yield mutable
 
             current_file = self._contained
-            target_file = self.__mutable._contained
+            target_file = mutable._contained
 
             try:
                 current_file = path.Path(operation(current_file, target_file))
@@ -563,7 +1077,10 @@ class Path(SerializableType):
                     f"Falling back to original value {self._contained}."
                 ) from e
 
-            if not current_file.exists():
+            finally:
+                statcache.invalidate(self._contained, target_file, subtree=True)
+
+            if not statcache.exists(current_file):
                 raise PathException(
                     f"{name.capitalize()} to {current_file.normpath()} failed because it can not be found. "
                     f"Falling back to original value {self._contained}."
@@ -572,8 +1089,8 @@ class Path(SerializableType):
             self._contained = current_file
 
         finally:
-            if self.lock.is_locked:
-                self.lock.release()
+            if source_lock.is_locked:
+                source_lock.release()
 
     def renaming(
         self, lock=True, timeout=1, method: Callable[[str, str], None] = os.rename
@@ -586,41 +1103,57 @@ class Path(SerializableType):
         :param lock: if the source file should be locked as long as this context is open
         :param method: an alternative method that renames the path (e.g., os.renames)
 
+        With the default method, the path is renamed atomically without replacing an existing target
+        (see :func:`mutapath.fileops.rename_noreplace`).
+        The target is locked during the renaming as well, waiting for it at most the given timeout.
+
         :Example:
         >>> with Path('/home/doe/folder/a.txt').renaming() as mut:
         ...     mut.stem = "b"
         Path('/home/doe/folder/b.txt')
         """
 
+        import filelock
+
+        def exclusive_rename(cls: path.Path, target: path.Path):
+            return fileops.rename_noreplace(cls, target)
+
         def checked_rename(cls: path.Path, target: path.Path):
+            if target.exists():
+                raise FileExistsError(f"{target.name} already exists.")
+            method(cls, target)
+            return target
+
+        rename = exclusive_rename if method is os.rename else checked_rename
+
+        def locked_rename(cls: path.Path, target: path.Path):
+            if not lock or not cls.isfile():
+                return rename(cls, target)
             target_lock_file = target.with_suffix(target.ext + ".lock")
-            target_lock = SoftFileLock(target_lock_file)
-            if lock and cls.isfile():
-                try:
-                    target_lock.acquire(timeout)
-                except filelock.Timeout as t:
-                    raise PathException(
-                        f"Renaming {self._contained} failed because the target {target} could not be locked."
-                    ) from t
+            target_lock = locking.create(target_lock_file)
             try:
-                if target.exists():
-                    raise FileExistsError(f"{target.name} already exists.")
-                method(cls, target)
+                target_lock.acquire(timeout)
+            except filelock.Timeout as t:
+                raise PathException(
+                    f"Renaming {self._contained} failed because the target {target} could not be locked."
+                ) from t
+            try:
+                return rename(cls, target)
             finally:
                 target_lock.release()
-                with contextlib.suppress(PermissionError):
-                    target_lock_file.remove_p()
-            return target
+                if not isinstance(target_lock, locking.FlockFileLock):
+                    with contextlib.suppress(PermissionError):
+                        target_lock_file.remove_p()
 
         return self._op_context(
-            "Renaming", lock=lock, timeout=timeout, operation=checked_rename
+            "Renaming", lock=lock, timeout=timeout, operation=locked_rename
         )
 
     def moving(
         self,
         lock=True,
         timeout=1,
-        method: Callable[[os.PathLike, os.PathLike], str] = shutil.move,
+        method: Optional[Callable[[os.PathLike, os.PathLike], str]] = None,
     ):
         """
         Create a moving context for this immutable path.
@@ -629,28 +1162,140 @@ class Path(SerializableType):
         :param timeout: the timeout in seconds how long the lock file should be acquired
         :param lock: if the source file should be locked as long as this context is open
         :param method: an alternative method that moves the path and returns the new path
+            (default: shutil.move, e.g., :func:`mutapath.fileops.move`)
 
         :Example:
         >>> with Path('/home/doe/folder/a.txt').moving() as mut:
         ...     mut.stem = "b"
         Path('/home/doe/folder/b.txt')
         """
+        if method is None:
+            import shutil
+
+            method = shutil.move
         return self._op_context("Moving", operation=method, lock=lock, timeout=timeout)
 
     def copying(
-        self, lock=True, timeout=1, method: Callable[[Path, Path], Path] = shutil.copy
+        self,
+        lock=True,
+        timeout=1,
+        method: Optional[Callable[[Path, Path], Path]] = None,
     ):
         """
         Create a copying context for this immutable path.
         The external value is only changed if the copying succeeds.
 
         :param timeout: the timeout in seconds how long the lock file should be acquired
-        :param lock: if the source file should be locked as long as this context is open
-        :param method: an alternative method that copies the path and returns the new path (e.g., shutil.copy2)
+        :param lock: if the source file should be locked as long as this context is open,
+            with its :attr:`read_lock` if shared locks are supported and otherwise with its :attr:`lock`
+        :param method: an alternative method that copies the path and returns the new path
+            (default: shutil.copy, e.g., shutil.copy2 or :func:`mutapath.fileops.copy`)
 
         :Example:
         >>> with Path('/home/doe/folder/a.txt').copying() as mut:
         ...     mut.stem = "b"
         Path('/home/doe/folder/b.txt')
         """
-        return self._op_context("Copying", operation=method, lock=lock, timeout=timeout)
+        if method is None:
+            import shutil
+
+            method = shutil.copy
+        return self._op_context(
+            "Copying", operation=method, lock=lock, timeout=timeout, shared=True
+        )
+
+    async def aread_text(self, *args, **kwargs) -> str:
+        """Awaitable counterpart of :meth:`~pathlib.Path.read_text`, see :mod:`mutapath.aio`."""
+        from mutapath import aio
+
+        return await aio.run(self.read_text, *args, **kwargs)
+
+    async def aread_bytes(self) -> bytes:
+        """Awaitable counterpart of :meth:`~pathlib.Path.read_bytes`, see :mod:`mutapath.aio`."""
+        from mutapath import aio
+
+        return await aio.run(self.read_bytes)
+
+    async def awrite_text(self, *args, **kwargs):
+        """Awaitable counterpart of :meth:`~path.Path.write_text`, see :mod:`mutapath.aio`."""
+        from mutapath import aio
+
+        return await aio.run(self.write_text, *args, **kwargs)
+
+    async def awrite_bytes(self, *args, **kwargs):
+        """Awaitable counterpart of :meth:`~path.Path.write_bytes`, see :mod:`mutapath.aio`."""
+        from mutapath import aio
+
+        return await aio.run(self.write_bytes, *args, **kwargs)
+
+    async def aexists(self) -> bool:
+        """Awaitable counterpart of :meth:`~path.Path.exists`, see :mod:`mutapath.aio`."""
+        from mutapath import aio
+
+        return await aio.run(self.exists)
+
+    async def astat(self) -> os.stat_result:
+        """Awaitable counterpart of :meth:`stat`, see :mod:`mutapath.aio`."""
+        from mutapath import aio
+
+        return await aio.run(self.stat)
+
+    async def acopy(self, *args, **kwargs):
+        """Awaitable counterpart of :meth:`~path.Path.copy`, see :mod:`mutapath.aio`."""
+        from mutapath import aio
+
+        return await aio.run(self.copy, *args, **kwargs)
+
+    async def aiterdir(self, batch_size: int = 256) -> AsyncIterator[Path]:
+        """
+        Asynchronously iterate the children of this directory like :meth:`scan`.
+
+        :param batch_size: the number of children that are read at once on the executor of :mod:`mutapath.aio`
+        """
+        from mutapath import aio
+
+        async for child in aio.iterate(scanning.scandir(self), batch_size):
+            yield child
+
+    def arenaming(self, *args, **kwargs) -> aio.OperationContext:
+        """
+        Asynchronous counterpart of :meth:`renaming`.
+
+        :Example:
+        >>> async with Path('/home/doe/folder/a.txt').arenaming() as mut:
+        ...     mut.stem = "b"
+        """
+        from mutapath import aio
+
+        return aio.OperationContext(self.renaming(*args, **kwargs))
+
+    def amoving(self, *args, **kwargs) -> aio.OperationContext:
+        """Asynchronous counterpart of :meth:`moving`, see :meth:`arenaming`."""
+        from mutapath import aio
+
+        return aio.OperationContext(self.moving(*args, **kwargs))
+
+    def acopying(self, *args, **kwargs) -> aio.OperationContext:
+        """Asynchronous counterpart of :meth:`copying`, see :meth:`arenaming`."""
+        from mutapath import aio
+
+        return aio.OperationContext(self.copying(*args, **kwargs))
+
+
+def sorted_paths(paths: Iterable, reverse: bool = False) -> List:
+    """
+    Sort the given paths by their components with plain tuple comparisons.
+    The components are computed once per element, but not kept on the paths after sorting.
+    Elements that are no :class:`Path` are converted for comparison only.
+
+    :param paths: the paths to sort
+    :param reverse: if the paths should be sorted in descending order
+    :return: a new sorted list of the given paths
+    """
+    return sorted(paths, key=_sort_key, reverse=reverse)
+
+
+def _sort_key(input_path) -> Tuple[str, ...]:
+    if not isinstance(input_path, Path):
+        input_path = Path(input_path)
+    return Path._components.compute(input_path)
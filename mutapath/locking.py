@@ -0,0 +1,322 @@
+"""
+Backends of the file locks of :class:`~mutapath.Path` (see :attr:`~mutapath.Path.lock`).
+
+The backend is selected with :func:`set_backend` or :attr:`~mutapath.PathDefaults.lock_backend`.
+Unlike the other defaults, it applies to the whole process, as all threads have to agree on the kind of lock
+of a lock file (e.g., a soft lock would neither respect a kernel lock nor keep its lock file).
+For the same reason, all processes sharing lock files should use the same backend.
+
+* ``"soft"`` (default) uses :class:`filelock.SoftFileLock`, which holds the lock as long as the lock file exists.
+  It works on any file system, but waiting polls for the lock file and crashed processes leave it behind.
+* ``"kernel"`` uses :class:`FlockFileLock`, a lock of the kernel on an open descriptor of the lock file.
+  The lock is released once the holding process dies.
+  Only waiting without a timeout (i.e., a negative one) blocks in the kernel.
+  Waiting with a finite timeout, which all operations of :class:`~mutapath.Path` use by default,
+  still polls with a non-blocking lock, though without touching the lock file in between.
+  The lock file is deleted by the last holder before it releases the lock,
+  and concurrent waiters retry on a new lock file once they notice that theirs has been deleted.
+  Only crashed processes leave their lock files behind, which are not held anymore, though.
+  It also supports shared locks (see :attr:`~mutapath.Path.read_lock`),
+  so that readers only exclude writers but not each other.
+
+:Example:
+>>> PathDefaults().lock_backend = "kernel"
+>>> with Path('/home/doe/data.bin').lock:
+...     pass
+"""
+import contextlib
+import os
+import threading
+import time
+from typing import Optional, Union
+
+SOFT = "soft"
+KERNEL = "kernel"
+BACKENDS = (SOFT, KERNEL)
+
+PathLike = Union[str, os.PathLike]
+
+_backend = SOFT
+
+
+def get_backend() -> str:
+    """Get the lock backend of this process, either 'soft' or 'kernel'."""
+    return _backend
+
+
+def set_backend(backend: str):
+    """
+    Set the lock backend of this process, which is used for all locks created afterwards.
+
+    :param backend: either 'soft' or 'kernel'
+    :raises ValueError: if the backend is unknown
+    """
+    global _backend
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown lock backend {backend!r}, expected one of {BACKENDS}"
+        )
+    _backend = backend
+
+
+def _flock(fd: int, operation: int):
+    import fcntl
+
+    fcntl.flock(fd, operation)
+
+
+_MAX_DELAY = 0.05
+
+_held = threading.local()
+
+
+def _holdings() -> dict:
+    """Get the number of locks that the current thread holds per lock file, identified by its device and inode."""
+    holdings = getattr(_held, "files", None)
+    if holdings is None:
+        holdings = _held.files = dict()
+    return holdings
+
+
+def _lock_within(fd: int, operation: int, timeout: float, max_delay: float) -> bool:
+    """
+    Retry the non-blocking lock of the given descriptor until the timeout,
+    backing off exponentially from a millisecond up to the given maximum delay.
+    """
+    import fcntl
+
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+        try:
+            _flock(fd, operation | fcntl.LOCK_NB)
+        except BlockingIOError:
+            continue
+        return True
+
+
+class FlockFileLock:
+    """
+    A lock of the kernel (see :func:`fcntl.flock`) on an open descriptor of the lock file.
+
+    Its interface follows :class:`filelock.BaseFileLock`.
+    The lock is reentrant and, like the locks of filelock, each thread holds it separately.
+    A shared lock excludes only exclusive locks of the same lock file.
+    If the current thread already holds another lock of the same lock file, a shared lock rides on it
+    instead of waiting for it, which is why it must not be released before the shared lock.
+    Upgrading a shared lock to an exclusive one is not supported, as the exclusive lock would wait for the shared one.
+    Infinite timeouts block the acquiring thread in the kernel.
+    Finite timeouts retry a non-blocking lock with an exponential backoff until they are reached,
+    as a blocking :func:`fcntl.flock` can only be interrupted by a signal.
+    Waiting on a helper thread instead would leave that thread blocked after the timeout
+    until the holder releases the lock, which might never happen.
+    """
+
+    __slots__ = ("lock_file", "timeout", "shared", "_local")
+
+    def __init__(self, lock_file: PathLike, timeout: float = -1, shared: bool = False):
+        self.lock_file = os.fspath(lock_file)
+        self.timeout = timeout
+        self.shared = shared
+        self._local = threading.local()
+
+    def __repr__(self):
+        shared = ", shared=True" if self.shared else ""
+        return f"{type(self).__name__}({self.lock_file!r}{shared})"
+
+    @property
+    def is_locked(self) -> bool:
+        """Return True if the current thread holds this lock."""
+        return self.lock_counter > 0
+
+    @property
+    def lock_counter(self) -> int:
+        """Get the number of nested acquisitions of the current thread."""
+        return getattr(self._local, "counter", 0)
+
+    def acquire(
+        self,
+        timeout: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        create: bool = True,
+        **_,
+    ):
+        """
+        Acquire the lock, waiting at most the given timeout.
+
+        :param timeout: the timeout in seconds, a negative value to wait forever, or None for the default timeout
+        :param poll_interval: the maximum delay in seconds between retries with a finite timeout (default: 0.05)
+        :param create: if the lock file is created if it does not exist yet
+        :raises filelock.Timeout: if the lock could not be acquired in time
+        :raises FileNotFoundError: if the lock file does not exist and should not be created
+        """
+        import fcntl
+
+        local = self._local
+        if self.is_locked:
+            local.counter += 1
+            return self
+
+        holdings = _holdings()
+        if self.shared and holdings:
+            with contextlib.suppress(FileNotFoundError):
+                current = os.stat(self.lock_file)
+                key = current.st_dev, current.st_ino
+                if key in holdings:
+                    holdings[key] += 1
+                    local.fd, local.key, local.counter = None, key, 1
+                    return self
+
+        if timeout is None:
+            timeout = self.timeout
+        operation = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        deadline = None if timeout < 0 else time.monotonic() + timeout
+        flags = os.O_RDWR | os.O_CREAT if create else os.O_RDONLY
+        while True:
+            fd = os.open(self.lock_file, flags, 0o644)
+            try:
+                try:
+                    _flock(fd, operation | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    if deadline is None:
+                        _flock(fd, operation)
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not _lock_within(
+                            fd, operation, remaining, poll_interval or _MAX_DELAY
+                        ):
+                            from filelock import Timeout
+
+                            raise Timeout(self.lock_file)
+                key = _same_file(fd, self.lock_file)
+                if key is not None:
+                    holdings[key] = holdings.get(key, 0) + 1
+                    local.fd, local.key, local.counter = fd, key, 1
+                    return self
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+
+    def release(self, force: bool = False):
+        """
+        Release the lock once all nested acquisitions of the current thread have been released.
+        The lock file is deleted while it is still locked exclusively, unless anyone else holds a lock of it.
+
+        :param force: if the lock is released regardless of the nested acquisitions
+        """
+        local = self._local
+        if not self.is_locked:
+            return
+        local.counter = 0 if force else local.counter - 1
+        if local.counter > 0:
+            return
+        key = local.key
+        holdings = _holdings()
+        holdings[key] -= 1
+        last = not holdings[key]
+        if last:
+            del holdings[key]
+        fd, local.fd = local.fd, None
+        if fd is None:
+            return
+        try:
+            if last:
+                self._unlink(fd)
+        finally:
+            os.close(fd)
+
+    def _unlink(self, fd: int):
+        """
+        Delete the lock file if the given descriptor holds it exclusively or can lock it exclusively right away.
+        Waiters on the deleted file notice that it has been replaced and retry on a new one.
+        """
+        import fcntl
+
+        if self.shared:
+            try:
+                _flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return
+        if _same_file(fd, self.lock_file) is not None:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.lock_file)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def _same_file(fd: int, lock_file: str) -> Optional[tuple]:
+    """
+    Check if the locked descriptor still refers to the lock file, which might have been replaced meanwhile.
+    Return its device and inode if it does, otherwise None.
+    """
+    try:
+        current = os.stat(lock_file)
+    except FileNotFoundError:
+        return None
+    locked = os.fstat(fd)
+    key = locked.st_dev, locked.st_ino
+    return key if key == (current.st_dev, current.st_ino) else None
+
+
+def create(lock_file: PathLike, backend: Optional[str] = None, shared: bool = False):
+    """
+    Create a lock of the given lock file with the given backend.
+    Shared locks are only supported by the kernel backend on POSIX systems, otherwise the lock is exclusive.
+
+    :param lock_file: the lock file
+    :param backend: the backend, or None for the backend of this process
+    :param shared: if the lock should be shared with other shared locks
+    """
+    if backend is None:
+        backend = _backend
+    if backend == KERNEL:
+        if os.name == "nt":
+            from filelock import WindowsFileLock
+
+            return WindowsFileLock(lock_file)
+        return FlockFileLock(lock_file, shared=shared)
+    from filelock import SoftFileLock
+
+    return SoftFileLock(lock_file)
+
+
+def is_held(lock_file: PathLike, backend: Optional[str] = None) -> bool:
+    """
+    Check if the given lock file is locked by anyone.
+    For the kernel backend, lock files that are left without a lock on them are not held,
+    and neither are lock files with only shared locks on them.
+
+    :param lock_file: the lock file
+    :param backend: the backend, or None for the backend of this process
+    """
+    if not os.path.lexists(lock_file):
+        return False
+    if backend is None:
+        backend = _backend
+    if backend != KERNEL or os.name == "nt":
+        return True
+
+    import fcntl
+
+    try:
+        fd = os.open(lock_file, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        _flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+    return False
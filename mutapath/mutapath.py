@@ -6,12 +6,19 @@ from typing import Union, Optional
 import path
 
 import mutapath
+from mutapath import statcache
 from mutapath.decorator import mutable_path_wrapper
 
 
 @mutable_path_wrapper
 class MutaPath(mutapath.Path):
-    """Mutable Path"""
+    """
+    Mutable Path
+
+    In contrast to :class:`~mutapath.Path`, it keeps an instance dict, so arbitrary attributes can still be set.
+    """
+
+    __slots__ = () if mutapath.Path.__dictoffset__ else ("__dict__",)
 
     def __init__(
         self,
@@ -41,6 +48,10 @@ class MutaPath(mutapath.Path):
 
     def merge_tree(self, other, *args, **kwargs):
         """Move, merge and mutate this path to the given other path."""
-        self._contained.merge_tree(other, *args, **kwargs)
+        source = self._contained
+        try:
+            self._contained.merge_tree(other, *args, **kwargs)
+        finally:
+            statcache.invalidate(source, other, subtree=True)
         self._contained = other
         return self
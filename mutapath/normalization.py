@@ -0,0 +1,128 @@
+"""
+Normalization of raw path inputs into the contained representation of :class:`~mutapath.Path`.
+
+Every path construction normalizes its input.
+Applications that build the same paths over and over again can enable a bounded LRU cache
+that interns the normalized results, keyed on the raw input and the posix flag.
+
+:Example:
+>>> from mutapath import normalization
+>>> normalization.enable_cache(maxsize=4096)
+>>> normalization.cache_info()
+CacheInfo(hits=0, misses=0, maxsize=4096, currsize=0)
+"""
+import functools
+import os
+from typing import List, Optional
+
+import path
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def shorten_duplicates(input_path: str) -> str:
+    """Collapse duplicated (i.e., escaped) backslashes."""
+    return input_path.replace("\\\\", "\\")
+
+
+def posix_string(input_path: str) -> str:
+    """Convert the given path string to posix-like separators (i.e., '/')."""
+    return input_path.replace("\\\\", "\\").replace("\\", "/")
+
+
+def splitall(normalized: str, module=path.Path.module) -> List[str]:
+    """
+    Split the given normalized path string into its components.
+    The first component is the drive or root (i.e., an empty string for relative paths).
+
+    .. seealso:: :meth:`path.Path.splitall`
+    """
+    parts = []
+    loc = normalized
+    while loc != os.curdir and loc != os.pardir:
+        prev = loc
+        loc, child = module.split(prev)
+        if loc == prev:
+            break
+        parts.append(child)
+    parts.append(loc)
+    parts.reverse()
+    return parts
+
+
+def _normalize(contained: str, posix: bool) -> path.Path:
+    normalized = path.Path.module.normpath(contained)
+    if posix:
+        normalized = posix_string(normalized)
+    else:
+        normalized = shorten_duplicates(normalized)
+    return path.Path(normalized)
+
+
+def render(normalized: str, posix: bool) -> str:
+    """
+    Render the given normalized path as its string representation (i.e., what str() returns for a path).
+    Paths without backslashes are returned as they are.
+    """
+    if "\\" not in normalized:
+        return normalized
+    if posix:
+        return posix_string(normalized)
+    return shorten_duplicates(normalized)
+
+
+@functools.lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def canonical(contained: str, posix: bool) -> str:
+    """
+    Get the canonical string of a raw path input that decides about the equality of paths.
+    The results are always cached, independent of the optional normalization cache.
+    """
+    if not contained:
+        return ""
+    return render(_normalize(contained, posix), posix)
+
+
+_cached_normalize: Optional[functools._lru_cache_wrapper] = None
+normalize = _normalize
+
+
+def enable_cache(maxsize: int = DEFAULT_CACHE_SIZE):
+    """
+    Enable the normalization cache with the given bound of entries.
+    An already enabled cache is replaced and thereby cleared.
+
+    :param maxsize: the maximum number of cached normalizations
+    """
+    global _cached_normalize, normalize
+    _cached_normalize = functools.lru_cache(maxsize=maxsize)(_normalize)
+    normalize = _cached_normalize
+
+
+def disable_cache():
+    """Disable and drop the normalization cache."""
+    global _cached_normalize, normalize
+    _cached_normalize = None
+    normalize = _normalize
+
+
+def cache_enabled() -> bool:
+    """Return True if the normalization cache is enabled."""
+    return _cached_normalize is not None
+
+
+def cache_info() -> Optional[functools._CacheInfo]:
+    """
+    Get the hit and miss counters of the normalization cache.
+
+    :return: the cache statistics, or None if the cache is disabled
+    """
+    if _cached_normalize is None:
+        return None
+    return _cached_normalize.cache_info()
+
+
+def clear_cache():
+    """Clear all entries and counters of the normalization cache and the canonical strings."""
+    canonical.cache_clear()
+    if _cached_normalize is not None:
+        _cached_normalize.cache_clear()
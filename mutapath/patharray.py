@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import os
+import pathlib
+from typing import Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+import path
+
+import mutapath
+from mutapath import normalization
+from mutapath.defaults import current_defaults
+
+
+class PathArray(Sequence["mutapath.Path"]):
+    """
+    Compact array of many paths that share the same flags.
+
+    The paths are stored as normalized strings and transformed in batch,
+    without creating :class:`~mutapath.Path` objects for the intermediate results.
+    Path objects are only created once an element is accessed.
+
+    :Example:
+    >>> PathArray(["/A/B/a.txt", "/A/C/b.txt"]).with_suffix(".csv").with_base("/D", 1)
+    PathArray(['/D/B/a.csv', '/D/C/b.csv'])
+    """
+
+    __slots__ = ("_paths", "_prototype")
+
+    def __init__(
+        self,
+        paths: Iterable[Union[mutapath.Path, path.Path, pathlib.PurePath, str]] = (),
+        *,
+        posix: Optional[bool] = None,
+        string_repr: Optional[bool] = None,
+    ):
+        if posix is None or string_repr is None:
+            defaults = current_defaults()
+            if posix is None:
+                posix = defaults.posix
+            if string_repr is None:
+                string_repr = defaults.string_repr
+        self._prototype = mutapath.Path(posix=posix, string_repr=string_repr)
+        self._paths = [self._normalize(p) for p in paths]
+
+    def _normalize(self, input_path) -> str:
+        if isinstance(input_path, mutapath.Path):
+            if input_path.posix_enabled == self.posix_enabled:
+                return str.__str__(input_path._contained)
+            input_path = input_path._contained
+        elif isinstance(input_path, pathlib.PurePath):
+            input_path = str(input_path)
+        if not input_path:
+            return ""
+        return str.__str__(normalization.normalize(input_path, self.posix_enabled))
+
+    def _derive(self, paths: List[str]) -> PathArray:
+        derived = object.__new__(PathArray)
+        derived._prototype = self._prototype
+        derived._paths = paths
+        return derived
+
+    def _derive_normalized(self, paths: Iterable[str]) -> PathArray:
+        posix = self.posix_enabled
+        normalize = normalization.normalize
+        return self._derive(
+            [str.__str__(normalize(p, posix)) if p else "" for p in paths]
+        )
+
+    @classmethod
+    def from_numpy(cls, array, **kwargs) -> PathArray:
+        """
+        Create a path array from a NumPy string array.
+
+        :param array: the NumPy array of path strings
+        :param kwargs: the flags of the paths (i.e., posix, string_repr)
+        """
+        return cls(array.tolist(), **kwargs)
+
+    def to_numpy(self):
+        """
+        Export the normalized paths as NumPy unicode string array.
+        This requires the optional dependency numpy.
+        """
+        import numpy
+
+        return numpy.array(self._paths, dtype=str)
+
+    @property
+    def posix_enabled(self) -> bool:
+        """.. seealso:: :attr:`mutapath.Path.posix_enabled`"""
+        return self._prototype.posix_enabled
+
+    @property
+    def string_repr_enabled(self) -> bool:
+        """.. seealso:: :attr:`mutapath.Path.string_repr_enabled`"""
+        return self._prototype.string_repr_enabled
+
+    @property
+    def strings(self) -> List[str]:
+        """Get a copy of all normalized paths as strings."""
+        return list(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @overload
+    def __getitem__(self, item: int) -> mutapath.Path:
+        ...
+
+    @overload
+    def __getitem__(self, item: slice) -> PathArray:
+        ...
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._derive(self._paths[item])
+        return self._prototype._clone_normalized(path.Path(self._paths[item]))
+
+    def __iter__(self) -> Iterator[mutapath.Path]:
+        clone = self._prototype._clone_normalized
+        return (clone(path.Path(p)) for p in self._paths)
+
+    def __repr__(self):
+        return f"PathArray({self._paths!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, PathArray):
+            return self._paths == other._paths
+        return NotImplemented
+
+    def __add__(self, other: Iterable) -> PathArray:
+        if not isinstance(other, PathArray):
+            other = PathArray(
+                other, posix=self.posix_enabled, string_repr=self.string_repr_enabled
+            )
+        return self._derive(self._paths + other._paths)
+
+    @property
+    def name(self) -> PathArray:
+        """.. seealso:: :attr:`mutapath.Path.name`"""
+        basename = path.Path.module.basename
+        return self._derive([basename(p) for p in self._paths])
+
+    @property
+    def parent(self) -> PathArray:
+        """.. seealso:: :attr:`mutapath.Path.parent`"""
+        dirname = path.Path.module.dirname
+        return self._derive([dirname(p) for p in self._paths])
+
+    base = parent
+
+    @property
+    def stem(self) -> List[str]:
+        """.. seealso:: :attr:`mutapath.Path.stem`"""
+        basename = path.Path.module.basename
+        splitext = path.Path.module.splitext
+        return [splitext(basename(p))[0] for p in self._paths]
+
+    @property
+    def suffix(self) -> List[str]:
+        """.. seealso:: :attr:`mutapath.Path.suffix`"""
+        splitext = path.Path.module.splitext
+        return [splitext(p)[1] for p in self._paths]
+
+    ext = suffix
+
+    def with_suffix(self, suffix: str) -> PathArray:
+        """.. seealso:: :meth:`mutapath.Path.with_suffix`"""
+        if not suffix.startswith("."):
+            raise ValueError(f"Invalid suffix {suffix!r}.")
+        splitext = path.Path.module.splitext
+        stripped = [splitext(p)[0] + suffix for p in self._paths]
+        if "/" in suffix or "\\" in suffix:
+            return self._derive_normalized(stripped)
+        return self._derive(stripped)
+
+    def with_name(self, new_name) -> PathArray:
+        """.. seealso:: :meth:`mutapath.Path.with_name`"""
+        dirname = path.Path.module.dirname
+        join = path.Path.module.join
+        new_name = str(new_name)
+        return self._derive_normalized(join(dirname(p), new_name) for p in self._paths)
+
+    def with_stem(self, new_stem) -> PathArray:
+        """.. seealso:: :meth:`mutapath.Path.with_stem`"""
+        module = path.Path.module
+        new_stem = str(new_stem)
+        stemmed = []
+        for p in self._paths:
+            suffix = module.splitext(p)[1]
+            if not suffix.startswith("."):
+                raise ValueError(f"Invalid suffix {suffix!r} of path {p}.")
+            renamed = module.join(module.dirname(p), new_stem)
+            stemmed.append(module.splitext(renamed)[0] + suffix)
+        return self._derive_normalized(stemmed)
+
+    def with_parent(self, new_parent) -> PathArray:
+        """.. seealso:: :meth:`mutapath.Path.with_parent`"""
+        new_parent = self._normalize(new_parent)
+        join = path.Path.module.join
+        basename = path.Path.module.basename
+        return self._derive_normalized(
+            join(new_parent, basename(p)) for p in self._paths
+        )
+
+    def with_base(self, base, strip_length: int = 0) -> PathArray:
+        """.. seealso:: :meth:`mutapath.Path.with_base`"""
+        base = self._normalize(base)
+        if not strip_length:
+            strip_length = len(normalization.splitall(base))
+        else:
+            strip_length += 1
+
+        join = path.Path.module.join
+        rebased = []
+        for p in self._paths:
+            parts = normalization.splitall(p)
+            if len(parts) <= strip_length:
+                raise ValueError(f"The given base has more elements than path {p}.")
+            rebased.append(join(base, *parts[strip_length:]))
+        return self._derive_normalized(rebased)
+
+    def relpath(self, start=os.curdir) -> PathArray:
+        """.. seealso:: :meth:`mutapath.Path.relpath`"""
+        relpath = path.Path.module.relpath
+        start = str(start)
+        return self._derive_normalized(relpath(p, start) for p in self._paths)
+
+    def abspath(self) -> PathArray:
+        """.. seealso:: :func:`os.path.abspath`"""
+        abspath = path.Path.module.abspath
+        return self._derive_normalized(abspath(p) for p in self._paths)
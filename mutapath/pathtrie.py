@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import pathlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import path
+
+import mutapath
+from mutapath import normalization
+from mutapath.defaults import current_defaults
+
+PathLike = Union["mutapath.Path", path.Path, pathlib.PurePath, str]
+
+
+class _Node:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, _Node] = dict()
+        self.terminal = False
+
+
+class PathTrie:
+    """
+    Prefix index of paths, structured by their components.
+
+    The paths are normalized just like :class:`~mutapath.Path` does it.
+    Queries of subtrees and prefixes only visit the components of the queried path and the results,
+    independent of the number of indexed paths.
+
+    :Example:
+    >>> index = PathTrie(["/A/B/a.txt", "/A/B/C/b.txt", "/A/D/c.txt"])
+    >>> list(index.subtree("/A/B"))
+    [Path('/A/B/a.txt'), Path('/A/B/C/b.txt')]
+    >>> index.rebase("/A/B", "/E")
+    2
+    """
+
+    __slots__ = ("_root", "_size", "_prototype")
+
+    def __init__(
+        self,
+        paths: Iterable[PathLike] = (),
+        *,
+        posix: Optional[bool] = None,
+        string_repr: Optional[bool] = None,
+    ):
+        if posix is None or string_repr is None:
+            defaults = current_defaults()
+            if posix is None:
+                posix = defaults.posix
+            if string_repr is None:
+                string_repr = defaults.string_repr
+        self._prototype = mutapath.Path(posix=posix, string_repr=string_repr)
+        self._root = _Node()
+        self._size = 0
+        for p in paths:
+            self.insert(p)
+
+    @property
+    def posix_enabled(self) -> bool:
+        """.. seealso:: :attr:`mutapath.Path.posix_enabled`"""
+        return self._prototype.posix_enabled
+
+    def _components(self, input_path: PathLike) -> List[str]:
+        if isinstance(input_path, mutapath.Path):
+            input_path = input_path._contained
+        elif isinstance(input_path, pathlib.PurePath):
+            input_path = str(input_path)
+        if not input_path:
+            return [""]
+        normalized = normalization.normalize(input_path, self.posix_enabled)
+        return normalization.splitall(normalized)
+
+    def _find(self, components: List[str]) -> Optional[_Node]:
+        node = self._root
+        for component in components:
+            node = node.children.get(component)
+            if node is None:
+                return None
+        return node
+
+    def _join(self, parent: str, component: str) -> str:
+        if not parent:
+            return component
+        joined = path.Path.module.join(parent, component)
+        if self.posix_enabled:
+            return normalization.posix_string(joined)
+        return joined
+
+    def _path(self, joined: str) -> mutapath.Path:
+        return self._prototype._clone_normalized(path.Path(joined))
+
+    def _walk(self, node: _Node, joined: str) -> Iterator[mutapath.Path]:
+        stack: List[Tuple[_Node, str]] = [(node, joined)]
+        while stack:
+            node, joined = stack.pop()
+            if node.terminal:
+                yield self._path(joined)
+            for component, child in reversed(node.children.items()):
+                stack.append((child, self._join(joined, component)))
+
+    @staticmethod
+    def _count(node: _Node) -> int:
+        count = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            count += node.terminal
+            stack.extend(node.children.values())
+        return count
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item: PathLike) -> bool:
+        node = self._find(self._components(item))
+        return node is not None and node.terminal
+
+    def __iter__(self) -> Iterator[mutapath.Path]:
+        for root, node in self._root.children.items():
+            yield from self._walk(node, root)
+
+    def __repr__(self):
+        return f"PathTrie({list(self)!r})"
+
+    def insert(self, input_path: PathLike) -> bool:
+        """
+        Add the given path to this index.
+
+        :return: True if the path has not been indexed before
+        """
+        node = self._root
+        for component in self._components(input_path):
+            child = node.children.get(component)
+            if child is None:
+                child = node.children[component] = _Node()
+            node = child
+        if node.terminal:
+            return False
+        node.terminal = True
+        self._size += 1
+        return True
+
+    def remove(self, input_path: PathLike):
+        """
+        Remove the given path from this index.
+
+        :raises KeyError: if the path is not indexed
+        """
+        components = self._components(input_path)
+        trail = [self._root]
+        for component in components:
+            child = trail[-1].children.get(component)
+            if child is None:
+                raise KeyError(input_path)
+            trail.append(child)
+        if not trail[-1].terminal:
+            raise KeyError(input_path)
+        trail[-1].terminal = False
+        self._size -= 1
+        self._prune(trail, components)
+
+    def discard(self, input_path: PathLike):
+        """Remove the given path from this index if it is indexed."""
+        try:
+            self.remove(input_path)
+        except KeyError:
+            pass
+
+    @staticmethod
+    def _prune(trail: List[_Node], components: List[str]):
+        for parent, node, component in zip(
+            reversed(trail[:-1]), reversed(trail[1:]), reversed(components)
+        ):
+            if node.terminal or node.children:
+                break
+            del parent.children[component]
+
+    def subtree(
+        self, prefix: PathLike, include_prefix: bool = True
+    ) -> Iterator[mutapath.Path]:
+        """
+        Iterate all indexed paths that are located under the given prefix.
+
+        :param prefix: the path that contains all returned paths
+        :param include_prefix: if the prefix itself is returned, too, if it is indexed
+        """
+        components = self._components(prefix)
+        node = self._find(components)
+        if node is None:
+            return
+        joined = components[0]
+        for component in components[1:]:
+            joined = self._join(joined, component)
+        if not include_prefix:
+            for component, child in node.children.items():
+                yield from self._walk(child, self._join(joined, component))
+            return
+        yield from self._walk(node, joined)
+
+    def longest_prefix(self, input_path: PathLike) -> Optional[mutapath.Path]:
+        """
+        Find the longest indexed path that is the given path itself or one of its parents.
+
+        :return: the found path or None if no parent of the given path is indexed
+        """
+        node = self._root
+        joined = None
+        found = None
+        for component in self._components(input_path):
+            node = node.children.get(component)
+            if node is None:
+                break
+            joined = component if joined is None else self._join(joined, component)
+            if node.terminal:
+                found = joined
+        if found is None:
+            return None
+        return self._path(found)
+
+    def rebase(self, base: PathLike, new_base: PathLike) -> int:
+        """
+        Move all indexed paths under the given base to the new base, just like :meth:`mutapath.Path.with_base`.
+
+        :param base: the prefix of the paths that are moved
+        :param new_base: the new prefix of the moved paths
+        :return: the number of moved paths
+        """
+        components = self._components(base)
+        trail = [self._root]
+        for component in components:
+            child = trail[-1].children.get(component)
+            if child is None:
+                return 0
+            trail.append(child)
+
+        moved = trail[-1]
+        del trail[-2].children[components[-1]]
+        self._prune(trail[:-1], components[:-1])
+
+        count = self._count(moved)
+        self._size -= count
+        node = self._root
+        new_components = self._components(new_base)
+        for component in new_components[:-1]:
+            child = node.children.get(component)
+            if child is None:
+                child = node.children[component] = _Node()
+            node = child
+        self._graft(node, new_components[-1], moved)
+        return count
+
+    def _graft(self, parent: _Node, component: str, node: _Node):
+        existing = parent.children.get(component)
+        if existing is None:
+            parent.children[component] = node
+            self._size += self._count(node)
+            return
+        if node.terminal and not existing.terminal:
+            existing.terminal = True
+            self._size += 1
+        for child_component, child in node.children.items():
+            self._graft(existing, child_component, child)
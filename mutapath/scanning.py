@@ -0,0 +1,299 @@
+"""
+Streaming directory traversal on top of :func:`os.scandir`.
+
+The traversal decides about recursion and file or directory filters with the :class:`os.DirEntry` of each child,
+which costs no additional system call on most platforms.
+The entries are snapshots of the scan, so they are only used during the traversal itself.
+The yielded paths do not keep them and answer type checks and stat calls freshly.
+Latency-bound volumes can be walked with :func:`walk_parallel`, which reads the directories on worker threads.
+
+:Example:
+>>> for file in Path("/home/doe").walkfiles(prune=lambda d: d.name == ".git"):
+...     print(file, file.size)
+"""
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple, Union
+
+import path
+from path import matchers
+
+import mutapath
+from mutapath import normalization
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+Prune = Callable[["mutapath.Path"], bool]
+Errors = Union[str, Callable[[str], None]]
+
+FILES = "files"
+DIRS = "dirs"
+
+
+def entries(parent: mutapath.Path, errors: Errors = "strict") -> Iterator[os.DirEntry]:
+    """
+    Iterate the raw directory entries of the given directory.
+
+    :param parent: the directory to scan
+    :param errors: the handling of errors, see :meth:`path.Path.walk`
+    """
+    errors = path.Handlers._resolve(errors)
+    contained = parent._contained
+    try:
+        iterator = os.scandir(os.curdir if contained in ("", os.curdir) else contained)
+    except OSError as exc:
+        errors(f"Unable to list directory '{parent}': {exc}")
+        return
+    with iterator:
+        yield from iterator
+
+
+def from_entry(parent: mutapath.Path, entry: os.DirEntry) -> mutapath.Path:
+    """Create the path of the given entry of the given directory."""
+    contained = parent._contained
+    joined = entry.name if contained in ("", os.curdir) else entry.path
+    return parent._clone_normalized(
+        path.Path(normalization.render(joined, parent.posix_enabled))
+    )
+
+
+def is_dir(child: mutapath.Path, entry: Optional[os.DirEntry]) -> bool:
+    """
+    Check if the given child is a directory, with its directory entry if it has been scanned.
+    Like :func:`os.path.isdir`, inaccessible children are no directories.
+    """
+    if entry is None:
+        return child.isdir()
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_kind(entry: os.DirEntry, kind: Optional[str]) -> bool:
+    if kind is None:
+        return True
+    try:
+        return entry.is_file() if kind == FILES else entry.is_dir()
+    except OSError:
+        return False
+
+
+def scandir(
+    parent: mutapath.Path, errors: Errors = "strict", kind: Optional[str] = None
+) -> Iterator[mutapath.Path]:
+    """
+    Iterate the children of the given directory.
+
+    :param parent: the directory to scan
+    :param errors: the handling of errors, see :meth:`path.Path.walk`
+    :param kind: 'files' or 'dirs' to only iterate the children of that kind, or None for all
+    """
+    for entry in entries(parent, errors):
+        if _is_kind(entry, kind):
+            yield from_entry(parent, entry)
+
+
+def walk(
+    root: mutapath.Path,
+    match=None,
+    errors: Errors = "strict",
+    prune: Optional[Prune] = None,
+    kind: Optional[str] = None,
+) -> Iterator[mutapath.Path]:
+    """
+    Iterate all files and directories below the given root, depth-first and each directory before its children.
+    The traversal is iterative and keeps only one open directory per level.
+
+    :param root: the directory to walk
+    :param match: a pattern or callable that filters the yielded paths, see :meth:`path.Path.walk`
+    :param errors: the handling of errors, see :meth:`path.Path.walk`
+    :param prune: a callable that is given each directory before it is entered and returns True to skip its contents
+    :param kind: 'files' or 'dirs' to only yield the paths of that kind, or None for all
+    """
+    errors = path.Handlers._resolve(errors)
+    match = matchers.load(match)
+    stack = [_scan(root, errors)]
+    while stack:
+        child, entry = next(stack[-1], (None, None))
+        if child is None:
+            stack.pop()
+            continue
+
+        traverse = None
+        if _is_kind(entry, kind) and match(child):
+            traverse = yield child
+        try:
+            descend = traverse() if traverse is not None else entry.is_dir()
+        except Exception as exc:
+            errors(f"Unable to access '{child}': {exc}")
+            continue
+        if descend and (prune is None or not prune(child)):
+            stack.append(_scan(child, errors))
+
+
+def _scan(
+    parent: mutapath.Path, errors: Errors
+) -> Iterator[Tuple[mutapath.Path, os.DirEntry]]:
+    for entry in entries(parent, errors):
+        yield from_entry(parent, entry), entry
+
+
+def _listing(
+    parent: mutapath.Path,
+) -> Tuple[List[Tuple[mutapath.Path, os.DirEntry]], Optional[Exception]]:
+    children = []
+    try:
+        for entry in entries(parent):
+            try:
+                entry.is_dir()
+            except OSError:
+                pass
+            children.append((from_entry(parent, entry), entry))
+    except Exception as exc:
+        return children, exc
+    return children, None
+
+
+def _report(errors: Callable[[str], None], directory: mutapath.Path, exc: Exception):
+    if not isinstance(exc, OSError):
+        raise exc
+    try:
+        raise exc
+    except OSError:
+        errors(f"Unable to list directory '{directory}': {exc}")
+
+
+def _descend(
+    child: mutapath.Path,
+    entry: os.DirEntry,
+    errors: Callable[[str], None],
+    prune: Optional[Prune],
+) -> bool:
+    try:
+        descend = entry.is_dir()
+    except Exception as exc:
+        errors(f"Unable to access '{child}': {exc}")
+        return False
+    return descend and (prune is None or not prune(child))
+
+
+def walk_parallel(
+    root: mutapath.Path,
+    workers: int = 4,
+    ordered: bool = False,
+    max_queue: int = 64,
+    match=None,
+    errors: Errors = "strict",
+    prune: Optional[Prune] = None,
+) -> Iterator[mutapath.Path]:
+    """
+    Iterate all files and directories below the given root like :func:`walk`,
+    but read the directories on a pool of worker threads.
+
+    Unordered, the paths are yielded as soon as their directory has been read, but each directory before its children.
+    Ordered, the paths are yielded in the same order as :func:`walk` and directories are read ahead.
+    The callbacks are invoked on the consuming thread.
+    In the ordered mode, ``prune`` is called once the parent directory has been read, ahead of the yielded paths.
+
+    :param root: the directory to walk
+    :param workers: the number of worker threads
+    :param ordered: if the paths are yielded in the deterministic order of :func:`walk`
+    :param max_queue: the maximum number of directory listings that are read but not yet consumed;
+        the workers wait once it is reached
+    :param match: a pattern or callable that filters the yielded paths, see :meth:`path.Path.walk`
+    :param errors: the handling of errors, see :meth:`path.Path.walk`
+    :param prune: a callable that is given each directory before it is entered and returns True to skip its contents
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    errors = path.Handlers._resolve(errors)
+    match = matchers.load(match)
+    stopped = threading.Event()
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="mutapath-walk")
+    try:
+        if ordered:
+            yield from _walk_ordered(
+                root, executor, stopped, max_queue, match, errors, prune
+            )
+        else:
+            yield from _walk_unordered(
+                root, executor, stopped, max_queue, match, errors, prune
+            )
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False)
+
+
+def _walk_unordered(root, executor, stopped, max_queue, match, errors, prune):
+    import queue
+
+    results = queue.Queue(max_queue)
+
+    def read(directory: mutapath.Path):
+        if stopped.is_set():
+            return
+        item = (directory, *_listing(directory))
+        while not stopped.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    executor.submit(read, root)
+    pending = 1
+    while pending:
+        directory, children, exc = results.get()
+        pending -= 1
+        if exc is not None:
+            _report(errors, directory, exc)
+        for child, entry in children:
+            if match(child):
+                yield child
+            if _descend(child, entry, errors, prune):
+                executor.submit(read, child)
+                pending += 1
+
+
+def _walk_ordered(root, executor, stopped, max_queue, match, errors, prune):
+    in_flight = 0
+
+    def read(directory: mutapath.Path):
+        if stopped.is_set():
+            return [], None
+        return _listing(directory)
+
+    def submit(directory: mutapath.Path) -> Future:
+        nonlocal in_flight
+        in_flight += 1
+        return executor.submit(read, directory)
+
+    def expand(directory: mutapath.Path, future: Future):
+        nonlocal in_flight
+        children, exc = future.result()
+        in_flight -= 1
+        if exc is not None:
+            _report(errors, directory, exc)
+        items = []
+        for child, entry in children:
+            descend = _descend(child, entry, errors, prune)
+            ahead = submit(child) if descend and in_flight < max_queue else None
+            items.append((child, descend, ahead))
+        return iter(items)
+
+    stack = [expand(root, submit(root))]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            continue
+
+        child, descend, ahead = item
+        if match(child):
+            yield child
+        if descend:
+            stack.append(expand(child, ahead or submit(child)))
@@ -0,0 +1,267 @@
+"""
+Opt-in cache of the stat results of paths.
+
+Once enabled, the type checks and stat calls of :class:`~mutapath.Path` (e.g., :meth:`~mutapath.Path.exists`,
+:meth:`~mutapath.Path.isfile` or :attr:`~mutapath.Path.size`) are answered from a bounded LRU cache,
+keyed by the absolute path and valid for the given time to live.
+Missing files are cached as well, raising the original error type again.
+A lookup that overlaps with an invalidation of its path is not cached.
+The file operations of mutapath (e.g., :meth:`~mutapath.Path.renaming`, :meth:`~mutapath.Path.remove_p`
+or the mutators of :class:`~mutapath.MutaPath`) invalidate the affected paths automatically.
+Changes by other processes are only noticed once the cached results expire.
+
+:Example:
+>>> from mutapath import statcache
+>>> statcache.enable_cache(maxsize=4096, ttl=1.0)
+>>> statcache.cache_info().hit_ratio
+0.0
+"""
+import os
+import stat as stat_module
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_TTL = 1.0
+
+PathLike = Union[str, os.PathLike]
+
+
+class CacheInfo(NamedTuple):
+    """The counters and bounds of the stat cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    ttl: float
+
+    @property
+    def hit_ratio(self) -> float:
+        """Get the share of lookups that have been answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_Result = Union[os.stat_result, OSError]
+
+_CACHED_ERRORS = (FileNotFoundError, NotADirectoryError)
+
+
+def _fresh(error: OSError) -> OSError:
+    """Copy the cached error, so that raising it does not attach a traceback to the cached instance."""
+    return type(error)(error.errno, error.strerror, error.filename)
+
+
+class _StatCache:
+    __slots__ = ("maxsize", "ttl", "hits", "misses", "_entries", "_pending", "_lock")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, bool], Tuple[float, _Result]]" = (
+            OrderedDict()
+        )
+        # the generation and the number of running stat calls of each path that is being looked up
+        self._pending: Dict[str, List[int]] = dict()
+        self._lock = threading.Lock()
+
+    def stat(self, key: str, follow_symlinks: bool) -> os.stat_result:
+        now = time.monotonic()
+        cache_key = (key, follow_symlinks)
+        with self._lock:
+            cached = self._entries.get(cache_key)
+            if cached is not None and cached[0] > now:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                result = cached[1]
+                if isinstance(result, OSError):
+                    raise _fresh(result)
+                return result
+            self.misses += 1
+            pending = self._pending.setdefault(key, [0, 0])
+            pending[1] += 1
+            generation = pending[0]
+
+        result: Optional[_Result] = None
+        try:
+            result = os.stat(key, follow_symlinks=follow_symlinks)
+            return result
+        except _CACHED_ERRORS as e:
+            result = _fresh(e)
+            raise
+        finally:
+            self._store(cache_key, pending, generation, now + self.ttl, result)
+
+    def _store(
+        self,
+        cache_key: Tuple[str, bool],
+        pending: List[int],
+        generation: int,
+        expiry: float,
+        result: Optional[_Result],
+    ):
+        """Store the looked up result, unless the path has been invalidated during the lookup."""
+        with self._lock:
+            pending[1] -= 1
+            if not pending[1]:
+                del self._pending[cache_key[0]]
+            if result is None or pending[0] != generation:
+                return
+            self._entries[cache_key] = (expiry, result)
+            self._entries.move_to_end(cache_key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str, subtree: bool):
+        with self._lock:
+            self._entries.pop((key, True), None)
+            self._entries.pop((key, False), None)
+            pending = self._pending.get(key)
+            if pending is not None:
+                pending[0] += 1
+            if subtree:
+                prefix = os.path.join(key, "")
+                for cached in [k for k in self._entries if k[0].startswith(prefix)]:
+                    del self._entries[cached]
+                for pending_key, pending in self._pending.items():
+                    if pending_key.startswith(prefix):
+                        pending[0] += 1
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._entries), self.ttl
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for pending in self._pending.values():
+                pending[0] += 1
+            self.hits = 0
+            self.misses = 0
+
+
+_cache: Optional[_StatCache] = None
+
+
+def _key(input_path: PathLike) -> str:
+    input_path = os.fspath(input_path)
+    if not input_path:
+        return input_path
+    return os.path.abspath(input_path)
+
+
+def enable_cache(maxsize: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_TTL):
+    """
+    Enable the stat cache with the given bounds.
+    An already enabled cache is replaced and thereby cleared.
+
+    :param maxsize: the maximum number of cached stat results
+    :param ttl: the time to live of the cached results in seconds
+    """
+    global _cache
+    _cache = _StatCache(maxsize, ttl)
+
+
+def disable_cache():
+    """Disable and drop the stat cache."""
+    global _cache
+    _cache = None
+
+
+def cache_enabled() -> bool:
+    """Return True if the stat cache is enabled."""
+    return _cache is not None
+
+
+def cache_info() -> Optional[CacheInfo]:
+    """
+    Get the hit and miss counters of the stat cache.
+
+    :return: the cache statistics, or None if the cache is disabled
+    """
+    if _cache is None:
+        return None
+    return _cache.info()
+
+
+def clear_cache():
+    """Clear all entries and counters of the stat cache."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def invalidate(*paths: PathLike, subtree: bool = False):
+    """
+    Drop the cached results of the given paths.
+
+    :param paths: the paths whose files have been changed
+    :param subtree: if the cached results of all paths below the given ones are dropped, too
+    """
+    cache = _cache
+    if cache is None:
+        return
+    for input_path in paths:
+        cache.invalidate(_key(input_path), subtree)
+
+
+def stat(input_path: PathLike, follow_symlinks: bool = True) -> os.stat_result:
+    """
+    Get the stat result of the given path, from the cache if it is enabled.
+
+    .. seealso:: :func:`os.stat`
+    """
+    cache = _cache
+    if cache is None:
+        return os.stat(input_path, follow_symlinks=follow_symlinks)
+    return cache.stat(_key(input_path), follow_symlinks)
+
+
+def _mode(
+    cache: _StatCache, input_path: PathLike, follow_symlinks: bool = True
+) -> Optional[int]:
+    try:
+        return cache.stat(_key(input_path), follow_symlinks).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+def exists(input_path: PathLike) -> bool:
+    """.. seealso:: :func:`os.path.exists`"""
+    cache = _cache
+    if cache is None:
+        return os.path.exists(input_path)
+    return _mode(cache, input_path) is not None
+
+
+def isfile(input_path: PathLike) -> bool:
+    """.. seealso:: :func:`os.path.isfile`"""
+    cache = _cache
+    if cache is None:
+        return os.path.isfile(input_path)
+    mode = _mode(cache, input_path)
+    return mode is not None and stat_module.S_ISREG(mode)
+
+
+def isdir(input_path: PathLike) -> bool:
+    """.. seealso:: :func:`os.path.isdir`"""
+    cache = _cache
+    if cache is None:
+        return os.path.isdir(input_path)
+    mode = _mode(cache, input_path)
+    return mode is not None and stat_module.S_ISDIR(mode)
+
+
+def islink(input_path: PathLike) -> bool:
+    """.. seealso:: :func:`os.path.islink`"""
+    cache = _cache
+    if cache is None:
+        return os.path.islink(input_path)
+    mode = _mode(cache, input_path, follow_symlinks=False)
+    return mode is not None and stat_module.S_ISLNK(mode)
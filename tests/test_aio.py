@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from mutapath import MutaPath, Path, PathDefaults, PathException, aio
+from tests.helper import PathTest
+
+
+class TestAio(PathTest):
+    def __init__(self, *args):
+        self.test_path = "aio_test"
+        super().__init__(*args)
+
+    def setUp(self):
+        self.test_base = Path.getcwd() / self.test_path
+        self.test_base.rmtree_p()
+        self.test_base.mkdir()
+        self.test_file = self.test_base / "a.txt"
+        self.test_file.write_text("content")
+
+    def tearDown(self):
+        aio.set_executor(None)
+        self._clean()
+
+    def test_read_write(self):
+        async def roundtrip():
+            other = self.test_base / "b.txt"
+            await other.awrite_text("text")
+            await other.awrite_bytes(b"bytes", append=True)
+            return (
+                await other.aread_text(),
+                await other.aread_bytes(),
+                await other.aexists(),
+                (await other.astat()).st_size,
+            )
+
+        self.assertEqual(("textbytes", b"textbytes", True, 9), asyncio.run(roundtrip()))
+
+    def test_executor(self):
+        names = []
+
+        def record():
+            names.append(threading.current_thread().name)
+
+        with ThreadPoolExecutor(1, thread_name_prefix="custom") as executor:
+            aio.set_executor(executor)
+            self.assertIs(executor, aio.get_executor())
+            asyncio.run(aio.run(record))
+        self.assertTrue(names[0].startswith("custom"))
+
+    def test_defaults_carried(self):
+        async def create():
+            with PathDefaults.scope(posix=True):
+                return await aio.run(Path, "/A/B")
+
+        self.assertTrue(asyncio.run(create()).posix_enabled)
+
+    def test_copy(self):
+        target = self.test_base / "c.txt"
+        asyncio.run(self.test_file.acopy(target))
+        self.assertEqual("content", target.text)
+
+    def test_renaming(self):
+        async def rename():
+            async with self.test_file.arenaming() as mut:
+                mut.stem = "b"
+            return self.test_file
+
+        renamed = asyncio.run(rename())
+        self.assertEqual(self.test_base / "b.txt", renamed)
+        self.assertTrue(renamed.exists())
+        self.assertFalse((self.test_base / "b.txt.lock").exists())
+
+    def test_renaming_cancelled(self):
+        lock_file = self.test_base / "a.txt.lock"
+        lock_file.touch()
+        threading.Timer(0.3, lock_file.remove).start()
+
+        async def rename():
+            async with self.test_file.arenaming(timeout=2) as mut:
+                mut.stem = "b"
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(rename(), 0.1))
+        self.assertFalse(lock_file.exists())
+        with self.test_file.renaming(timeout=0.1) as mut:
+            mut.stem = "b"
+        self.assertEqual(self.test_base / "b.txt", self.test_file)
+
+    def test_moving_and_copying(self):
+        async def operate():
+            file = MutaPath(self.test_file)
+            async with file.acopying() as mut:
+                mut.name = "copy.txt"
+            async with file.amoving() as mut:
+                mut.name = "moved.txt"
+            return file
+
+        moved = asyncio.run(operate())
+        self.assertEqual(self.test_base / "moved.txt", moved)
+        self.assertEqual(
+            ["a.txt", "moved.txt"],
+            sorted(str(p.name) for p in self.test_base.listdir()),
+        )
+
+    def test_renaming_failure(self):
+        async def rename():
+            async with (self.test_base / "missing").arenaming() as mut:
+                mut.stem = "b"
+
+        with self.assertRaises(PathException):
+            asyncio.run(rename())
+
+    def test_iterdir(self):
+        for i in range(5):
+            (self.test_base / f"{i}.txt").touch()
+
+        async def collect(batch_size):
+            return [p async for p in self.test_base.aiterdir(batch_size)]
+
+        expected = sorted(self.test_base.listdir())
+        for batch_size in 1, 2, 6, 100:
+            actual = asyncio.run(collect(batch_size))
+            self.typed_instance_test(*actual)
+            self.assertEqual(expected, sorted(actual))
@@ -0,0 +1,165 @@
+import errno
+from unittest import mock
+
+from mutapath import Path, PathException, batch_move, fileops
+from mutapath.batch import _groups
+from tests.helper import PathTest
+
+
+class TestBatch(PathTest):
+    def __init__(self, *args):
+        self.test_path = "batch_test"
+        super().__init__(*args)
+
+    def setUp(self):
+        self.test_base = Path.getcwd() / self.test_path
+        self.test_base.rmtree_p()
+        for name in "abc":
+            (self.test_base / name).makedirs()
+            for i in range(5):
+                (self.test_base / name / f"{i}.txt").write_text(f"{name}{i}")
+        (self.test_base / "target").mkdir()
+
+    def tearDown(self):
+        self._clean()
+
+    def _mapping(self):
+        return {
+            str(self.test_base / name / f"{i}.txt"): self.test_base
+            / "target"
+            / f"{name}{i}.txt"
+            for name in "ab"
+            for i in range(5)
+        }
+
+    def _names(self, directory: str):
+        return sorted(p.name for p in (self.test_base / directory).listdir())
+
+    def test_move(self):
+        mapping = self._mapping()
+        mapping[str(self.test_base / "c" / "0.txt")] = (
+            self.test_base / "c" / "moved.txt"
+        )
+        for workers in 1, 4:
+            moved = batch_move(mapping, workers=workers)
+            self.assertEqual(list(mapping.values()), moved)
+            self.assertIsInstance(moved[0], Path)
+            self.assertEqual("a0", (self.test_base / "target" / "a0.txt").read_text())
+            self.assertEqual([], self._names("a"))
+            self.assertEqual(
+                ["1.txt", "2.txt", "3.txt", "4.txt", "moved.txt"], self._names("c")
+            )
+            batch_move([(target, source) for source, target in mapping.items()])
+            self.assertEqual(5, len(self._names("a")))
+
+    def test_move_directory(self):
+        batch_move([(self.test_base / "a", self.test_base / "target" / "a")])
+        self.assertEqual(5, len(self._names("target/a")))
+
+    def test_validation(self):
+        target = self.test_base / "target"
+        (target / "a0.txt").touch()
+        (target / "b1.txt.lock").touch()
+        mapping = self._mapping()
+        mapping[str(self.test_base / "missing.txt")] = target / "missing.txt"
+        mapping[str(self.test_base / "c" / "0.txt")] = target / "a1.txt"
+        mapping[str(self.test_base / "c")] = self.test_base / "d"
+        with self.assertRaises(PathException) as raised:
+            batch_move(mapping)
+        message = str(raised.exception)
+        for problem in (
+            "a0.txt already exists",
+            "b1.txt is locked",
+            "missing.txt does not exist",
+            "a1.txt is the target of several moves",
+            "inside a moved directory",
+        ):
+            self.assertIn(problem, message)
+        self.assertEqual(5, len(self._names("a")))
+
+    def test_rollback(self):
+        move = fileops.rename_noreplace
+        calls = []
+
+        def failing(source, target):
+            calls.append(source)
+            if len(calls) == 7:
+                raise OSError(errno.EIO, "Input/output error")
+            return move(source, target)
+
+        for workers in 1, 4:
+            calls.clear()
+            with mock.patch.object(fileops, "rename_noreplace", side_effect=failing):
+                with self.assertRaises(PathException) as raised:
+                    batch_move(self._mapping(), workers=workers)
+            self.assertIn("rolled back", str(raised.exception))
+            self.assertIsInstance(raised.exception.__cause__, OSError)
+            self.assertEqual([], self._names("target"))
+            self.assertEqual(5, len(self._names("a")))
+            self.assertEqual(5, len(self._names("b")))
+
+    def test_rollback_failures(self):
+        move = fileops.rename_noreplace
+        calls = []
+
+        def failing(source, target):
+            calls.append(source)
+            if len(calls) == 3:
+                raise OSError(errno.EIO, "Input/output error")
+            if len(calls) == 4:
+                raise ValueError("unexpected")
+            return move(source, target)
+
+        with mock.patch.object(fileops, "rename_noreplace", side_effect=failing):
+            with self.assertRaises(PathException) as raised:
+                batch_move(self._mapping(), workers=1)
+        message = str(raised.exception)
+        self.assertIn("1 completed moves could not be rolled back", message)
+        self.assertIn("ValueError('unexpected')", message)
+        cause = raised.exception.__cause__
+        self.assertIsInstance(cause, ValueError)
+        self.assertIsInstance(cause.__context__, OSError)
+        self.assertEqual(["a1.txt"], self._names("target"))
+        self.assertEqual(4, len(self._names("a")))
+
+    def test_rollback_across_devices(self):
+        copy = fileops.copy
+        copied = []
+
+        def exdev(source, target):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        def failing(source, target, *args, **kwargs):
+            copied.append(source)
+            if len(copied) == 8:
+                raise OSError(errno.ENOSPC, "No space left on device")
+            return copy(source, target, *args, **kwargs)
+
+        with mock.patch.object(fileops, "rename_noreplace", side_effect=exdev):
+            with mock.patch.object(fileops, "copy", side_effect=failing):
+                with self.assertRaises(PathException) as raised:
+                    batch_move(
+                        [
+                            (self.test_base / "a", self.test_base / "target" / "a"),
+                            (self.test_base / "b", self.test_base / "target" / "b"),
+                        ],
+                        workers=1,
+                    )
+        self.assertIn(
+            "all completed moves have been rolled back", str(raised.exception)
+        )
+        self.assertEqual([], self._names("target"))
+        self.assertEqual(5, len(self._names("a")))
+        self.assertEqual(5, len(self._names("b")))
+
+    def test_groups(self):
+        moves = [
+            ("/a/1", "/b/1"),
+            ("/c/1", "/d/1"),
+            ("/b/2", "/e/2"),
+            ("/f/1", "/f/2"),
+            ("/e/3", "/a/3"),
+        ]
+        self.assertEqual(
+            [[moves[0], moves[2], moves[4]], [moves[1]], [moves[3]]], _groups(moves)
+        )
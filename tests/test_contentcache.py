@@ -0,0 +1,91 @@
+import os
+import time
+
+from mutapath import Path, contentcache
+from tests.helper import PathTest
+
+
+class TestContentCache(PathTest):
+    def __init__(self, *args):
+        self.test_path = "contentcache_test"
+        super().__init__(*args)
+
+    def setUp(self):
+        self.test_base = Path.getcwd() / self.test_path
+        self.test_base.rmtree_p()
+        self.test_base.mkdir()
+        self.test_file = self._settled("a.txt", "content")
+        contentcache.clear_cache()
+
+    def tearDown(self):
+        contentcache.set_budget()
+        contentcache.clear_cache()
+        self._clean()
+
+    def _settled(self, name: str, content: str) -> Path:
+        settled = self.test_base / name
+        settled.write_text(content)
+        past = time.time() - 10
+        os.utime(settled, (past, past))
+        return settled
+
+    def test_shared(self):
+        self.assertEqual("content", self.test_file.text)
+        self.assertEqual("content", self.test_file.clone(self.test_file).text)
+        self.assertEqual(b"content", self.test_file.bytes)
+        info = contentcache.cache_info()
+        self.assertEqual((1, 2, 2), (info.hits, info.misses, info.entries))
+
+    def test_changed(self):
+        self.assertEqual("content", self.test_file.text)
+        self._settled("a.txt", "changed")
+        self.assertEqual("changed", self.test_file.text)
+        self.assertEqual(0, contentcache.cache_info().hits)
+
+    def test_replaced(self):
+        self.assertEqual(b"content", self.test_file.bytes)
+        other = self._settled("b.txt", "replace")
+        os.utime(other, ns=(os.stat(self.test_file).st_mtime_ns,) * 2)
+        os.replace(other, self.test_file)
+        self.assertEqual(b"replace", self.test_file.bytes)
+
+    def test_recently_modified(self):
+        recent = self.test_base / "recent.txt"
+        recent.write_text("recent")
+        self.assertEqual("recent", recent.text)
+        self.assertEqual("recent", recent.text)
+        self.assertEqual(0, contentcache.cache_info().entries)
+
+    def test_budget(self):
+        files = [self._settled(f"{i}.txt", str(i) * 100) for i in range(10)]
+        contentcache.set_budget(3 * len(files[0].bytes) + 3 * 40)
+        contentcache.clear_cache()
+        for file in files:
+            file.bytes
+        info = contentcache.cache_info()
+        self.assertLessEqual(info.currsize, info.budget)
+        self.assertEqual(3, info.entries)
+        files[-1].bytes
+        self.assertEqual(1, contentcache.cache_info().hits)
+        files[0].bytes
+        self.assertEqual(1, contentcache.cache_info().hits)
+
+    def test_disabled(self):
+        contentcache.set_budget(0)
+        self.assertEqual("content", self.test_file.text)
+        self.assertEqual("content", self.test_file.text)
+        self.assertEqual((0, 0), contentcache.cache_info()[:2])
+
+    def test_invalidate(self):
+        self.assertEqual("content", self.test_file.text)
+        contentcache.invalidate(self.test_file)
+        self.assertEqual(0, contentcache.cache_info().entries)
+
+    def test_encoding(self):
+        umlaut = self._settled("umlaut.txt", "")
+        umlaut.write_bytes("ä".encode("utf-8"))
+        os.utime(umlaut, (time.time() - 10,) * 2)
+        self.assertEqual("ä", contentcache.read_text(umlaut, encoding="utf-8"))
+        self.assertEqual(
+            "Ã¤", contentcache.read_text(umlaut, encoding="latin-1", errors="strict")
+        )
@@ -0,0 +1,213 @@
+import errno
+import functools
+import os
+import shutil
+import unittest
+from unittest import mock
+
+from mutapath import Path, PathException, fileops
+from tests.helper import PathTest
+
+
+class TestFileOps(PathTest):
+    def __init__(self, *args):
+        self.test_path = "fileops_test"
+        super().__init__(*args)
+
+    def setUp(self):
+        self.test_base = Path.getcwd() / self.test_path
+        self.test_base.rmtree_p()
+        self.test_base.mkdir()
+        self.content = os.urandom(100_000)
+        self.test_file = self.test_base / "a.bin"
+        self.test_file.write_bytes(self.content)
+        os.utime(self.test_file, (1_000_000, 1_000_000))
+
+    def tearDown(self):
+        self._clean()
+
+    def test_copy(self):
+        target = self.test_base / "b.bin"
+        self.assertEqual(target, fileops.copy(self.test_file, target))
+        self.assertEqual(self.content, target.read_bytes())
+        self.assertEqual(1_000_000, target.stat().st_mtime)
+
+    def test_copy_into_directory(self):
+        folder = self.test_base / "folder"
+        folder.mkdir()
+        copied = fileops.copy(self.test_file, folder)
+        self.assertEqual(folder / "a.bin", copied)
+        self.assertEqual(self.content, (folder / "a.bin").read_bytes())
+
+    def test_copy_empty(self):
+        empty = self.test_base / "empty.bin"
+        empty.touch()
+        target = fileops.copyfile(empty, self.test_base / "b.bin")
+        self.assertEqual(b"", Path(target).read_bytes())
+
+    def test_progress(self):
+        reports = []
+        target = self.test_base / "b.bin"
+        with mock.patch.object(fileops, "CHUNK_SIZE", 30_000):
+            fileops.copyfile(
+                self.test_file, target, lambda *report: reports.append(report)
+            )
+        self.assertEqual(
+            [30_000, 60_000, 90_000, 100_000], [copied for copied, _, _ in reports]
+        )
+        self.assertTrue(all(total == 100_000 for _, total, _ in reports))
+        self.assertTrue(all(rate > 0 for _, _, rate in reports))
+
+    @unittest.skipUnless(
+        hasattr(os, "copy_file_range") and hasattr(os, "sendfile"),
+        "requires copy_file_range and sendfile",
+    )
+    def test_fallback(self):
+        unsupported = OSError(errno.EXDEV, "Invalid cross-device link")
+        target = self.test_base / "b.bin"
+        with mock.patch.object(fileops, "CHUNK_SIZE", 30_000):
+            with mock.patch.object(os, "copy_file_range", side_effect=unsupported):
+                fileops.copyfile(self.test_file, target)
+                self.assertEqual(self.content, target.read_bytes())
+                with mock.patch.object(os, "sendfile", side_effect=unsupported):
+                    target.remove()
+                    fileops.copyfile(self.test_file, target)
+                    self.assertEqual(self.content, target.read_bytes())
+
+    @unittest.skipUnless(hasattr(os, "copy_file_range"), "requires copy_file_range")
+    def test_fallback_continues(self):
+        copy_file_range = os.copy_file_range
+        calls = []
+
+        def failing(*args):
+            calls.append(args)
+            if len(calls) > 1:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            return copy_file_range(*args)
+
+        target = self.test_base / "b.bin"
+        with mock.patch.object(fileops, "CHUNK_SIZE", 30_000):
+            with mock.patch.object(os, "copy_file_range", side_effect=failing):
+                fileops.copyfile(self.test_file, target)
+        self.assertEqual(self.content, target.read_bytes())
+
+    def test_errors(self):
+        with self.assertRaises(shutil.SameFileError):
+            fileops.copyfile(self.test_file, self.test_file)
+        with self.assertRaises(FileNotFoundError):
+            fileops.copyfile(self.test_base / "missing.bin", self.test_base / "b.bin")
+
+    @unittest.skipUnless(hasattr(os, "copy_file_range"), "requires copy_file_range")
+    def test_no_fallback(self):
+        no_space = OSError(errno.ENOSPC, "No space left on device")
+        with mock.patch.object(os, "copy_file_range", side_effect=no_space):
+            with self.assertRaises(OSError):
+                fileops.copyfile(self.test_file, self.test_base / "b.bin")
+
+    def test_copying(self):
+        copied = self.test_file.clone(self.test_file)
+        with copied.copying(method=fileops.copy) as mut:
+            mut.stem = "b"
+        self.assertEqual(self.test_base / "b.bin", copied)
+        self.assertEqual(self.content, copied.read_bytes())
+        self.assertTrue(self.test_file.exists())
+
+    def test_moving(self):
+        reports = []
+        moved = self.test_file.clone(self.test_file)
+        method = functools.partial(fileops.move, progress=reports.append)
+        with moved.moving(method=method) as mut:
+            mut.stem = "b"
+        self.assertEqual(self.test_base / "b.bin", moved)
+        self.assertEqual(self.content, moved.read_bytes())
+        self.assertFalse(self.test_file.exists())
+
+    def test_moving_across_devices(self):
+        target = self.test_base / "b.bin"
+        with mock.patch.object(
+            os, "rename", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")
+        ):
+            fileops.move(self.test_file, target)
+        self.assertEqual(self.content, target.read_bytes())
+        self.assertEqual(1_000_000, target.stat().st_mtime)
+        self.assertFalse(self.test_file.exists())
+
+    def test_rename_noreplace(self):
+        target = self.test_base / "b.bin"
+        target.touch()
+        with self.assertRaises(FileExistsError):
+            fileops.rename_noreplace(self.test_file, target)
+        target.remove()
+        self.assertEqual(target, fileops.rename_noreplace(self.test_file, target))
+        self.assertEqual(self.content, target.read_bytes())
+        self.assertFalse(self.test_file.exists())
+
+    def test_rename_noreplace_fallback(self):
+        target = self.test_base / "b.bin"
+        folder = self.test_base / "folder"
+        folder.mkdir()
+        with mock.patch.object(fileops, "_rename_exclusive", return_value=False):
+            fileops.rename_noreplace(self.test_file, target)
+            self.assertEqual(self.content, target.read_bytes())
+            self.assertFalse(self.test_file.exists())
+            with self.assertRaises(FileExistsError):
+                fileops.rename_noreplace(folder, target)
+            fileops.rename_noreplace(folder, self.test_base / "other")
+            self.assertTrue((self.test_base / "other").isdir())
+
+    def test_writing(self):
+        os.chmod(self.test_file, 0o640)
+        with self.test_file.writing() as stream:
+            stream.write(b"new")
+            self.assertEqual(self.content, self.test_file.read_bytes())
+            self.assertTrue(self.test_file.lock.is_locked)
+        self.assertEqual(b"new", self.test_file.read_bytes())
+        self.assertEqual(0o640, self.test_file.stat().st_mode & 0o777)
+        self.assertEqual(["a.bin"], [p.name for p in self.test_base.listdir()])
+
+        created = self.test_base / "b.txt"
+        with created.writing("w", fsync=False, encoding="utf-8") as stream:
+            stream.write("ä")
+        self.assertEqual("ä", created.read_text(encoding="utf-8"))
+
+    def test_writing_failure(self):
+        with self.assertRaises(RuntimeError):
+            with self.test_file.writing() as stream:
+                stream.write(b"new")
+                raise RuntimeError()
+        self.assertEqual(self.content, self.test_file.read_bytes())
+        self.assertEqual(["a.bin"], [p.name for p in self.test_base.listdir()])
+        with self.assertRaises(ValueError):
+            with self.test_file.writing("a"):
+                pass
+
+    def test_writing_lock(self):
+        other = self.test_file.clone(self.test_file)
+        with other.lock:
+            with self.assertRaises(PathException):
+                with self.test_file.writing(timeout=0.1):
+                    pass
+        with self.test_file.writing(lock=False) as stream:
+            stream.write(b"new")
+        self.assertEqual(b"new", self.test_file.read_bytes())
+
+    def test_fsync_batch(self):
+        files = [self.test_base / f"{i}.txt" for i in range(3)]
+        with fileops.FsyncBatch() as batch:
+            for i, file in enumerate(files):
+                with file.writing("w", fsync=batch) as stream:
+                    stream.write(str(i))
+            self.assertEqual(3, len(batch))
+            self.assertFalse(any(file.exists() for file in files))
+            self.assertTrue(all(Path(file + ".lock").exists() for file in files))
+        self.assertEqual(["0", "1", "2"], [file.read_text() for file in files])
+        self.assertFalse(any(Path(file + ".lock").exists() for file in files))
+        self.assertEqual(0, len(batch))
+
+        with self.assertRaises(RuntimeError):
+            with fileops.FsyncBatch() as batch:
+                with self.test_file.writing(fsync=batch) as stream:
+                    stream.write(b"new")
+                raise RuntimeError()
+        self.assertEqual(self.content, self.test_file.read_bytes())
+        self.assertEqual(4, len(self.test_base.listdir()))
@@ -0,0 +1,93 @@
+import pickle
+import warnings
+
+from mutapath import FrozenPath, Path, MutaPath
+from tests.helper import PathTest
+
+
+class TestFrozenPath(PathTest):
+    def test_hash_without_warning(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            actual = hash(FrozenPath("/A/B/"))
+        self.assertEqual(hash(FrozenPath("/A/B")), actual)
+
+    def test_equal_to_path(self):
+        self.assertEqual(Path("/A/B", posix=True), FrozenPath("/A/B/"))
+        self.assertEqual(FrozenPath("/A/B"), Path("/A/B/", posix=True))
+        self.assertEqual(FrozenPath("/A/B"), MutaPath("/A/B", posix=True))
+        self.assertEqual(FrozenPath("/A/B"), "/A/B")
+        self.assertNotEqual(FrozenPath("/A/B"), FrozenPath("/A/C"))
+
+    def test_equal_regardless_of_posix(self):
+        posix, native = FrozenPath("/A/B", posix=True), FrozenPath("\\A\\B")
+        self.assertEqual(posix, native)
+        self.assertEqual(native, posix)
+        self.assertEqual(hash(posix), hash(native))
+        self.assertEqual(1, len({posix, native}))
+        self.assertEqual(native, Path("/A/B", posix=True))
+        self.assertEqual(Path("/A/B", posix=True), native)
+
+    def test_set_membership(self):
+        paths = {FrozenPath("/A/B"), FrozenPath("/A/C"), FrozenPath("/A/B/")}
+        self.assertEqual(2, len(paths))
+        self.assertIn(FrozenPath("/A/./B"), paths)
+
+    def test_set_membership_with_path(self):
+        with self.assertWarns(SyntaxWarning):
+            self.assertIn(Path("/A/B"), {FrozenPath("/A/B")})
+        with self.assertWarns(SyntaxWarning):
+            self.assertIn(FrozenPath("/A/B"), {Path("/A/B")})
+        with self.assertWarns(SyntaxWarning):
+            self.assertIn(Path("/A/B", posix=True), {FrozenPath("\\A\\B")})
+        for value in "\\A\\B", "C:\\A\\B":
+            frozen, unfrozen = FrozenPath(value), Path(value, posix=False)
+            with self.assertWarns(SyntaxWarning):
+                contained = unfrozen in {frozen}
+            self.assertEqual(unfrozen == frozen, contained)
+            self.assertEqual(frozen == unfrozen, contained)
+            self.assertEqual(MutaPath(value) == frozen, contained)
+            with self.assertWarns(SyntaxWarning):
+                self.assertEqual(contained, frozen in {unfrozen})
+
+    def test_path_hash_like_str(self):
+        with self.assertWarns(SyntaxWarning):
+            self.assertIn("a\\b", {Path("a\\b", posix=False): 1})
+
+    def test_derived_paths_are_frozen(self):
+        some = FrozenPath("/A/B/C.txt", posix=True)
+        for derived in (
+            some.parent,
+            some.name,
+            some.with_suffix(".csv"),
+            some / "D",
+            some.joinpath("D", "E"),
+            some.with_name("D.txt"),
+            some.with_stem("D"),
+            some.with_parent("/E"),
+            some.with_base("/E", 1),
+        ):
+            self.assertIsInstance(derived, FrozenPath)
+            self.assertTrue(derived.posix_enabled)
+            hash(derived)
+        self.assertIsInstance(FrozenPath.joinpath("/A", "B"), FrozenPath)
+
+    def test_frozen(self):
+        some = FrozenPath("/A/B")
+        with self.assertRaises(AttributeError):
+            some.name = "C"
+        with self.assertRaises(AttributeError):
+            some.posix_enabled = True
+        with self.assertRaises(AttributeError):
+            with some.mutate():
+                pass
+        with self.assertRaises(AttributeError):
+            with some.renaming():
+                pass
+        self.assertEqual(FrozenPath("/A/B"), some)
+
+    def test_pickle(self):
+        expected = FrozenPath("/A/B")
+        actual = pickle.loads(pickle.dumps(expected))
+        self.assertEqual(expected, actual)
+        self.assertEqual(hash(expected), hash(actual))
@@ -0,0 +1,116 @@
+import os
+import pathlib
+from types import GeneratorType
+
+from mutapath import Path, globbing
+from tests.helper import PathTest
+
+
+class TestGlobbing(PathTest):
+    def __init__(self, *args):
+        self.test_path = "globbing_test"
+        super().__init__(*args)
+
+    def setUp(self):
+        self.test_base = Path.getcwd() / self.test_path
+        self.test_base.rmtree_p()
+        for directory in "A/B/C", "A/.hidden", "D":
+            (self.test_base / directory).makedirs()
+        for name in (
+            "a.txt",
+            "b.py",
+            "A/c.txt",
+            "A/B/d.py",
+            "A/B/C/e.txt",
+            "A/.hidden/f.txt",
+            "D/g.py",
+        ):
+            (self.test_base / name).touch()
+
+    def tearDown(self):
+        self._clean()
+
+    def assertLikePathlib(self, pattern: str):
+        expected = sorted(str(p) for p in self.test_base.to_pathlib.glob(pattern))
+        actual = sorted(str(p) for p in self.test_base.glob(pattern))
+        self.assertEqual(expected, actual, pattern)
+
+    def test_like_pathlib(self):
+        for pattern in (
+            "*",
+            "*.txt",
+            "?.py",
+            "[ab].*",
+            "A/*",
+            "*/*.py",
+            "**/*.txt",
+            "**/B/*",
+            "A/**/*.py",
+            "A/B/C/e.txt",
+            "A/missing",
+            "**/.hidden/*",
+        ):
+            self.assertLikePathlib(pattern)
+
+    def test_recursive_dirs(self):
+        actual = sorted(
+            str(p.relpath(self.test_base)) for p in self.test_base.glob("A/**")
+        )
+        self.assertEqual(["A", "A/.hidden", "A/B", "A/B/C"], actual)
+
+    def test_trailing_separator(self):
+        # pathlib matches files for a trailing separator as well before Python 3.11
+        actual = sorted(
+            str(p.relpath(self.test_base)) for p in self.test_base.glob("*/")
+        )
+        self.assertEqual(["A", "D"], actual)
+
+    def test_types(self):
+        actual = self.test_base.glob("**/*.py")
+        self.assertIsInstance(actual, GeneratorType)
+        actual = list(actual)
+        self.assertEqual(3, len(actual))
+        self.typed_instance_test(*actual)
+        posix = Path(self.test_base, posix=True, string_repr=True).glob("*.py")
+        self.assertTrue(next(posix).posix_enabled)
+
+    def test_multiple_patterns(self):
+        actual = sorted(
+            p.name for p in self.test_base.glob("**/*.py", "*.txt", "**/d.py")
+        )
+        self.assertEqual(["a.txt", "b.py", "d.py", "g.py"], sorted(actual))
+
+    def test_exclude(self):
+        actual = sorted(
+            str(p.relpath(self.test_base))
+            for p in self.test_base.glob("**/*.txt", exclude=["A/B", "**/.*"])
+        )
+        self.assertEqual(["A/c.txt", "a.txt"], actual)
+
+    def test_rglob(self):
+        expected = sorted(str(p) for p in self.test_base.to_pathlib.rglob("*.py"))
+        self.assertEqual(expected, sorted(str(p) for p in self.test_base.rglob("*.py")))
+
+    def test_relative(self):
+        cwd = Path.getcwd()
+        try:
+            os.chdir(self.test_base)
+            self.assertEqual(["D/g.py"], list(Path("D").glob("*.py")))
+            self.assertEqual(["b.py"], list(Path("").glob("*.py")))
+            self.assertEqual(
+                sorted(str(p) for p in pathlib.Path().glob("**/*.py")),
+                sorted(str(p) for p in Path().glob("**/*.py")),
+            )
+        finally:
+            os.chdir(cwd)
+
+    def test_compile_cache(self):
+        self.assertIs(
+            globbing.compile_pattern("**/*.py"), globbing.compile_pattern("**/*.py")
+        )
+        compiled = globbing.compile_pattern("A/**/**/*.py/")
+        self.assertEqual(3, len(compiled.segments))
+        self.assertTrue(compiled.dirs_only)
+        for invalid in "", "/A", ".":
+            with self.assertRaises(ValueError):
+                globbing.compile_pattern(invalid)
@@ -1,9 +1,11 @@
 import os
 import pathlib
+import unittest
 
 import path
 
-from mutapath import Path, MutaPath, PathDefaults
+from mutapath import Path, MutaPath, PathDefaults, sorted_paths
+from mutapath.immutapath import SerializableType
 from tests.helper import PathTest
 
 
@@ -315,6 +317,22 @@ class TestPath(PathTest):
         actual = sorted([third, first, second])
         self.assertEqual(expected, actual)
 
+    def test_sort_key(self):
+        self.assertEqual(("/", "A", "B"), Path("/A/B/").sort_key())
+        some = Path("/A/B")
+        self.assertIs(some.sort_key(), some.sort_key())
+
+    def test_sorted_paths(self):
+        first = Path("/A/B/C")
+        second = "/A/C"
+        third = Path("/B/A/A")
+        self.assertEqual([first, second, third], sorted_paths([third, first, second]))
+        self.assertEqual(
+            [third, second, first], sorted_paths([second, first, third], reverse=True)
+        )
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(first, "_cached_components")
+
     def test_lt_gt_le_ge_str(self):
         path = Path("/A/B/")
         greater = "/A/C"
@@ -359,3 +377,107 @@ class TestPath(PathTest):
     def test_cwd(self):
         start = Path("/A/B/")
         self.assertEqual(start.cwd, Path.getcwd())
+
+    def test_derived_keeps_flags(self):
+        start = Path("/A/B/C/file.txt", posix=True, string_repr=True)
+        for actual in start.parent.parent, start.base, start.dirname, start.name:
+            self.typed_instance_test(actual)
+            self.assertTrue(actual.posix_enabled)
+            self.assertTrue(actual.string_repr_enabled)
+        self.assertEqual(Path("/A/B"), start.parent.parent)
+        self.assertEqual(Path("B"), start.parent.parent.name)
+        self.assertEqual(Path(""), Path("/").name)
+
+    def test_splitall_normalized(self):
+        expected = [Path("/"), "A", "B"]
+        actual = Path("/A/B", posix=True).splitall()
+        self.assertEqual(expected, actual)
+        self.assertTrue(actual[0].posix_enabled)
+
+    @unittest.skipIf(
+        SerializableType is not object, "mashumaro types have an instance dict"
+    )
+    def test_slotted(self):
+        some = Path("/A/B")
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(some, "__dict__")
+        with self.assertRaises(AttributeError):
+            some.unknown = True
+        self.assertIsNone(some._extras)
+
+    def test_mutable_attributes(self):
+        some = MutaPath("/A/B")
+        some.unknown = True
+        self.assertTrue(some.unknown)
+        self.assertIsNone(some._extras)
+
+    def test_extras_side_table(self):
+        some = Path("A/B")
+        with self.assertWarns(SyntaxWarning):
+            expected = hash(some)
+        self.assertEqual(expected, some._cached_hash)
+        self.assertEqual(("", "A", "B"), some.sort_key())
+        self.assertIsNone(some._extras)
+        lock = some.lock
+        self.assertEqual({"lock": lock}, some._extras)
+
+    def test_pickle(self):
+        import pickle
+
+        expected = Path("/A/B", posix=True, string_repr=True)
+        actual = pickle.loads(pickle.dumps(expected))
+        self.assertEqual(expected, actual)
+        self.assertTrue(actual.posix_enabled)
+        self.assertTrue(actual.string_repr_enabled)
+        self.typed_instance_test(actual)
+
+    def test_lazy_wrapping(self):
+        self.assertIn("walkfiles", dir(Path))
+        self.assertTrue(callable(Path.walkfiles))
+        self.assertTrue(callable(Path.__dict__["walkfiles"]))
+        self.assertIs(type, type(Path))
+        self.assertEqual(Path("/A/B").home, Path("A"))
+        self.assertIsInstance(Path.__dict__["home"], property)
+
+    def test_deferred_imports(self):
+        import subprocess
+        import sys
+
+        for module in "filelock", "asyncio", "concurrent.futures":
+            code = f"import sys, mutapath; print({module!r} in sys.modules)"
+            result = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            )
+            self.assertEqual("False", result.stdout.strip(), module)
+
+    def test_defaults_scope(self):
+        with PathDefaults.scope(posix=True, string_repr=True):
+            self.assertTrue(Path("/A/B").posix_enabled)
+            self.assertTrue(Path("/A/B").string_repr_enabled)
+            self.assertFalse(Path("/A/B", posix=False).posix_enabled)
+        self.assertFalse(Path("/A/B").posix_enabled)
+        self.assertFalse(Path("/A/B").string_repr_enabled)
+        with self.assertRaisesRegex(ValueError, "unknown"):
+            with PathDefaults.scope(unknown=True):
+                pass
+        self.assertFalse(Path("/A/B").posix_enabled)
+
+    def test_defaults_bind(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with PathDefaults.scope(posix=True):
+                unbound = executor.submit(Path, "/A/B").result()
+                bound = executor.submit(PathDefaults.bind(Path), "/A/B").result()
+        self.assertFalse(unbound.posix_enabled)
+        self.assertTrue(bound.posix_enabled)
+
+    def test_defaults_asyncio(self):
+        import asyncio
+
+        async def create():
+            return Path("/A/B")
+
+        with PathDefaults.scope(posix=True):
+            actual = asyncio.run(create())
+        self.assertTrue(actual.posix_enabled)
@@ -0,0 +1,314 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+
+import filelock
+
+from mutapath import Path, PathDefaults, PathException, batch_move, locking
+from tests.helper import PathTest
+
+
+@unittest.skipIf(os.name == "nt", "requires flock")
+class TestLocking(PathTest):
+    def __init__(self, *args):
+        self.test_path = "locking_test"
+        super().__init__(*args)
+
+    def setUp(self):
+        self.test_base = Path.getcwd() / self.test_path
+        self.test_base.rmtree_p()
+        self.test_base.mkdir()
+        self.test_file = self.test_base / "a.txt"
+        self.test_file.write_text("content")
+        self.lock_file = str(self.test_file) + ".lock"
+
+    def tearDown(self):
+        self._clean()
+
+    @contextmanager
+    def _kernel(self):
+        PathDefaults().lock_backend = locking.KERNEL
+        try:
+            yield
+        finally:
+            PathDefaults().lock_backend = locking.SOFT
+
+    def _in_thread(self, func):
+        result = []
+
+        def run():
+            try:
+                result.append(func())
+            except BaseException as e:
+                result.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        if isinstance(result[0], BaseException):
+            raise result[0]
+        return result[0]
+
+    def test_reentrant(self):
+        lock = locking.FlockFileLock(self.lock_file)
+        with lock:
+            with lock:
+                self.assertEqual(2, lock.lock_counter)
+            self.assertTrue(lock.is_locked)
+        self.assertFalse(lock.is_locked)
+        self.assertFalse(os.path.exists(self.lock_file))
+        self.assertFalse(locking.is_held(self.lock_file, locking.KERNEL))
+
+    def test_exclusive(self):
+        lock = locking.FlockFileLock(self.lock_file)
+        other = locking.FlockFileLock(self.lock_file)
+        lock.acquire()
+        self.assertTrue(locking.is_held(self.lock_file, locking.KERNEL))
+        with self.assertRaises(filelock.Timeout):
+            other.acquire(timeout=0)
+        with self.assertRaises(filelock.Timeout):
+            self._in_thread(lambda: lock.acquire(timeout=0.1))
+
+        def wait():
+            with other.acquire(timeout=5):
+                return other.is_locked
+
+        waiter = threading.Thread(target=lambda: acquired.append(wait()))
+        acquired = []
+        waiter.start()
+        time.sleep(0.1)
+        lock.release()
+        waiter.join()
+        self.assertEqual([True], acquired)
+
+    def test_timeouts_leave_nothing_behind(self):
+        lock = locking.FlockFileLock(self.lock_file)
+        other = locking.FlockFileLock(self.lock_file)
+        lock.acquire()
+        threads, fds = threading.active_count(), len(os.listdir("/dev/fd"))
+        for _ in range(5):
+            with self.assertRaises(filelock.Timeout):
+                other.acquire(timeout=0.02)
+        self.assertEqual(threads, threading.active_count())
+        self.assertEqual(fds, len(os.listdir("/dev/fd")))
+        lock.release()
+        other.acquire(timeout=1)
+        self.assertTrue(other.is_locked)
+        other.release()
+        lock.acquire(timeout=1)
+        lock.release()
+
+    def test_released_on_process_death(self):
+        code = (
+            "import os, sys\n"
+            "from mutapath.locking import FlockFileLock\n"
+            "FlockFileLock(sys.argv[1]).acquire()\n"
+            "os._exit(0)\n"
+        )
+        subprocess.run([sys.executable, "-c", code, self.lock_file], check=True)
+        self.assertTrue(os.path.exists(self.lock_file))
+        self.assertFalse(locking.is_held(self.lock_file, locking.KERNEL))
+        locking.FlockFileLock(self.lock_file).acquire(timeout=0).release()
+
+    def test_backend(self):
+        self.assertIsInstance(self.test_file.lock, filelock.SoftFileLock)
+        with self._kernel():
+            kernel = self.test_file.clone(self.test_file)
+            self.assertIsInstance(kernel.lock, locking.FlockFileLock)
+            self.assertIn("'kernel'", repr(PathDefaults()))
+            self.assertEqual(locking.KERNEL, locking.get_backend())
+            PathDefaults().reset()
+            self.assertEqual(locking.KERNEL, PathDefaults().lock_backend)
+            PathDefaults.reset_lock_backend()
+            self.assertEqual(locking.SOFT, PathDefaults().lock_backend)
+        with self.assertRaises(ValueError):
+            PathDefaults().lock_backend = "unknown"
+        with self.assertRaisesRegex(ValueError, "whole process"):
+            with PathDefaults.scope(lock_backend=locking.KERNEL):
+                pass
+
+    def test_backend_across_threads(self):
+        with self._kernel():
+            with self.test_file.lock:
+                other = self._in_thread(
+                    lambda: self.test_file.clone(self.test_file).lock
+                )
+                self.assertIsInstance(other, locking.FlockFileLock)
+                with self.assertRaises(filelock.Timeout):
+                    self._in_thread(lambda: other.acquire(timeout=0))
+            self._in_thread(lambda: other.acquire(timeout=0).release())
+            self.assertFalse(os.path.exists(self.lock_file))
+
+    def test_kernel_operations(self):
+        with self._kernel():
+            target = self.test_base / "b.txt"
+            held = locking.FlockFileLock(str(target) + ".lock")
+            renamed = self.test_file.clone(self.test_file)
+            with held:
+                with self.assertRaises(PathException):
+                    with renamed.renaming(timeout=0.1) as mut:
+                        mut.name = target.name
+                with self.assertRaises(PathException):
+                    batch_move({str(self.test_file): target})
+            with renamed.renaming(timeout=0.1) as mut:
+                mut.name = target.name
+            self.assertEqual(target, renamed)
+            self.assertFalse(renamed.lock.is_locked)
+
+            with target.writing("w") as stream:
+                stream.write("new")
+                self.assertTrue(locking.is_held(str(target) + ".lock"))
+            self.assertEqual("new", target.read_text())
+
+    def test_renaming_waits_for_target(self):
+        with self._kernel():
+            target = self.test_base / "b.txt"
+            held = locking.FlockFileLock(str(target) + ".lock")
+            acquired = threading.Event()
+
+            def hold():
+                with held:
+                    acquired.set()
+                    time.sleep(0.2)
+
+            holder = threading.Thread(target=hold)
+            holder.start()
+            acquired.wait(5)
+            renamed = self.test_file.clone(self.test_file)
+            with renamed.renaming(timeout=5) as mut:
+                mut.name = target.name
+            holder.join()
+            self.assertEqual(target, renamed)
+
+    def test_renaming_creates_no_target_lock(self):
+        with self._kernel():
+            target = self.test_base / "b.txt"
+            renamed = self.test_file.clone(self.test_file)
+            with renamed.renaming() as mut:
+                mut.name = target.name
+            self.assertEqual(target, renamed)
+            self.assertFalse(os.path.exists(str(target) + ".lock"))
+
+    def test_operations_leave_no_lock_files(self):
+        with self._kernel():
+            path = self.test_file.clone(self.test_file)
+            with path.copying() as mut:
+                mut.name = "copy.txt"
+            with path.moving() as mut:
+                mut.name = "moved.txt"
+            with path.renaming() as mut:
+                mut.name = "renamed.txt"
+            with path.read_lock:
+                pass
+            self.assertEqual(
+                ["a.txt", "renamed.txt"],
+                sorted(str(p.name) for p in self.test_base.listdir()),
+            )
+
+    def test_shared_release_keeps_lock_file_of_others(self):
+        reader = locking.FlockFileLock(self.lock_file, shared=True)
+        acquired, done = threading.Event(), threading.Event()
+
+        def other():
+            reader.acquire(timeout=0)
+            acquired.set()
+            done.wait(5)
+            reader.release()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        acquired.wait(5)
+        reader.acquire(timeout=0).release()
+        self.assertTrue(os.path.exists(self.lock_file))
+        done.set()
+        thread.join()
+        self.assertFalse(os.path.exists(self.lock_file))
+
+    def test_shared(self):
+        reader = locking.FlockFileLock(self.lock_file, shared=True)
+        writer = locking.FlockFileLock(self.lock_file)
+        with reader:
+            self._in_thread(lambda: reader.acquire(timeout=0).release())
+            self.assertFalse(locking.is_held(self.lock_file, locking.KERNEL))
+            with self.assertRaises(filelock.Timeout):
+                self._in_thread(lambda: writer.acquire(timeout=0.05))
+        with writer:
+            with self.assertRaises(filelock.Timeout):
+                self._in_thread(lambda: reader.acquire(timeout=0.05))
+            with reader.acquire(timeout=0):
+                self.assertTrue(writer.is_locked)
+            self.assertTrue(locking.is_held(self.lock_file, locking.KERNEL))
+
+    def test_acquire_without_creating(self):
+        reader = locking.FlockFileLock(self.lock_file, shared=True)
+        with self.assertRaises(FileNotFoundError):
+            reader.acquire(timeout=0, create=False)
+        self.assertFalse(reader.is_locked)
+        self.assertFalse(os.path.exists(self.lock_file))
+        open(self.lock_file, "w").close()
+        reader.acquire(timeout=0, create=False).release()
+
+    def test_shared_across_processes(self):
+        code = (
+            "import sys\n"
+            "from mutapath.locking import FlockFileLock\n"
+            "FlockFileLock(sys.argv[1], shared=True).acquire(timeout=0)\n"
+        )
+        with locking.FlockFileLock(self.lock_file, shared=True):
+            subprocess.run([sys.executable, "-c", code, self.lock_file], check=True)
+        with locking.FlockFileLock(self.lock_file):
+            with self.assertRaises(subprocess.CalledProcessError):
+                subprocess.run(
+                    [sys.executable, "-c", code, self.lock_file],
+                    check=True,
+                    stderr=subprocess.DEVNULL,
+                )
+
+    def test_read_lock(self):
+        self.assertIsInstance(self.test_file.read_lock, filelock.SoftFileLock)
+        self.assertIs(self.test_file.lock, self.test_file.write_lock)
+        with self._kernel():
+            path = self.test_file.clone(self.test_file)
+            self.assertTrue(path.read_lock.shared)
+            self.assertFalse(path.write_lock.shared)
+            self.assertEqual(path.lock.lock_file, path.read_lock.lock_file)
+
+            self.assertFalse(os.path.exists(self.lock_file))
+            self.assertEqual("content", path.text)
+            self.assertEqual(b"content", path.bytes)
+            self.assertFalse(os.path.exists(self.lock_file))
+            with path.lock:
+                self.assertEqual("content", path.text)
+            with path.read_lock:
+                self.assertEqual(b"content", path.bytes)
+                with path.copying() as mut:
+                    mut.name = "copy.txt"
+            self.assertEqual("content", (self.test_base / "copy.txt").read_text())
+
+    def test_reading_waits_for_writer(self):
+        def copy():
+            with path.copying(timeout=0.05) as mut:
+                mut.name = "copy.txt"
+
+        with self._kernel():
+            path = self.test_file.clone(self.test_file)
+            writer = path.clone(path)
+            self.assertTrue(path.read_lock.shared)
+            with writer.lock:
+                with PathDefaults.scope(read_timeout=0.05):
+                    with self.assertRaises(PathException):
+                        self._in_thread(PathDefaults.bind(lambda: path.text))
+                with self.assertRaises(PathException):
+                    self._in_thread(copy)
+
+                read = []
+                reader = threading.Thread(target=lambda: read.append(path.text))
+                reader.start()
+                time.sleep(0.1)
+                self.assertEqual([], read)
+            reader.join()
+            self.assertEqual(["content"], read)
@@ -179,3 +179,10 @@ class TestMutaPath(PathTest):
         expected = hash(Path("/A/B"))
         actual = hash(MutaPath("/A/B/"))
         self.assertEqual(expected, actual)
+
+    def test_sort_key_after_mutation(self):
+        actual = MutaPath("/A/B")
+        self.assertEqual(("/", "A", "B"), actual.sort_key())
+        actual.name = "C"
+        self.assertEqual(("/", "A", "C"), actual.sort_key())
+        self.assertLess(Path("/A/B"), actual)
@@ -0,0 +1,70 @@
+import unittest
+
+from mutapath import Path, normalization
+
+
+class TestNormalizationCache(unittest.TestCase):
+    def setUp(self):
+        normalization.enable_cache(maxsize=8)
+
+    def tearDown(self):
+        normalization.disable_cache()
+
+    def test_disabled_by_default(self):
+        normalization.disable_cache()
+        self.assertFalse(normalization.cache_enabled())
+        self.assertIsNone(normalization.cache_info())
+        self.assertEqual(Path("/A/B/"), Path("/A/B"))
+
+    def test_hits_and_misses(self):
+        first = Path("/A/B/../C")
+        second = Path("/A/B/../C")
+        info = normalization.cache_info()
+        self.assertEqual(1, info.misses)
+        self.assertEqual(1, info.hits)
+        self.assertIs(first._contained, second._contained)
+
+    def test_posix_flag_is_part_of_key(self):
+        Path("/A/B", posix=True)
+        Path("/A/B", posix=False)
+        self.assertEqual(2, normalization.cache_info().misses)
+
+    def test_bounded(self):
+        for i in range(20):
+            Path(f"/A/{i}")
+        self.assertEqual(8, normalization.cache_info().currsize)
+
+    def test_clear(self):
+        Path("/A/B")
+        normalization.clear_cache()
+        info = normalization.cache_info()
+        self.assertEqual(0, info.currsize)
+        self.assertEqual(0, info.misses)
+
+    def test_cached_equals_uncached(self):
+        cached = Path("/A/./B//C/", posix=True)
+        normalization.disable_cache()
+        uncached = Path("/A/./B//C/", posix=True)
+        self.assertEqual(str(uncached), str(cached))
+
+
+class TestCanonical(unittest.TestCase):
+    def test_canonical(self):
+        self.assertEqual("/A/B", normalization.canonical("/A/./B/", False))
+        self.assertEqual("", normalization.canonical("", True))
+
+    def test_equality_operands(self):
+        import pathlib
+
+        import path
+
+        some = Path("/A/B")
+        for other in "/A/B/", path.Path("/A/./B"), pathlib.PurePosixPath("/A/B"):
+            self.assertEqual(some, other)
+            self.assertNotEqual(
+                some, other + "C" if isinstance(other, str) else other / "C"
+            )
+        self.assertEqual(some, Path("/A/B/", posix=True))
+        self.assertEqual(Path(""), "")
+        self.assertNotEqual(some, "")
+        self.assertNotEqual(some, 42)
@@ -0,0 +1,81 @@
+import unittest
+
+from mutapath import Path, PathArray
+
+
+class TestPathArray(unittest.TestCase):
+    def setUp(self):
+        self.raw = ["/A/B/test1.txt", "/A/C/test2.txt", "/A/C/../D/test3.txt"]
+        self.array = PathArray(self.raw)
+
+    def assertElementwise(self, expected, actual):
+        self.assertIsInstance(actual, PathArray)
+        self.assertEqual(len(expected), len(actual))
+        for e, a in zip(expected, actual):
+            self.assertEqual(e, a)
+            self.assertIsInstance(a, Path)
+
+    def test_normalized(self):
+        self.assertEqual(
+            ["/A/B/test1.txt", "/A/C/test2.txt", "/A/D/test3.txt"], self.array.strings
+        )
+
+    def test_getitem(self):
+        self.assertEqual(Path("/A/B/test1.txt"), self.array[0])
+        self.assertIsInstance(self.array[0], Path)
+        self.assertIsInstance(self.array[1:], PathArray)
+        self.assertEqual(2, len(self.array[1:]))
+
+    def test_flags(self):
+        array = PathArray(self.raw, posix=True, string_repr=True)
+        self.assertTrue(array[0].posix_enabled)
+        self.assertTrue(array.with_suffix(".csv")[0].string_repr_enabled)
+
+    def test_with_suffix(self):
+        expected = [Path(p).with_suffix(".csv") for p in self.raw]
+        self.assertElementwise(expected, self.array.with_suffix(".csv"))
+        with self.assertRaises(ValueError):
+            self.array.with_suffix("csv")
+
+    def test_with_base(self):
+        expected = [Path(p).with_base("/E/F") for p in self.raw]
+        self.assertElementwise(expected, self.array.with_base("/E/F"))
+        expected = [Path(p).with_base("/E", strip_length=1) for p in self.raw]
+        self.assertElementwise(expected, self.array.with_base("/E", strip_length=1))
+
+    def test_with_base_fail(self):
+        with self.assertRaises(ValueError):
+            self.array.with_base("/A/B/C/D")
+
+    def test_with_parent(self):
+        expected = [Path(p).with_parent("/E") for p in self.raw]
+        self.assertElementwise(expected, self.array.with_parent("/E"))
+
+    def test_with_name_and_stem(self):
+        self.assertElementwise(
+            [Path(p).with_name("other") for p in self.raw],
+            self.array.with_name("other"),
+        )
+        self.assertElementwise(
+            [Path(p).with_stem("other") for p in self.raw],
+            self.array.with_stem("other"),
+        )
+
+    def test_relpath(self):
+        expected = [Path(p).relpath("/A") for p in self.raw]
+        self.assertElementwise(expected, self.array.relpath("/A"))
+
+    def test_components(self):
+        self.assertEqual([Path(p).stem for p in self.raw], self.array.stem)
+        self.assertEqual([Path(p).suffix for p in self.raw], self.array.suffix)
+        self.assertElementwise([Path(p).name for p in self.raw], self.array.name)
+        self.assertElementwise([Path(p).parent for p in self.raw], self.array.parent)
+
+    def test_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        exported = self.array.to_numpy()
+        self.assertIsInstance(exported, numpy.ndarray)
+        self.assertEqual(self.array, PathArray.from_numpy(exported))
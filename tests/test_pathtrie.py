@@ -0,0 +1,84 @@
+import unittest
+
+from mutapath import Path, PathTrie
+
+
+class TestPathTrie(unittest.TestCase):
+    def setUp(self):
+        self.index = PathTrie(
+            ["/A/B/a.txt", "/A/B/C/b.txt", "/A/D/c.txt", "/A/B/../D/d.txt"]
+        )
+
+    def test_insert(self):
+        self.assertEqual(4, len(self.index))
+        self.assertFalse(self.index.insert("/A/D/./c.txt"))
+        self.assertTrue(self.index.insert(Path("/A")))
+        self.assertEqual(5, len(self.index))
+
+    def test_contains(self):
+        self.assertIn("/A/D/d.txt", self.index)
+        self.assertIn(Path("/A/B/a.txt"), self.index)
+        self.assertNotIn("/A/B", self.index)
+        self.assertNotIn("/X", self.index)
+
+    def test_iter(self):
+        expected = ["/A/B/a.txt", "/A/B/C/b.txt", "/A/D/c.txt", "/A/D/d.txt"]
+        self.assertEqual(expected, list(self.index))
+        for p in self.index:
+            self.assertIsInstance(p, Path)
+
+    def test_remove(self):
+        self.index.remove("/A/B/C/b.txt")
+        self.assertEqual(3, len(self.index))
+        self.assertNotIn("/A/B/C/b.txt", self.index)
+        self.assertIsNone(self.index._find(["/", "A", "B", "C"]))
+        with self.assertRaises(KeyError):
+            self.index.remove("/A/B/C/b.txt")
+        with self.assertRaises(KeyError):
+            self.index.remove("/A/B")
+        self.index.discard("/A/B")
+        self.assertEqual(3, len(self.index))
+
+    def test_subtree(self):
+        self.assertEqual(
+            ["/A/B/a.txt", "/A/B/C/b.txt"], list(self.index.subtree("/A/B/"))
+        )
+        self.assertEqual([], list(self.index.subtree("/X")))
+        self.index.insert("/A/B")
+        self.assertEqual(3, len(list(self.index.subtree("/A/B"))))
+        self.assertEqual(2, len(list(self.index.subtree("/A/B", include_prefix=False))))
+
+    def test_longest_prefix(self):
+        self.index.insert("/A")
+        self.index.insert("/A/B/C")
+        self.assertEqual(Path("/A/B/C"), self.index.longest_prefix("/A/B/C/E/f.txt"))
+        self.assertEqual(Path("/A"), self.index.longest_prefix("/A/B"))
+        self.assertIsNone(self.index.longest_prefix("/X/Y"))
+
+    def test_rebase(self):
+        self.assertEqual(2, self.index.rebase("/A/B", "/E"))
+        self.assertEqual(4, len(self.index))
+        self.assertEqual(
+            ["/A/D/c.txt", "/A/D/d.txt", "/E/a.txt", "/E/C/b.txt"], list(self.index)
+        )
+        self.assertEqual(0, self.index.rebase("/X", "/Y"))
+
+    def test_rebase_merge(self):
+        self.index.insert("/E/a.txt")
+        self.index.insert("/E/e.txt")
+        self.assertEqual(2, self.index.rebase("/A/B", "/E"))
+        self.assertEqual(
+            ["/A/D/c.txt", "/A/D/d.txt", "/E/a.txt", "/E/e.txt", "/E/C/b.txt"],
+            list(self.index),
+        )
+        self.assertEqual(5, len(self.index))
+
+    def test_relative(self):
+        index = PathTrie(["A/B", "A/C", "D"])
+        self.assertEqual(["A/B", "A/C", "D"], list(index))
+        self.assertEqual(["A/B", "A/C"], list(index.subtree("A")))
+
+    def test_posix(self):
+        index = PathTrie(["A\\B", "A\\C"], posix=True)
+        self.assertEqual(["A/B", "A/C"], list(index.subtree("A")))
+        self.assertTrue(next(iter(index)).posix_enabled)
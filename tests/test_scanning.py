@@ -0,0 +1,142 @@
+import os
+from types import GeneratorType
+
+from mutapath import Path
+from tests.helper import PathTest
+
+
+class TestScanning(PathTest):
+    def __init__(self, *args):
+        self.test_path = "scanning_test"
+        super().__init__(*args)
+
+    def setUp(self):
+        self.test_base = Path.getcwd() / self.test_path
+        self.test_base.rmtree_p()
+        (self.test_base / "A" / "B").makedirs()
+        (self.test_base / "C").mkdir()
+        for name in "a.txt", "A/b.txt", "A/B/c.txt", "C/d.txt":
+            (self.test_base / name).write_text(name)
+
+    def tearDown(self):
+        self._clean()
+
+    def test_scan(self):
+        children = list(self.test_base.scan())
+        self.assertEqual(
+            sorted(os.listdir(self.test_base)), sorted(c.name for c in children)
+        )
+        for child in children:
+            self.typed_instance_test(child)
+            self.assertIsNone(child._extras)
+            self.assertEqual(child.name == "a.txt", child.isfile())
+            self.assertEqual(child.name != "a.txt", child.isdir())
+
+    def test_walk_like_path(self):
+        expected = list(self.test_base._contained.walk())
+        actual = self.test_base.walk()
+        self.assertIsInstance(actual, GeneratorType)
+        self.assertEqual(expected, list(actual))
+        self.assertEqual(
+            list(self.test_base._contained.walkfiles("*.txt")),
+            list(self.test_base.walkfiles("*.txt")),
+        )
+        self.assertEqual(
+            list(self.test_base._contained.walkdirs()), list(self.test_base.walkdirs())
+        )
+
+    def test_scan_recursive(self):
+        self.assertEqual(
+            sorted(self.test_base.walk()), sorted(self.test_base.scan(recursive=True))
+        )
+
+    def test_prune(self):
+        actual = [
+            str(p.relpath(self.test_base))
+            for p in self.test_base.walk(prune=lambda d: d.name == "A")
+        ]
+        self.assertEqual(["A", "C", "C/d.txt", "a.txt"], sorted(actual))
+
+    def test_listing(self):
+        self.assertEqual(["a.txt"], [p.name for p in self.test_base.files()])
+        self.assertEqual(["A", "C"], sorted(p.name for p in self.test_base.dirs()))
+        self.assertEqual(["a.txt"], [p.name for p in self.test_base.listdir("*.txt")])
+
+    def test_cached_stat(self):
+        file = next(p for p in self.test_base.scan() if p.name == "a.txt")
+        self.assertEqual(5, file.size)
+        self.assertEqual(os.stat(file).st_mtime, file.mtime)
+        self.assertEqual(file.stat(), file.lstat())
+        self.assertFalse(file.islink())
+        self.assertTrue(file.is_file())
+
+    def test_fresh_after_change(self):
+        file = next(iter(self.test_base.files()))
+        self.assertEqual(5, file.size)
+        file.write_text("rewritten")
+        self.assertEqual(9, file.size)
+        file.remove()
+        self.assertFalse(file.isfile())
+        self.assertFalse(file.exists())
+        directory = next(iter(self.test_base.walkdirs()))
+        directory.rmtree()
+        self.assertFalse(directory.isdir())
+
+    def test_errors(self):
+        missing = self.test_base / "missing"
+        with self.assertRaises(FileNotFoundError):
+            list(missing.walk())
+        self.assertEqual([], list(missing.walk(errors="ignore")))
+
+    def test_relative(self):
+        cwd = Path.getcwd()
+        try:
+            os.chdir(self.test_base)
+            self.assertEqual(["C/d.txt"], list(Path("C").walkfiles()))
+            self.assertIn("a.txt", Path("").listdir())
+            self.assertIn("a.txt", Path(".").listdir())
+        finally:
+            os.chdir(cwd)
+
+    def test_walk_parallel(self):
+        expected = list(self.test_base.walk())
+        for workers in 1, 3:
+            self.assertEqual(
+                expected, list(self.test_base.walk_parallel(workers, ordered=True))
+            )
+            self.assertEqual(
+                sorted(expected), sorted(self.test_base.walk_parallel(workers))
+            )
+
+    def test_walk_parallel_parents_first(self):
+        seen = set()
+        for p in self.test_base.walk_parallel(max_queue=1):
+            parent = str(p.parent)
+            if parent != str(self.test_base):
+                self.assertIn(parent, seen)
+            seen.add(str(p))
+        self.assertEqual(7, len(seen))
+
+    def test_walk_parallel_options(self):
+        for ordered in True, False:
+            actual = sorted(
+                str(p.relpath(self.test_base))
+                for p in self.test_base.walk_parallel(
+                    ordered=ordered, match="*.txt", prune=lambda d: d.name == "B"
+                )
+            )
+            self.assertEqual(["A/b.txt", "C/d.txt", "a.txt"], actual)
+
+    def test_walk_parallel_errors(self):
+        missing = self.test_base / "missing"
+        for ordered in True, False:
+            with self.assertRaises(FileNotFoundError):
+                list(missing.walk_parallel(ordered=ordered))
+            self.assertEqual(
+                [], list(missing.walk_parallel(ordered=ordered, errors="ignore"))
+            )
+
+    def test_walk_parallel_close(self):
+        walker = self.test_base.walk_parallel(max_queue=1)
+        next(walker)
+        walker.close()
@@ -0,0 +1,152 @@
+import os
+import time
+from unittest import mock
+
+from mutapath import MutaPath, Path, statcache
+from tests.helper import PathTest
+
+
+class TestStatCache(PathTest):
+    def __init__(self, *args):
+        self.test_path = "statcache_test"
+        super().__init__(*args)
+
+    def setUp(self):
+        self.test_base = Path.getcwd() / self.test_path
+        self.test_base.rmtree_p()
+        self.test_base.mkdir()
+        self.test_file = self.test_base / "a.txt"
+        self.test_file.write_text("content")
+        statcache.enable_cache(maxsize=16, ttl=60)
+
+    def tearDown(self):
+        statcache.disable_cache()
+        self._clean()
+
+    def test_disabled_by_default(self):
+        statcache.disable_cache()
+        self.assertFalse(statcache.cache_enabled())
+        self.assertIsNone(statcache.cache_info())
+        self.assertTrue(self.test_file.exists())
+        os.remove(self.test_file)
+        self.assertFalse(self.test_file.exists())
+
+    def test_hits(self):
+        self.assertTrue(self.test_file.exists())
+        self.assertTrue(self.test_file.isfile())
+        self.assertFalse(self.test_file.isdir())
+        self.assertEqual(7, self.test_file.size)
+        info = statcache.cache_info()
+        self.assertEqual((3, 1), (info.hits, info.misses))
+        self.assertEqual(0.75, info.hit_ratio)
+
+    def test_stale_until_invalidated(self):
+        self.assertTrue(self.test_file.exists())
+        os.remove(self.test_file)
+        self.assertTrue(self.test_file.exists())
+        statcache.invalidate(self.test_file)
+        self.assertFalse(self.test_file.exists())
+
+    def test_missing(self):
+        missing = self.test_base / "missing.txt"
+        self.assertFalse(missing.exists())
+        self.assertFalse(missing.isfile())
+        with self.assertRaises(FileNotFoundError):
+            missing.stat()
+        self.assertEqual(2, statcache.cache_info().hits)
+
+    def test_original_error(self):
+        inside = self.test_file / "b.txt"
+        for _ in range(2):
+            with self.assertRaises(NotADirectoryError):
+                inside.stat()
+        self.assertFalse(inside.exists())
+        self.assertEqual(2, statcache.cache_info().hits)
+
+    def test_invalidated_during_stat(self):
+        original = os.stat
+        for invalidated in self.test_file, self.test_base:
+
+            def changing(*args, **kwargs):
+                result = original(*args, **kwargs)
+                os.remove(self.test_file)
+                statcache.invalidate(invalidated, subtree=True)
+                return result
+
+            self.test_file.write_text("content")
+            with mock.patch.object(statcache.os, "stat", side_effect=changing):
+                self.assertTrue(self.test_file.exists())
+            self.assertFalse(self.test_file.exists())
+
+    def test_ttl(self):
+        statcache.enable_cache(ttl=0.01)
+        self.assertTrue(self.test_file.exists())
+        os.remove(self.test_file)
+        time.sleep(0.02)
+        self.assertFalse(self.test_file.exists())
+
+    def test_maxsize(self):
+        for i in range(20):
+            (self.test_base / f"{i}.txt").exists()
+        self.assertEqual(16, statcache.cache_info().currsize)
+        statcache.clear_cache()
+        info = statcache.cache_info()
+        self.assertEqual((0, 0, 0), (info.hits, info.misses, info.currsize))
+
+    def test_normalized_key(self):
+        self.assertTrue(self.test_file.exists())
+        self.assertTrue(Path(self.test_base / "." / "a.txt").exists())
+        self.assertEqual(1, statcache.cache_info().hits)
+
+    def test_relative_key(self):
+        cwd = os.getcwd()
+        os.chdir(self.test_base)
+        try:
+            relative = Path("a.txt")
+            self.assertTrue(relative.exists())
+            self.assertTrue(self.test_file.exists())
+            self.assertEqual(1, statcache.cache_info().hits)
+            self.test_file.remove_p()
+            self.assertFalse(relative.exists())
+        finally:
+            os.chdir(cwd)
+
+    def test_invalidated_by_wrapped_members(self):
+        self.assertTrue(self.test_file.exists())
+        self.test_file.remove_p()
+        self.assertFalse(self.test_file.exists())
+        self.test_file.write_text("again")
+        self.assertEqual(5, self.test_file.size)
+
+    def test_invalidated_subtree(self):
+        folder = self.test_base / "folder"
+        folder.mkdir()
+        child = folder / "b.txt"
+        child.touch()
+        self.assertTrue(child.exists())
+        folder.rmtree()
+        self.assertFalse(child.exists())
+
+    def test_invalidated_by_renaming(self):
+        target = self.test_base / "b.txt"
+        self.assertFalse(target.exists())
+        self.assertTrue(self.test_file.exists())
+        with self.test_file.renaming() as mut:
+            mut.name = "b.txt"
+        self.assertTrue(target.exists())
+        self.assertFalse((self.test_base / "a.txt").exists())
+
+    def test_invalidated_by_mutable_path(self):
+        target = self.test_base / "b.txt"
+        self.assertFalse(target.exists())
+        mutable = MutaPath(self.test_file)
+        self.assertTrue(mutable.exists())
+        mutable.rename(target)
+        self.assertTrue(target.exists())
+        self.assertFalse(self.test_file.exists())
+
+    def test_invalidated_by_copy(self):
+        target = self.test_base / "b.txt"
+        self.assertFalse(target.exists())
+        self.test_file.copy(target)
+        self.assertTrue(target.exists())
@@ -1,4 +1,5 @@
 import os
+import threading
 import time
 from types import GeneratorType
 from typing import List
@@ -32,6 +33,52 @@ class TestWithPath(PathTest):
         self.typed_instance_test(actual_list[0])
         self.assertIsInstance(actual, GeneratorType)
 
+    @file_test(equal=False)
+    def test_wrapped_scalar(self, test_file: Path):
+        """Verify that members returning scalars are not converted"""
+        self.assertIs(True, test_file.exists())
+        self.assertIs(True, test_file.is_file())
+        self.assertIsInstance(test_file.stat(), os.stat_result)
+        self.assertEqual(0, test_file.size)
+
+    @file_test(equal=False)
+    def test_wrapped_path(self, test_file: Path):
+        """Verify that members returning paths are converted, keeping the flags"""
+        actual = test_file.relpath(self.test_base)
+        self.assertEqual(Path(test_file.name), actual)
+        self.typed_instance_test(actual, test_file.absolute())
+        self.assertEqual(test_file.posix_enabled, actual.posix_enabled)
+
+    def test_classified_members(self):
+        """Verify that every classified member is wrapped from path.Path or pathlib.Path and not overridden"""
+        from mutapath import decorator
+
+        wrappable = decorator.wrappable_names()
+        for name in decorator.classified_names():
+            with self.subTest(name=name):
+                self.assertIn(name, wrappable)
+                member = getattr(Path, name)
+                member = getattr(member, "fget", member)
+                self.assertNotRegex(member.__module__, "^mutapath")
+
+    def test_classified_kinds(self):
+        """Verify the classified kinds against the values returned by the raw members"""
+        import path
+        from mutapath import decorator
+
+        raw = path.Path("/A/B/c.txt")
+        expected = {
+            decorator.SCALAR: bool,
+            decorator.PATH: path.Path,
+            decorator.LIST: list,
+        }
+        for name in "isabs", "abspath", "expand", "normpath", "stripext", "splitall":
+            with self.subTest(name=name):
+                kind = decorator.classify(name)
+                self.assertIsInstance(getattr(raw, name)(), expected[kind])
+        self.assertEqual(decorator.ITERATOR, decorator.classify("parents"))
+        self.assertEqual(decorator.DYNAMIC, decorator.classify("exists"))
+
     @file_test(equal=False)
     def test_glob(self, test_file: Path):
         """Verify that glob is returning the correct types"""
@@ -176,6 +223,19 @@ class TestWithPath(PathTest):
                     mut.name = target.name
         return expected
 
+    @file_test(equal=False)
+    def test_renaming_target_lock_released(self, test_file: Path):
+        """Try renaming to a path whose lock is released within the timeout"""
+        expected = test_file.with_name("target.txt")
+        target_lock = Path(expected + ".lock").touch()
+        timer = threading.Timer(0.2, target_lock.remove)
+        timer.start()
+        with test_file.renaming(timeout=5) as mut:
+            mut.name = expected.name
+        timer.join()
+        self.assertEqual(expected, test_file)
+        self.assertFalse(target_lock.exists())
+
     @file_test()
     def test_lock_changes_with_mutation(self, test_file: Path):
         """Assure that the lock changes after the path has been mutated"""
@@ -203,6 +263,15 @@ class TestWithPath(PathTest):
         self.assertEqual(expected.read_text(), test_file.read_text())
         return expected
 
+    @file_test(equal=False)
+    def test_copying_while_locked(self, test_file: Path):
+        """Try copying a file while holding its lock"""
+        expected = test_file.with_name("new.file")
+        with test_file.lock:
+            with test_file.copying(timeout=0.1) as mut:
+                mut.stem = "new"
+        self.assertEqual(expected, test_file)
+
     @file_test(equal=False, instance=False, exists=False)
     def test_moving(self, test_file: Path):
         """Try moving a file without issues"""
@@ -229,8 +298,8 @@ class TestWithPath(PathTest):
             w.write("test2")
         updated = test_file.text
         updated2 = test_file.read_text()
-        self.assertEqual(expected, updated)
-        self.assertNotEqual(expected, updated2)
+        self.assertEqual("test2", updated)
+        self.assertEqual("test2", updated2)
 
     @file_test(equal=False)
     def test_bytes(self, test_file: Path):
@@ -239,3 +308,64 @@ class TestWithPath(PathTest):
         expected = test_file.read_bytes()
         actual = test_file.bytes
         self.assertEqual(expected, actual)
+
+    @file_test(equal=False)
+    def test_mmap(self, test_file: Path):
+        test_file.write_bytes(b"test")
+        with test_file.mmap() as mapped:
+            self.assertEqual(b"es", mapped[1:3])
+            with self.assertRaises(TypeError):
+                mapped[0] = ord("b")
+        with test_file.mmap("r+") as mapped:
+            mapped[0] = ord("b")
+        self.assertEqual(b"best", test_file.bytes)
+        with test_file.mmap("c") as mapped:
+            mapped[0] = ord("t")
+            self.assertEqual(b"test", mapped[:])
+        self.assertEqual(b"best", test_file.read_bytes())
+
+    @file_test(equal=False)
+    def test_mmap_empty(self, test_file: Path):
+        with test_file.mmap() as mapped:
+            self.assertEqual(0, len(mapped))
+        with self.assertRaises(ValueError):
+            with test_file.mmap("w"):
+                pass
+
+    @file_test(equal=False)
+    def test_mmap_lock(self, test_file: Path):
+        test_file.write_bytes(b"test")
+        with test_file.mmap(lock=True) as mapped:
+            self.assertTrue(test_file.lock.is_locked)
+            self.assertEqual(b"test", mapped[:])
+        self.assertFalse(test_file.lock.is_locked)
+
+        other = test_file.clone(test_file)
+        with other.lock:
+            with self.assertRaises(PathException):
+                with test_file.mmap(lock=True, timeout=0.1):
+                    pass
+
+    @file_test(equal=False)
+    def test_iter_chunks(self, test_file: Path):
+        test_file.write_bytes(b"0123456789")
+        chunks = [bytes(chunk) for chunk in test_file.iter_chunks(4)]
+        self.assertEqual([b"0123", b"4567", b"89"], chunks)
+        chunks = [bytes(chunk) for chunk in test_file.iter_chunks(4, offset=5)]
+        self.assertEqual([b"5678", b"9"], chunks)
+        with self.assertRaises(ValueError):
+            next(test_file.iter_chunks(0))
+
+    @file_test(equal=False)
+    def test_iter_lines(self, test_file: Path):
+        test_file.write_text("first\nsecond\r\nthird")
+        self.assertEqual(test_file.lines(), list(test_file.iter_lines(4)))
+        self.assertEqual(
+            ["first", "second", "third"], list(test_file.iter_lines(retain=False))
+        )
+
+    @file_test(equal=False)
+    def test_checksum(self, test_file: Path):
+        test_file.write_bytes(b"0123456789" * 1000)
+        self.assertEqual(test_file.read_hexhash("sha256"), test_file.checksum())
+        self.assertEqual(test_file.read_hexhash("md5"), test_file.checksum("md5", 7))